@@ -0,0 +1,290 @@
+"""
+In-process caches of the rows nearly every command and EventSub handler starts with: the
+channel, its clans, its active season, its active sessions and the chatting players.
+
+Entries expire after a short TTL so changes made outside the bot are still picked up, and the
+commands that write these rows (registerchannel, registerdiscordserver, createclan, startseason,
+endseason, setdate, the session and roster commands and their Discord counterparts) update or
+invalidate them straight away.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Type, Union
+
+from tortoise.models import Model
+
+from app.models import Channel, Clan, ClanSpoilsSession, Player, Season
+
+CHANNEL_TTL = 300.0
+CLAN_TTL = 300.0
+SEASON_TTL = 30.0
+SESSION_TTL = 60.0
+PLAYER_TTL = 300.0
+PLAYER_CACHE_SIZE = 5000
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    A dict whose entries expire after `ttl` seconds. None is cached like any other value, so
+    lookups for rows that do not exist are cached as well.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return _MISSING
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+
+_channels_by_name = TTLCache(CHANNEL_TTL)
+_channels_by_discord_id = TTLCache(CHANNEL_TTL)
+_clans = TTLCache(CLAN_TTL)
+_active_seasons = TTLCache(SEASON_TTL)
+
+
+def _channel_id(channel: Union[Channel, int]) -> int:
+    return channel if isinstance(channel, int) else channel.id
+
+
+def _ttl_until(end: Optional[datetime], ttl: float) -> float:
+    """
+    Caps a TTL so an entry expires no later than `end`.
+    """
+    if end is None:
+        return ttl
+    return max(min(ttl, (end - datetime.now(end.tzinfo)).total_seconds()), 0.0)
+
+
+async def cached_channel(name: str) -> Optional[Channel]:
+    """
+    Returns the channel with this Twitch channel name, or None if it is not registered.
+    """
+    channel = _channels_by_name.get(name)
+    if channel is _MISSING:
+        channel = await Channel.get_or_none(name=name)
+        _channels_by_name.set(name, channel)
+    return channel
+
+
+async def cached_channel_by_discord_id(discord_server_id: Union[int, str]) -> Optional[Channel]:
+    """
+    Returns the channel registered for this Discord server, or None.
+    """
+    key = str(discord_server_id)
+    channel = _channels_by_discord_id.get(key)
+    if channel is _MISSING:
+        channel = await Channel.get_or_none(discord_server_id=key)
+        _channels_by_discord_id.set(key, channel)
+    return channel
+
+
+def invalidate_channels() -> None:
+    _channels_by_name.invalidate()
+    _channels_by_discord_id.invalidate()
+
+
+async def cached_clans(channel: Union[Channel, int]) -> List[Clan]:
+    """
+    Returns the clans of a channel.
+    """
+    channel_id = _channel_id(channel)
+    clans = _clans.get(channel_id)
+    if clans is _MISSING:
+        clans = await Clan.filter(channel_id=channel_id).order_by("id")
+        _clans.set(channel_id, clans)
+    return list(clans)
+
+
+async def cached_clan(channel: Union[Channel, int], tag: str) -> Optional[Clan]:
+    """
+    Returns the clan of a channel with this tag, or None.
+    """
+    return next((clan for clan in await cached_clans(channel) if clan.tag == tag), None)
+
+
+def invalidate_clans(channel: Union[Channel, int]) -> None:
+    _clans.invalidate(_channel_id(channel))
+
+
+async def cached_active_season(channel: Union[Channel, int]) -> Optional[Season]:
+    """
+    Returns the active season of a channel, or None. A cached season is never returned after
+    its end date.
+    """
+    channel_id = _channel_id(channel)
+    season = _active_seasons.get(channel_id)
+    if season is _MISSING:
+        season = await Season.active_seasons.filter(channel_id=channel_id).first()
+        end_date = season.end_date if season is not None else None
+        _active_seasons.set(channel_id, season, _ttl_until(end_date, SEASON_TTL))
+    return season
+
+
+def invalidate_active_season(channel: Union[Channel, int]) -> None:
+    _active_seasons.invalidate(_channel_id(channel))
+
+
+class SessionStateRegistry:
+    """
+    Knows the active Session, RaidSession, SentrySession and SpoilsSession of each channel and
+    the active ClanSpoilsSession of each clan, so the chat commands do not query the active
+    session managers on every message.
+
+    An entry expires at the session's end time without a query, open-ended sessions and "no
+    active session" are re-checked after `ttl` seconds. The commands that start or end
+    sessions report them through started() and ended().
+    """
+
+    def __init__(self, ttl: float = SESSION_TTL):
+        self._sessions = TTLCache(ttl)
+
+    @staticmethod
+    def _key(
+        model: Type[Model], channel: Union[Channel, int], clan: Union[Clan, int, None] = None
+    ) -> Tuple[Type[Model], int, Optional[int]]:
+        clan_id = clan if clan is None or isinstance(clan, int) else clan.id
+        return model, _channel_id(channel), clan_id
+
+    async def active(
+        self, model: Type[Model], channel: Union[Channel, int], clan: Union[Clan, int, None] = None
+    ) -> Optional[Model]:
+        """
+        Returns the active session of this kind for a channel (and clan, for ClanSpoilsSession),
+        or None.
+        """
+        key = self._key(model, channel, clan)
+        session = self._sessions.get(key)
+        if session is _MISSING:
+            manager = model.active_sessions if model is ClanSpoilsSession else model.active_session
+            filters = {"channel_id": key[1]}
+            if key[2] is not None:
+                filters["clan_id"] = key[2]
+            session = await manager.filter(**filters).first()
+            self._set(key, session)
+        return session
+
+    def started(self, session: Model) -> None:
+        """
+        Registers a session that was just created.
+        """
+        clan_id = session.clan_id if isinstance(session, ClanSpoilsSession) else None
+        self._set(self._key(type(session), session.channel_id, clan_id), session)
+
+    def ended(
+        self, model: Type[Model], channel: Union[Channel, int], clan: Union[Clan, int, None] = None
+    ) -> None:
+        """
+        Records that the active session of this kind was ended.
+        """
+        self._set(self._key(model, channel, clan), None)
+
+    def _set(self, key: Hashable, session: Optional[Model]) -> None:
+        end_time = session.end_time if session is not None else None
+        self._sessions.set(key, session, _ttl_until(end_time, self._sessions.ttl))
+
+
+session_state = SessionStateRegistry()
+
+
+@dataclass(slots=True)
+class CachedPlayer:
+    """
+    The part of a player and its clan the chat commands need, without the ORM instance.
+    """
+
+    id: int
+    name: str
+    nickname: Optional[str]
+    enabled: bool
+    clan_id: Optional[int]
+    clan_name: Optional[str]
+    clan_tag: Optional[str]
+    clan_emoji: Optional[str]
+
+    def is_enabled(self) -> bool:
+        return self.enabled
+
+
+class PlayerCache:
+    """
+    A bounded LRU of players keyed by (channel id, lowercased name), loaded lazily with their
+    clan in a single query. Unknown names are cached as None, so the roster commands and
+    player creation must call invalidate().
+    """
+
+    def __init__(self, max_entries: int = PLAYER_CACHE_SIZE, ttl: float = PLAYER_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[int, str], Tuple[float, Optional[CachedPlayer]]]" = (
+            OrderedDict()
+        )
+
+    async def get(self, channel: Union[Channel, int], name: str) -> Optional[CachedPlayer]:
+        key = (_channel_id(channel), name.lower())
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        row = (
+            await Player.filter(channel_id=key[0], name=key[1])
+            .first()
+            .values(
+                "id",
+                "name",
+                "nickname",
+                "enabled",
+                "clan_id",
+                "clan__name",
+                "clan__tag",
+                "clan__twitch_emoji_name",
+            )
+        )
+        player = None
+        if row is not None:
+            player = CachedPlayer(
+                id=row["id"],
+                name=row["name"],
+                nickname=row["nickname"],
+                enabled=row["enabled"],
+                clan_id=row["clan_id"],
+                clan_name=row["clan__name"],
+                clan_tag=row["clan__tag"],
+                clan_emoji=row["clan__twitch_emoji_name"],
+            )
+        self._entries[key] = (time.monotonic() + self.ttl, player)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return player
+
+    def invalidate(self, channel: Union[Channel, int], name: str) -> None:
+        self._entries.pop((_channel_id(channel), name.lower()), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+player_cache = PlayerCache()
@@ -1,3 +1,17 @@
+from .batching import BatchWriter
+from .cache import ResponseCache
 from .main_client import VanderheimAPIClient
+from .rate_limit import RateLimit, RateLimiter
+from .retry import NO_RETRY, RetryPolicy
+from .schemas import APIModel
 
-__all__ = ["VanderheimAPIClient"]
+__all__ = [
+    "VanderheimAPIClient",
+    "BatchWriter",
+    "RateLimit",
+    "RateLimiter",
+    "ResponseCache",
+    "RetryPolicy",
+    "NO_RETRY",
+    "APIModel",
+]
@@ -1,7 +1,18 @@
-from typing import Any, Dict
+import asyncio
+import copy
+import json
+import logging
+import math
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import urlparse
 
 import aiohttp
-import logging
+
+from app.clients.vanderheim.batching import BatchWriter, Create
+from app.clients.vanderheim.cache import CacheKey, ResponseCache
+from app.clients.vanderheim.rate_limit import RateLimiter
+from app.clients.vanderheim.retry import RetryPolicy
+from app.clients.vanderheim.schemas import to_models
 
 logging.basicConfig(level=logging.INFO)
 
@@ -9,55 +20,364 @@ logger = logging.getLogger(__name__)
 
 
 class BaseAPIClient:
-    def __init__(self, base_url: str, api_token: str):
+    def __init__(
+        self,
+        base_url: str,
+        api_token: str,
+        connection_limit: int = 100,
+        connection_limit_per_host: int = 20,
+        keepalive_timeout: float = 30.0,
+        dns_cache_ttl: int = 300,
+        request_timeout: float = 60.0,
+        page_concurrency: int = 8,
+        retry_policy: Optional[RetryPolicy] = None,
+        route_retry_policies: Optional[Dict[str, RetryPolicy]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_cache: Optional[ResponseCache] = None,
+        coalesce_requests: bool = True,
+        batch_size: int = 100,
+        write_concurrency: int = 8,
+        json_loads: Callable[[str], Any] = json.loads,
+        return_models: bool = False,
+        trace_configs: Optional[List[aiohttp.TraceConfig]] = None,
+    ):
         self.base_url = base_url
         self.headers = {
             "Authorization": f"Bearer {api_token}",
             "Content-Type": "application/json",
         }
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.request_timeout = request_timeout
+        self.page_concurrency = page_concurrency
+        self.retry_policy = retry_policy or RetryPolicy()
+        # Per-endpoint overrides keyed by route prefix, e.g. "/vanderheim-api/checkins/".
+        self.route_retry_policies = route_retry_policies or {}
+        self.rate_limiter = rate_limiter
+        self.response_cache = response_cache
+        self.coalesce_requests = coalesce_requests
+        self.json_loads = json_loads
+        self.return_models = return_models
+        # aiohttp request tracing hooks, e.g. to measure request latency.
+        self.trace_configs = trace_configs
+        # GETs currently on the wire, keyed like the response cache, shared by identical callers.
+        self._inflight: Dict[CacheKey, asyncio.Future] = {}
+        self.batch_size = batch_size
+        self.write_concurrency = write_concurrency
+        self._batch_writers: List[BatchWriter] = []
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "BaseAPIClient":
+        self._get_session()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Returns the shared session, creating it (and its connection pool) on first use.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                limit_per_host=self.connection_limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+                trace_configs=self.trace_configs,
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """
+        Flushes any buffered batch writes, then closes the shared session and releases all
+        pooled connections.
+        """
+        for writer in self._batch_writers:
+            await writer.flush()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def batch_writer(
+        self,
+        create: Create,
+        batch_size: Optional[int] = None,
+        flush_interval: float = 0.05,
+        concurrency: Optional[int] = None,
+    ) -> BatchWriter:
+        """
+        Returns a BatchWriter that buffers single calls of the given create method and sends
+        them in batches. Buffered writes are flushed when the client is closed.
+        """
+        writer = BatchWriter(
+            create,
+            batch_size or self.batch_size,
+            flush_interval,
+            concurrency or self.write_concurrency,
+        )
+        self._batch_writers.append(writer)
+        return writer
+
+    async def _fetch_all_pages(
+        self,
+        fetch_page: Callable[..., Awaitable[Dict[str, Any]]],
+        *args: Any,
+        page_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Fetches every page of a paginated list using the given page fetcher.
+
+        The first page is fetched on its own to learn the total count and the page size the
+        server actually uses, the remaining pages are then fetched concurrently (bounded by
+        page_concurrency) and their results are returned in page order. Rows added or deleted
+        during the crawl shift the pages, which is logged but not treated as an error.
+        """
+        first_page = await fetch_page(*args, page=1, page_size=page_size)
+        results = list(first_page["results"])
+        if not first_page["next"] or not results:
+            return {"results": results}
+
+        if first_page.get("count") is None:
+            # Without a total count we cannot know how many pages there are, so walk them.
+            page = 1
+            response = first_page
+            while response["next"]:
+                page += 1
+                response = await fetch_page(*args, page=page, page_size=page_size)
+                results.extend(response["results"])
+            return {"results": results}
+
+        # Servers may cap the page size below what was asked for, so go by what they returned.
+        total_pages = math.ceil(first_page["count"] / len(results))
+        semaphore = asyncio.Semaphore(self.page_concurrency)
+
+        async def fetch(page: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await fetch_page(*args, page=page, page_size=page_size)
+
+        pages = await asyncio.gather(*(fetch(page) for page in range(2, total_pages + 1)))
+        for response in pages:
+            results.extend(response.get("results", []))
+        if len(results) != first_page["count"]:
+            logger.warning(
+                f"Fetched {len(results)} records of a list of {first_page['count']}, "
+                "the list changed while it was being fetched"
+            )
+        return {"results": results}
+
+    async def _iter_pages(
+        self,
+        fetch_page: Callable[..., Awaitable[Dict[str, Any]]],
+        *args: Any,
+        page_size: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yields the records of a paginated list one page at a time.
+
+        Only the current page is held in memory; the next page is requested while the
+        caller works through the current one.
+        """
+        page = 1
+        next_page: Optional[asyncio.Task[Dict[str, Any]]] = asyncio.ensure_future(
+            fetch_page(*args, page=page, page_size=page_size)
+        )
+        try:
+            while next_page is not None:
+                response = await next_page
+                next_page = None
+                if response["next"]:
+                    page += 1
+                    next_page = asyncio.ensure_future(
+                        fetch_page(*args, page=page, page_size=page_size)
+                    )
+                for record in response["results"]:
+                    yield record
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    def _route(self, url: str) -> str:
+        """
+        Returns the path of a request URL relative to the API base URL.
+        """
+        if url.startswith(self.base_url):
+            return url[len(self.base_url) :]
+        return urlparse(url).path
+
+    def _retry_policy_for(self, url: str) -> RetryPolicy:
+        """
+        Returns the retry policy for the longest matching route prefix, or the default policy.
+        """
+        route = self._route(url)
+        matches = [prefix for prefix in self.route_retry_policies if route.startswith(prefix)]
+        if not matches:
+            return self.retry_policy
+        return self.route_retry_policies[max(matches, key=len)]
+
+    async def _request(
+        self, method: str, url: str, **kwargs: Any
+    ) -> Tuple[int, Any, Mapping[str, str]]:
+        """
+        Sends a request through the shared session, waiting on the rate limiter (if any) before
+        each attempt and retrying according to the route's policy.
+
+        Returns the response status, decoded JSON body (None for 204 and 304 responses) and
+        headers. Error statuses that are not retried raise aiohttp.ClientResponseError.
+        """
+        policy = self._retry_policy_for(url)
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                waited = await self.rate_limiter.acquire(self._route(url))
+                if waited:
+                    logger.debug(f"{method} {url} waited {waited:.2f}s for the rate limiter")
+            try:
+                async with self._get_session().request(method, url, **kwargs) as response:
+                    if policy.should_retry_status(method, response.status, attempt):
+                        delay = policy.backoff(attempt, response.headers.get("Retry-After"))
+                        logger.warning(
+                            f"{method} {url} returned {response.status}, retrying in {delay:.2f}s"
+                        )
+                    else:
+                        response.raise_for_status()
+                        if response.status in (204, 304):
+                            return response.status, None, response.headers
+                        return (
+                            response.status,
+                            await response.json(loads=self.json_loads),
+                            response.headers,
+                        )
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if not policy.should_retry_error(method, e, attempt):
+                    raise
+                delay = policy.backoff(attempt)
+                logger.warning(f"{method} {url} failed with {e!r}, retrying in {delay:.2f}s")
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _cached_get(
+        self, cache: ResponseCache, url: str, params: Optional[Dict[str, Any]]
+    ) -> Any:
+        """
+        Serves a GET from the response cache, revalidating stale entries with their ETag.
+
+        Callers get their own copy of the body, so changing it does not change the cache.
+        """
+        key = cache.key(self._route(url), params)
+        entry = cache.get(key)
+        if entry is not None and entry.is_fresh:
+            cache.hits += 1
+            return copy.deepcopy(entry.body)
+
+        headers = {"If-None-Match": entry.etag} if entry is not None and entry.etag else None
+        status, body, response_headers = await self._request(
+            "GET", url, params=params, headers=headers
+        )
+        if status == 304 and entry is not None:
+            cache.revalidations += 1
+            cache.refresh(key)
+            return copy.deepcopy(entry.body)
+
+        cache.misses += 1
+        cache.set(key, copy.deepcopy(body), response_headers.get("ETag"))
+        return body
+
+    def _invalidate(self, method: str, url: str) -> None:
+        """
+        Drops cached responses a write may have made stale: the collection that was written to
+        and everything nested below it.
+        """
+        if self.response_cache is None:
+            return
+        route = self._route(url)
+        if method != "POST":
+            # Writes to /resource/<id>/ also change the /resource/ listings.
+            route = route.rstrip("/").rsplit("/", 1)[0] + "/"
+        self.response_cache.invalidate(route)
+
+    def _to_models(self, url: str, body: Any) -> Any:
+        """
+        Converts a response body into typed models when return_models is enabled. This runs after
+        the cache and request coalescing, so those always hold the decoded dicts.
+        """
+        if not self.return_models:
+            return body
+        return to_models(self._route(url), body)
 
     async def _get(self, url: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        if not self.coalesce_requests:
+            return self._to_models(url, await self._send_get(url, params))
+
+        key = ResponseCache.key(url, params)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send_get(url, params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish_inflight(key, done))
+        # Shielded so a cancelled caller does not cancel the request for everyone else.
+        return self._to_models(url, await asyncio.shield(task))
+
+    def _finish_inflight(self, key: CacheKey, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved in case every caller was cancelled.
+            task.exception()
+
+    async def _send_get(self, url: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, headers=self.headers) as response:
-                    return await response.json()
+            if self.response_cache is not None:
+                return await self._cached_get(self.response_cache, url, params)
+            _, body, _ = await self._request("GET", url, params=params)
+            return body
         except aiohttp.ClientResponseError as e:
             logger.error(f"GET request failed with status {e.status} and message {e.message}")
             raise
 
-
-    async def _post(self, url: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _post(self, url: str, data: Dict[str, Any]) -> Any:
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=data, headers=self.headers) as response:
-                    return await response.json()
+            _, body, _ = await self._request("POST", url, json=data)
+            return self._to_models(url, body)
         except aiohttp.ClientResponseError as e:
             logger.error(f"POST request failed with status {e.status} and message {e.message}")
             raise
+        finally:
+            self._invalidate("POST", url)
 
-    async def _put(self, url: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _put(self, url: str, data: Dict[str, Any]) -> Any:
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.put(url, json=data, headers=self.headers) as response:
-                    return await response.json()
+            _, body, _ = await self._request("PUT", url, json=data)
+            return self._to_models(url, body)
         except aiohttp.ClientResponseError as e:
             logger.error(f"PUT request failed with status {e.status} and message {e.message}")
             raise
-        
-    async def _patch(self, url: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        finally:
+            self._invalidate("PUT", url)
+
+    async def _patch(self, url: str, data: Dict[str, Any]) -> Any:
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.patch(url, json=data, headers=self.headers) as response:
-                    return await response.json()
+            _, body, _ = await self._request("PATCH", url, json=data)
+            return self._to_models(url, body)
         except aiohttp.ClientResponseError as e:
             logger.error(f"PATCH request failed with status {e.status} and message {e.message}")
             raise
-    
+        finally:
+            self._invalidate("PATCH", url)
+
     async def _delete(self, url: str) -> bool:
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.delete(url, headers=self.headers) as response:
-                    return response.status == 204
+            status, _, _ = await self._request("DELETE", url)
+            return status == 204
         except aiohttp.ClientResponseError as e:
             logger.error(f"DELETE request failed with status {e.status} and message {e.message}")
             raise
+        finally:
+            self._invalidate("DELETE", url)
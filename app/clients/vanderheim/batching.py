@@ -0,0 +1,92 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+Create = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+class BatchWriter:
+    """
+    Buffers single creates and sends them together.
+
+    The Vanderheim API has no route that takes a list of records, so a batch is sent as one
+    POST per payload through the given create method, at most `concurrency` at a time across
+    all batches. A batch is flushed as soon as it holds batch_size payloads, or flush_interval
+    seconds after its first payload was submitted.
+
+    Each submit() call resolves to the record the API returned for that payload, or raises the
+    error its own request raised, so one failed create does not fail the rest of its batch.
+
+    Usage:
+        writer = client.batch_writer(client.checkins.create_checkin)
+        checkin = await writer.submit({"player": ..., "session": ...})
+    """
+
+    def __init__(
+        self,
+        create: Create,
+        batch_size: int = 100,
+        flush_interval: float = 0.05,
+        concurrency: int = 8,
+    ):
+        self.create = create
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: Set[asyncio.Future] = set()
+
+    async def submit(self, data: Dict[str, Any]) -> Any:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((data, future))
+        if len(self._pending) >= self.batch_size:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self.flush_interval, self._start_flush
+            )
+        return await future
+
+    async def submit_many(self, items: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Submits every item and returns the created records in the same order. Raises the first
+        error if any create failed.
+        """
+        return list(await asyncio.gather(*(self.submit(data) for data in items)))
+
+    def _start_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.ensure_future(self._write(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _write(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        async def send(data: Dict[str, Any], future: asyncio.Future) -> None:
+            try:
+                async with self._semaphore:
+                    record = await self.create(data)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+                return
+            if not future.done():
+                future.set_result(record)
+
+        await asyncio.gather(*(send(data, future) for data, future in batch))
+        logger.debug(f"Flushed a batch of {len(batch)} creates")
+
+    async def flush(self) -> None:
+        """
+        Sends everything that is buffered and waits for all outstanding batches.
+        """
+        self._start_flush()
+        if self._flushes:
+            await asyncio.gather(*self._flushes)
@@ -0,0 +1,91 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+@dataclass
+class CacheEntry:
+    body: Any
+    etag: Optional[str]
+    expires_at: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+
+class ResponseCache:
+    """
+    A size-bounded LRU cache of GET responses from the Vanderheim API.
+
+    Entries are keyed by route and query parameters. Each route prefix can have its own TTL
+    (a TTL of 0 disables caching for that prefix). Expired entries that carried an ETag are
+    kept so the next request can be revalidated with If-None-Match instead of re-downloaded.
+    """
+
+    def __init__(
+        self,
+        default_ttl: float = 30.0,
+        route_ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = 1024,
+    ):
+        self.default_ttl = default_ttl
+        self.route_ttls = route_ttls or {}
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+
+    @staticmethod
+    def key(route: str, params: Optional[Dict[str, Any]] = None) -> CacheKey:
+        return route, tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+
+    def ttl_for(self, route: str) -> float:
+        matches = [prefix for prefix in self.route_ttls if route.startswith(prefix)]
+        if not matches:
+            return self.default_ttl
+        return self.route_ttls[max(matches, key=len)]
+
+    def get(self, key: CacheKey) -> Optional[CacheEntry]:
+        """
+        Returns the entry for the key, fresh or stale-but-revalidatable, or None.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if not entry.is_fresh and entry.etag is None:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: CacheKey, body: Any, etag: Optional[str] = None) -> None:
+        ttl = self.ttl_for(key[0])
+        if ttl <= 0:
+            return
+        self._entries[key] = CacheEntry(body=body, etag=etag, expires_at=time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def refresh(self, key: CacheKey) -> None:
+        """
+        Marks a revalidated (304 Not Modified) entry as fresh again.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.expires_at = time.monotonic() + self.ttl_for(key[0])
+
+    def invalidate(self, route_prefix: str) -> None:
+        """
+        Drops every entry whose route starts with the given prefix.
+        """
+        for key in [key for key in self._entries if key[0].startswith(route_prefix)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,165 @@
+"""
+The Vanderheim API endpoints. Every endpoint class is generated from its resource declaration
+(see app.clients.vanderheim.resources): for a resource such as season it provides
+_fetch_seasons_page, fetch_all_seasons, iter_seasons, fetch_season, create_season,
+update_season, partial_update_season and delete_season, and the same set for each nested
+resource, e.g. fetch_season_sessions, fetch_season_session_checkin and
+create_season_session_checkin.
+"""
+
+from app.clients.vanderheim.resources import ResourceAPI, resource
+
+
+class CheckinsAPI(ResourceAPI):
+    resource = resource("checkin", label="check-in")
+
+
+class ClanSpoilsClaimsAPI(ResourceAPI):
+    resource = resource("clan_spoils_claim")
+
+
+class ClanSpoilsSessionsAPI(ResourceAPI):
+    resource = resource("clan_spoils_session")
+
+
+class ClansAPI(ResourceAPI):
+    resource = resource(
+        "clan",
+        children=(resource("player", label="clan player", list_method="fetch_all_clan_players"),),
+    )
+
+
+class FollowerGiveawayEntriesAPI(ResourceAPI):
+    resource = resource(
+        "follower_giveaway_entry",
+        plural="follower_giveaway_entries",
+        label_plural="follower giveaway entries",
+    )
+
+
+class FollowerGiveawayPrizesAPI(ResourceAPI):
+    resource = resource("follower_giveaway_prize")
+
+
+class FollowerGiveawaysAPI(ResourceAPI):
+    resource = resource("follower_giveaway")
+
+
+class GiftedSubscriptionsAPI(ResourceAPI):
+    resource = resource("gifted_subscription")
+
+
+class PlayerWatchTimesAPI(ResourceAPI):
+    resource = resource("player_watch_time")
+
+
+class PlayersAPI(ResourceAPI):
+    resource = resource(
+        "player",
+        children=(
+            resource("checkin", label="check-in"),
+            resource("clan_spoils_claim"),
+            resource("gifted_subscription"),
+            resource("player_watch_time", label="watch time"),
+            resource("point"),
+            resource("raid_checkin", label="raid check-in"),
+            resource("sentry_checkin", label="sentry check-in"),
+            resource("spoils_claim"),
+            resource("subscription"),
+        ),
+    )
+
+
+class PointsAPI(ResourceAPI):
+    resource = resource("point")
+
+
+class RaidCheckinsAPI(ResourceAPI):
+    resource = resource("raid_checkin", label="raid check-in")
+
+
+class RaidSessionsAPI(ResourceAPI):
+    resource = resource("raid_session")
+
+
+class SeasonsAPI(ResourceAPI):
+    resource = resource(
+        "season",
+        children=(
+            resource(
+                "clan_spoils_session",
+                children=(
+                    resource("claim", id_param="clan_spoils_claim_id", label="clan spoils claim"),
+                ),
+            ),
+            resource("point"),
+            resource(
+                "raid_session",
+                children=(resource("checkin", id_param="raid_checkin_id", label="raid check-in"),),
+            ),
+            resource(
+                "sentry_session",
+                children=(
+                    resource("checkin", id_param="sentry_checkin_id", label="sentry check-in"),
+                ),
+            ),
+            resource("session", children=(resource("checkin", label="check-in"),)),
+            resource(
+                "spoils_session",
+                children=(resource("claim", id_param="spoils_claim_id", label="spoils claim"),),
+            ),
+        ),
+    )
+
+
+class SentryCheckinsAPI(ResourceAPI):
+    resource = resource("sentry_checkin", label="sentry check-in")
+
+
+class SentrySessionsAPI(ResourceAPI):
+    resource = resource("sentry_session")
+
+
+class SessionsAPI(ResourceAPI):
+    resource = resource("session")
+
+
+class SpoilsClaimsAPI(ResourceAPI):
+    resource = resource("spoils_claim")
+
+
+class SpoilsSessionsAPI(ResourceAPI):
+    resource = resource("spoils_session")
+
+
+class SubscriptionsAPI(ResourceAPI):
+    resource = resource("subscription")
+
+
+class TwitchEventSubSubscriptionsAPI(ResourceAPI):
+    resource = resource("twitch_eventsub_subscription", label="Twitch EventSub subscription")
+
+
+__all__ = [
+    "CheckinsAPI",
+    "ClanSpoilsClaimsAPI",
+    "ClanSpoilsSessionsAPI",
+    "ClansAPI",
+    "FollowerGiveawayEntriesAPI",
+    "FollowerGiveawayPrizesAPI",
+    "FollowerGiveawaysAPI",
+    "GiftedSubscriptionsAPI",
+    "PlayerWatchTimesAPI",
+    "PlayersAPI",
+    "PointsAPI",
+    "RaidCheckinsAPI",
+    "RaidSessionsAPI",
+    "SeasonsAPI",
+    "SentryCheckinsAPI",
+    "SentrySessionsAPI",
+    "SessionsAPI",
+    "SpoilsClaimsAPI",
+    "SpoilsSessionsAPI",
+    "SubscriptionsAPI",
+    "TwitchEventSubSubscriptionsAPI",
+]
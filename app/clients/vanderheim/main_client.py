@@ -1,32 +1,53 @@
+from typing import Any, Optional
+
 from app.clients.vanderheim.base_client import BaseAPIClient
-from app.clients.vanderheim.endpoints.checkins import CheckinsAPI
-from app.clients.vanderheim.endpoints.clan_spoils_claims import ClanSpoilsClaimsAPI
-from app.clients.vanderheim.endpoints.clan_spoils_sessions import ClanSpoilsSessionsAPI
-from app.clients.vanderheim.endpoints.clans import ClansAPI
-from app.clients.vanderheim.endpoints.follower_giveaway_entries import FollowerGiveawayEntriesAPI
-from app.clients.vanderheim.endpoints.follower_giveaway_prizes import FollowerGiveawayPrizesAPI
-from app.clients.vanderheim.endpoints.follower_giveaways import FollowerGiveawaysAPI
-from app.clients.vanderheim.endpoints.gifted_subscriptions import GiftedSubscriptionsAPI
-from app.clients.vanderheim.endpoints.player_watch_times import PlayerWatchTimesAPI
-from app.clients.vanderheim.endpoints.players import PlayersAPI
-from app.clients.vanderheim.endpoints.points import PointsAPI
-from app.clients.vanderheim.endpoints.raid_checkins import RaidCheckinsAPI
-from app.clients.vanderheim.endpoints.raid_sessions import RaidSessionsAPI
-from app.clients.vanderheim.endpoints.seasons import SeasonsAPI
-from app.clients.vanderheim.endpoints.sentry_checkins import SentryCheckinsAPI
-from app.clients.vanderheim.endpoints.sentry_sessions import SentrySessionsAPI
-from app.clients.vanderheim.endpoints.sessions import SessionsAPI
-from app.clients.vanderheim.endpoints.spoils_claims import SpoilsClaimsAPI
-from app.clients.vanderheim.endpoints.spoils_sessions import SpoilsSessionsAPI
-from app.clients.vanderheim.endpoints.subscriptions import SubscriptionsAPI
-from app.clients.vanderheim.endpoints.twitch_eventsub_subscriptions import (
+from app.clients.vanderheim.batching import BatchWriter, Create
+from app.clients.vanderheim.endpoints import (
+    CheckinsAPI,
+    ClansAPI,
+    ClanSpoilsClaimsAPI,
+    ClanSpoilsSessionsAPI,
+    FollowerGiveawayEntriesAPI,
+    FollowerGiveawayPrizesAPI,
+    FollowerGiveawaysAPI,
+    GiftedSubscriptionsAPI,
+    PlayersAPI,
+    PlayerWatchTimesAPI,
+    PointsAPI,
+    RaidCheckinsAPI,
+    RaidSessionsAPI,
+    SeasonsAPI,
+    SentryCheckinsAPI,
+    SentrySessionsAPI,
+    SessionsAPI,
+    SpoilsClaimsAPI,
+    SpoilsSessionsAPI,
+    SubscriptionsAPI,
     TwitchEventSubSubscriptionsAPI,
 )
+from app.clients.vanderheim.schemas import fast_json_loads
 
 
 class VanderheimAPIClient:
-    def __init__(self, base_url: str, api_token: str):
-        self.base_client = BaseAPIClient(base_url, api_token)
+    def __init__(
+        self,
+        base_url: str,
+        api_token: str,
+        return_models: bool = False,
+        fast_json: bool = False,
+        **client_options: Any,
+    ):
+        """
+        Extra keyword arguments (connection limits, keep-alive, DNS cache TTL, timeout) are
+        passed through to the BaseAPIClient, whose pooled session is shared by every endpoint.
+
+        return_models makes endpoints return the typed models from schemas instead of dicts,
+        fast_json decodes responses with orjson when it is installed.
+        """
+        client_options["return_models"] = return_models
+        if fast_json:
+            client_options["json_loads"] = fast_json_loads()
+        self.base_client = BaseAPIClient(base_url, api_token, **client_options)
         self.checkins = CheckinsAPI(self.base_client)
         self.clan_spoils_claims = ClanSpoilsClaimsAPI(self.base_client)
         self.clan_spoils_sessions = ClanSpoilsSessionsAPI(self.base_client)
@@ -48,3 +69,26 @@ class VanderheimAPIClient:
         self.spoils_sessions = SpoilsSessionsAPI(self.base_client)
         self.subscriptions = SubscriptionsAPI(self.base_client)
         self.twitch_eventsub_subscriptions = TwitchEventSubSubscriptionsAPI(self.base_client)
+
+    async def __aenter__(self) -> "VanderheimAPIClient":
+        await self.base_client.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        await self.base_client.close()
+
+    def batch_writer(
+        self,
+        create: Create,
+        batch_size: Optional[int] = None,
+        flush_interval: float = 0.05,
+        concurrency: Optional[int] = None,
+    ) -> BatchWriter:
+        """
+        Returns a BatchWriter that buffers single calls of the given create method and sends
+        them in batches, e.g. client.batch_writer(client.checkins.create_checkin).
+        """
+        return self.base_client.batch_writer(create, batch_size, flush_interval, concurrency)
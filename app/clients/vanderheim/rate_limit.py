@@ -0,0 +1,102 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    A sustained request rate (requests per second) and the burst allowed on top of it.
+    """
+
+    rate: float
+    burst: int = 1
+
+
+@dataclass
+class BucketMetrics:
+    acquired: int = 0
+    throttled: int = 0
+    wait_seconds: float = 0.0
+
+
+class TokenBucket:
+    """
+    An asyncio token bucket. Waiters are served in arrival order.
+    """
+
+    def __init__(self, limit: RateLimit):
+        self.rate = limit.rate
+        self.capacity = float(limit.burst)
+        self.metrics = BucketMetrics()
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """
+        Takes one token, sleeping until one is available. Returns the time spent waiting.
+        """
+        started = time.monotonic()
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                self.metrics.throttled += 1
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+        waited = time.monotonic() - started
+        self.metrics.acquired += 1
+        self.metrics.wait_seconds += waited
+        return waited
+
+
+class RateLimiter:
+    """
+    Client-side rate limiting for the Vanderheim API.
+
+    Every request takes a token from the global bucket (if configured) and from the bucket of
+    the longest matching route prefix (if any), e.g.
+    {"/vanderheim-api/checkins/": RateLimit(5, 10)}.
+    """
+
+    def __init__(
+        self,
+        global_limit: Optional[RateLimit] = None,
+        route_limits: Optional[Dict[str, RateLimit]] = None,
+    ):
+        self.global_bucket = TokenBucket(global_limit) if global_limit else None
+        self.route_buckets = {
+            prefix: TokenBucket(limit) for prefix, limit in (route_limits or {}).items()
+        }
+
+    def _buckets_for(self, route: str) -> List[TokenBucket]:
+        buckets = [self.global_bucket] if self.global_bucket else []
+        matches = [prefix for prefix in self.route_buckets if route.startswith(prefix)]
+        if matches:
+            buckets.append(self.route_buckets[max(matches, key=len)])
+        return buckets
+
+    async def acquire(self, route: str) -> float:
+        """
+        Waits until the request to the given route may be sent. Returns the time spent waiting.
+        """
+        waited = 0.0
+        for bucket in self._buckets_for(route):
+            waited += await bucket.acquire()
+        return waited
+
+    def metrics(self) -> Dict[str, BucketMetrics]:
+        """
+        Returns the metrics of every bucket, keyed by route prefix ("*" for the global bucket).
+        """
+        metrics = {prefix: bucket.metrics for prefix, bucket in self.route_buckets.items()}
+        if self.global_bucket:
+            metrics["*"] = self.global_bucket.metrics
+        return metrics
@@ -0,0 +1,277 @@
+import inspect
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+
+from app.clients.vanderheim.base_client import BaseAPIClient
+
+API_PREFIX = "/vanderheim-api"
+
+
+@dataclass(frozen=True)
+class Resource:
+    """
+    Declares a collection of the Vanderheim API. Children are the collections nested below
+    its detail route, e.g. seasons/<season_id>/sessions/.
+    """
+
+    name: str
+    plural: str
+    segment: str
+    id_param: str
+    label: str
+    label_plural: str
+    children: Tuple["Resource", ...] = ()
+    list_method: Optional[str] = None
+
+
+def resource(
+    name: str,
+    plural: Optional[str] = None,
+    segment: Optional[str] = None,
+    id_param: Optional[str] = None,
+    label: Optional[str] = None,
+    label_plural: Optional[str] = None,
+    children: Tuple[Resource, ...] = (),
+    list_method: Optional[str] = None,
+) -> Resource:
+    """
+    Builds a Resource, deriving everything that is not given from its singular name:
+    "raid_session" becomes the raid_sessions methods, the raid-sessions URL segment and the
+    raid_session_id parameter.
+    """
+    plural = plural or f"{name}s"
+    label = label or name.replace("_", " ")
+    return Resource(
+        name=name,
+        plural=plural,
+        segment=segment or plural.replace("_", "-"),
+        id_param=id_param or f"{name}_id",
+        label=label,
+        label_plural=label_plural or f"{label}s",
+        children=tuple(children),
+        list_method=list_method,
+    )
+
+
+@dataclass(frozen=True)
+class Route:
+    """
+    A resource together with the chain of resources it is nested under.
+    """
+
+    parents: Tuple[Resource, ...]
+    resource: Resource
+
+    @property
+    def prefix(self) -> str:
+        return "".join(f"{parent.name}_" for parent in self.parents)
+
+    @property
+    def parent_params(self) -> List[str]:
+        return [parent.id_param for parent in self.parents]
+
+    @property
+    def scope(self) -> str:
+        return "".join(f" for a {parent.label}" for parent in reversed(self.parents))
+
+    def collection_url(self, base_url: str, parent_ids: List[str]) -> str:
+        path = "".join(f"{parent.segment}/{id}/" for parent, id in zip(self.parents, parent_ids))
+        return f"{base_url}{API_PREFIX}/{path}{self.resource.segment}/"
+
+
+def walk(root: Resource, parents: Tuple[Resource, ...] = ()) -> Iterator[Route]:
+    yield Route(parents, root)
+    for child in root.children:
+        yield from walk(child, parents + (root,))
+
+
+def _parameters(*specs: Tuple[str, Any, Any]) -> List[inspect.Parameter]:
+    return [
+        inspect.Parameter(
+            name, inspect.Parameter.POSITIONAL_OR_KEYWORD, default=default, annotation=annotation
+        )
+        for name, annotation, default in specs
+    ]
+
+
+def _method(
+    name: str,
+    parameters: List[inspect.Parameter],
+    returns: Any,
+    doc: str,
+    impl: Callable[..., Any],
+    generator: bool = False,
+) -> Callable[..., Any]:
+    """
+    Wraps impl(self, arguments) in a method with a real signature, so generated methods accept
+    the same positional and keyword arguments as the hand-written ones they replace.
+    """
+    self_parameter = inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    signature = inspect.Signature([self_parameter, *parameters], return_annotation=returns)
+
+    def bind(self: Any, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        return bound.arguments
+
+    async def iterate(self: Any, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        async for record in impl(self, bind(self, args, kwargs)):
+            yield record
+
+    async def call(self: Any, *args: Any, **kwargs: Any) -> Any:
+        return await impl(self, bind(self, args, kwargs))
+
+    method: Callable[..., Any] = iterate if generator else call
+    method.__name__ = name
+    method.__qualname__ = name
+    method.__doc__ = doc
+    setattr(method, "__signature__", signature)
+    return method
+
+
+def build_methods(route: Route) -> Dict[str, Callable[..., Any]]:
+    """
+    Generates the page, list, iter, get, create, update, partial update and delete methods of a
+    route, named the way the hand-written endpoint classes named them.
+    """
+    r = route.resource
+    prefix = route.prefix
+    scope = route.scope
+    parent_specs = [(param, str, inspect.Parameter.empty) for param in route.parent_params]
+    id_spec = (r.id_param, str, inspect.Parameter.empty)
+    data_spec = ("data", Dict[str, Any], inspect.Parameter.empty)
+    page_method = f"_fetch_{prefix}{r.plural}_page"
+    if r.list_method:
+        list_method = r.list_method
+    elif route.parents:
+        list_method = f"fetch_{prefix}{r.plural}"
+    else:
+        list_method = f"fetch_all_{r.plural}"
+
+    def parent_ids(arguments: Dict[str, Any]) -> List[str]:
+        return [arguments[param] for param in route.parent_params]
+
+    def collection_url(self: Any, arguments: Dict[str, Any]) -> str:
+        return route.collection_url(self.client.base_url, parent_ids(arguments))
+
+    def detail_url(self: Any, arguments: Dict[str, Any]) -> str:
+        return f"{collection_url(self, arguments)}{arguments[r.id_param]}/"
+
+    async def fetch_page(self: Any, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        params = {}
+        if arguments["page"] is not None:
+            params["page"] = arguments["page"]
+        if arguments["page_size"] is not None:
+            params["page_size"] = arguments["page_size"]
+        return await self.client._get(collection_url(self, arguments), params=params)
+
+    async def fetch_all(self: Any, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.client._fetch_all_pages(
+            getattr(self, page_method), *parent_ids(arguments)
+        )
+
+    async def iterate(self: Any, arguments: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        async for record in self.client._iter_pages(
+            getattr(self, page_method), *parent_ids(arguments), page_size=arguments["page_size"]
+        ):
+            yield record
+
+    async def fetch_one(self: Any, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.client._get(detail_url(self, arguments))
+
+    async def create(self: Any, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.client._post(collection_url(self, arguments), arguments["data"])
+
+    async def update(self: Any, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.client._put(detail_url(self, arguments), arguments["data"])
+
+    async def partial_update(self: Any, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.client._patch(detail_url(self, arguments), arguments["data"])
+
+    async def delete(self: Any, arguments: Dict[str, Any]) -> None:
+        await self.client._delete(detail_url(self, arguments))
+
+    page_specs = [("page", Optional[int], None), ("page_size", Optional[int], None)]
+    record = Dict[str, Any]
+    methods = [
+        _method(
+            page_method,
+            _parameters(*parent_specs, *page_specs),
+            record,
+            f"Fetches a single page of a paginated list of {r.label_plural}{scope}.",
+            fetch_page,
+        ),
+        _method(
+            list_method,
+            _parameters(*parent_specs),
+            record,
+            f"Fetches all {r.label_plural}{scope} using the {page_method[1:]} method.",
+            fetch_all,
+        ),
+        _method(
+            f"iter_{prefix}{r.plural}",
+            _parameters(*parent_specs, ("page_size", Optional[int], None)),
+            AsyncIterator[record],
+            f"Yields all {r.label_plural}{scope} page by page using the {page_method[1:]} method.",
+            iterate,
+            generator=True,
+        ),
+        _method(
+            f"fetch_{prefix}{r.name}",
+            _parameters(*parent_specs, id_spec),
+            record,
+            f"Fetches a single {r.label}{scope} by ID.",
+            fetch_one,
+        ),
+        _method(
+            f"create_{prefix}{r.name}",
+            _parameters(*parent_specs, data_spec),
+            record,
+            f"Creates a new {r.label}{scope}.",
+            create,
+        ),
+        _method(
+            f"update_{prefix}{r.name}",
+            _parameters(*parent_specs, id_spec, data_spec),
+            record,
+            f"Updates an existing {r.label}{scope} by ID.",
+            update,
+        ),
+        _method(
+            f"partial_update_{prefix}{r.name}",
+            _parameters(*parent_specs, id_spec, data_spec),
+            record,
+            f"Partially updates an existing {r.label}{scope} by ID.",
+            partial_update,
+        ),
+        _method(
+            f"delete_{prefix}{r.name}",
+            _parameters(*parent_specs, id_spec),
+            None,
+            f"Deletes a {r.label}{scope} by ID.",
+            delete,
+        ),
+    ]
+    return {method.__name__: method for method in methods}
+
+
+class ResourceAPI:
+    """
+    Base class of the endpoint classes. Subclasses declare a `resource` and get every method of
+    it and of its nested resources generated on the class.
+    """
+
+    resource: Resource
+
+    def __init__(self, client: BaseAPIClient):
+        self.client = client
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        for route in walk(cls.resource):
+            for name, method in build_methods(route).items():
+                if name in cls.__dict__:
+                    # Hand-written methods take precedence over generated ones.
+                    continue
+                method.__qualname__ = f"{cls.__qualname__}.{name}"
+                setattr(cls, name, method)
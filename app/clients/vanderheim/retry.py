@@ -0,0 +1,74 @@
+import asyncio
+import random
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+import aiohttp
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Describes when and how often a failed request to the Vanderheim API is retried.
+
+    Requests are only replayed when that is safe: idempotent methods are retried on any
+    retryable status or connection error, while other methods (POST, PATCH) are only
+    retried when the server tells us it did not process the request (429, or a connection
+    that could not be established at all).
+    """
+
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    retry_methods: FrozenSet[str] = IDEMPOTENT_METHODS
+    respect_retry_after: bool = True
+
+    def should_retry_status(self, method: str, status: int, attempt: int) -> bool:
+        if attempt >= self.max_retries or status not in self.retry_statuses:
+            return False
+        return method.upper() in self.retry_methods or status == 429
+
+    def should_retry_error(self, method: str, error: BaseException, attempt: int) -> bool:
+        if attempt >= self.max_retries:
+            return False
+        if method.upper() in self.retry_methods:
+            return isinstance(error, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+        # The request never reached the server, so replaying it cannot create a duplicate.
+        return isinstance(error, aiohttp.ClientConnectorError)
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Returns the number of seconds to wait before the next attempt.
+
+        A Retry-After header takes precedence, otherwise exponential backoff with full
+        jitter is used.
+        """
+        if self.respect_retry_after and retry_after:
+            delay = parse_retry_after(retry_after)
+            if delay is not None:
+                return min(delay, self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * (2**attempt)))
+
+
+NO_RETRY = RetryPolicy(max_retries=0)
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    """
+    Parses a Retry-After header given either as delta-seconds or as an HTTP date.
+    """
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,262 @@
+import json
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+def fast_json_loads() -> Callable[[str], Any]:
+    """
+    Returns orjson.loads when orjson is installed, otherwise the stdlib json.loads.
+    """
+    return orjson.loads if orjson is not None else json.loads
+
+
+_FIELD_NAMES: Dict[type, Dict[str, None]] = {}
+
+
+def _field_names(cls: Type["APIModel"]) -> Dict[str, None]:
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        # A dict rather than a set so to_dict() keeps the declaration order.
+        names = _FIELD_NAMES[cls] = dict.fromkeys(f.name for f in fields(cls) if f.name != "extra")
+    return names
+
+
+@dataclass(slots=True)
+class APIModel:
+    """
+    Base class of the typed Vanderheim API records.
+
+    Fields the model does not declare are kept in `extra`. Item access (record["id"],
+    record.get("name")) is supported so models can stand in for the raw dicts.
+    """
+
+    id: Optional[str] = None
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "APIModel":
+        names = _field_names(cls)
+        known = {}
+        extra = {}
+        for key, value in data.items():
+            if key in names:
+                known[key] = value
+            else:
+                extra[key] = value
+        return cls(**known, extra=extra)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {name: getattr(self, name) for name in _field_names(type(self))}
+        data.update(self.extra)
+        return data
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _field_names(type(self)):
+            return getattr(self, key)
+        return self.extra[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+@dataclass(slots=True)
+class Season(APIModel):
+    name: Optional[str] = None
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+
+
+@dataclass(slots=True)
+class Clan(APIModel):
+    name: Optional[str] = None
+    tag: Optional[str] = None
+    twitch_emoji_name: Optional[str] = None
+
+
+@dataclass(slots=True)
+class Player(APIModel):
+    name: Optional[str] = None
+    nickname: Optional[str] = None
+    enabled: Optional[bool] = None
+    clan: Optional[str] = None
+
+
+@dataclass(slots=True)
+class Session(APIModel):
+    season: Optional[str] = None
+    start_time: Optional[str] = None
+    end_time: Optional[str] = None
+
+
+@dataclass(slots=True)
+class RaidSession(Session):
+    pass
+
+
+@dataclass(slots=True)
+class SentrySession(Session):
+    session: Optional[str] = None
+
+
+@dataclass(slots=True)
+class SpoilsSession(Session):
+    points_reward: Optional[int] = None
+
+
+@dataclass(slots=True)
+class ClanSpoilsSession(SpoilsSession):
+    clan: Optional[str] = None
+
+
+@dataclass(slots=True)
+class Checkin(APIModel):
+    session: Optional[str] = None
+    player: Optional[str] = None
+
+
+@dataclass(slots=True)
+class RaidCheckin(Checkin):
+    pass
+
+
+@dataclass(slots=True)
+class SentryCheckin(Checkin):
+    pass
+
+
+@dataclass(slots=True)
+class SpoilsClaim(Checkin):
+    pass
+
+
+@dataclass(slots=True)
+class ClanSpoilsClaim(Checkin):
+    pass
+
+
+@dataclass(slots=True)
+class Points(APIModel):
+    player: Optional[str] = None
+    season: Optional[str] = None
+    clan: Optional[str] = None
+    points: Optional[int] = None
+
+
+@dataclass(slots=True)
+class GiftedSubscription(APIModel):
+    player: Optional[str] = None
+    gifted_subs: Optional[int] = None
+
+
+@dataclass(slots=True)
+class PlayerWatchTime(APIModel):
+    player: Optional[str] = None
+    season: Optional[str] = None
+    watch_time: Optional[int] = None
+
+
+@dataclass(slots=True)
+class Subscription(APIModel):
+    player: Optional[str] = None
+    months_subscribed: Optional[int] = None
+
+
+@dataclass(slots=True)
+class FollowerGiveaway(APIModel):
+    start_time: Optional[str] = None
+    end_time: Optional[str] = None
+    follower: Optional[str] = None
+    winner: Optional[str] = None
+
+
+@dataclass(slots=True)
+class FollowerGiveawayEntry(APIModel):
+    giveaway: Optional[str] = None
+    player: Optional[str] = None
+
+
+@dataclass(slots=True)
+class FollowerGiveawayPrize(APIModel):
+    message: Optional[str] = None
+    vp_reward: Optional[int] = None
+
+
+@dataclass(slots=True)
+class TwitchEventSubSubscription(APIModel):
+    pass
+
+
+# Keyed by the last collection segment of a route, or by (parent, last) where the same
+# segment name means different records depending on the parent collection.
+MODELS_BY_COLLECTION: Dict[Tuple[str, ...], Type[APIModel]] = {
+    ("checkins",): Checkin,
+    ("clan-spoils-claims",): ClanSpoilsClaim,
+    ("clan-spoils-sessions",): ClanSpoilsSession,
+    ("clans",): Clan,
+    ("follower-giveaway-entries",): FollowerGiveawayEntry,
+    ("follower-giveaway-prizes",): FollowerGiveawayPrize,
+    ("follower-giveaways",): FollowerGiveaway,
+    ("gifted-subscriptions",): GiftedSubscription,
+    ("player-watch-times",): PlayerWatchTime,
+    ("players",): Player,
+    ("points",): Points,
+    ("raid-checkins",): RaidCheckin,
+    ("raid-sessions",): RaidSession,
+    ("seasons",): Season,
+    ("sentry-checkins",): SentryCheckin,
+    ("sentry-sessions",): SentrySession,
+    ("sessions",): Session,
+    ("spoils-claims",): SpoilsClaim,
+    ("spoils-sessions",): SpoilsSession,
+    ("subscriptions",): Subscription,
+    ("twitch-eventsub-subscriptions",): TwitchEventSubSubscription,
+    ("raid-sessions", "checkins"): RaidCheckin,
+    ("sentry-sessions", "checkins"): SentryCheckin,
+    ("spoils-sessions", "claims"): SpoilsClaim,
+    ("clan-spoils-sessions", "claims"): ClanSpoilsClaim,
+}
+
+
+@lru_cache(maxsize=1024)
+def _model_for_collections(collections: Tuple[str, ...]) -> Optional[Type[APIModel]]:
+    return MODELS_BY_COLLECTION.get(collections[-2:]) or MODELS_BY_COLLECTION.get(collections[-1:])
+
+
+def model_for_route(route: str) -> Optional[Type[APIModel]]:
+    """
+    Returns the model of the records served by a route such as
+    /vanderheim-api/seasons/<id>/sessions/<id>/checkins/, or None if it is unknown.
+    """
+    # Routes alternate between collection names and IDs after the API prefix.
+    collections = tuple(route.strip("/").split("/")[1::2])
+    if not collections:
+        return None
+    return _model_for_collections(collections)
+
+
+def to_models(route: str, body: Any) -> Any:
+    """
+    Converts a decoded response body into models. Page envelopes stay dicts with their
+    results converted.
+    """
+    model = model_for_route(route)
+    if model is None or body is None:
+        return body
+    if isinstance(body, list):
+        return [model.from_dict(item) for item in body]
+    if isinstance(body, dict) and "results" in body:
+        return {**body, "results": [model.from_dict(item) for item in body["results"]]}
+    if isinstance(body, dict):
+        return model.from_dict(body)
+    return body
@@ -0,0 +1,293 @@
+"""
+Season leaderboards, answered from an in-memory index instead of the database.
+
+Each (channel, season) board is loaded from Points the first time it is read (the bot warms
+the active seasons at startup) and the points ledger passes every total it writes to
+leaderboard_index.update(), so ranks and top lists stay current without a query.
+"""
+
+import asyncio
+from bisect import bisect_left, insort
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple, TypedDict, Union
+
+from app.models import Channel, Clan, Player, Points, Season
+
+_BOARD_SQL = """
+    SELECT
+        "points"."player_id",
+        "player"."name",
+        "points"."clan_id",
+        "clan"."tag" AS "clantag",
+        "points"."points"
+    FROM "points"
+    JOIN "player" ON "player"."id" = "points"."player_id"
+    JOIN "clan" ON "clan"."id" = "points"."clan_id"
+    WHERE "points"."channel_id" = $1 AND "points"."season_id" = $2
+"""
+
+BoardKey = Tuple[int, int]
+RankKey = Tuple[Any, ...]
+
+
+class RankedPlayer(TypedDict):
+    player_id: int
+    name: str
+    clan_id: int
+    clantag: str
+    points: int
+    rank: int
+    clan_rank: int
+
+
+class _SortedKeys:
+    """
+    Keys kept in order in buckets of at most twice `load` keys. Adding or removing a key shifts
+    one short list, and finding one bisects the bucket maxima and then a single bucket.
+    """
+
+    def __init__(self, load: int = 256):
+        self._load = load
+        self._buckets: List[List[RankKey]] = []
+        self._maxes: List[RankKey] = []
+
+    def add(self, key: RankKey) -> None:
+        if not self._buckets:
+            self._buckets.append([key])
+            self._maxes.append(key)
+            return
+        i = min(bisect_left(self._maxes, key), len(self._maxes) - 1)
+        bucket = self._buckets[i]
+        insort(bucket, key)
+        self._maxes[i] = bucket[-1]
+        if len(bucket) > 2 * self._load:
+            self._buckets.insert(i + 1, bucket[self._load :])
+            del bucket[self._load :]
+            self._maxes.insert(i, bucket[-1])
+
+    def discard(self, key: RankKey) -> None:
+        i = bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            return
+        bucket = self._buckets[i]
+        j = bisect_left(bucket, key)
+        if j == len(bucket) or bucket[j] != key:
+            return
+        del bucket[j]
+        if bucket:
+            self._maxes[i] = bucket[-1]
+        else:
+            del self._buckets[i]
+            del self._maxes[i]
+
+    def count_before(self, key: RankKey) -> int:
+        """
+        Returns how many keys sort before `key`.
+        """
+        i = bisect_left(self._maxes, key)
+        before = sum(len(bucket) for bucket in self._buckets[:i])
+        if i < len(self._buckets):
+            before += bisect_left(self._buckets[i], key)
+        return before
+
+    def head(self, limit: int) -> List[RankKey]:
+        keys: List[RankKey] = []
+        for bucket in self._buckets:
+            if len(keys) >= limit:
+                break
+            keys.extend(bucket[: limit - len(keys)])
+        return keys
+
+
+@dataclass(slots=True)
+class _Entry:
+    name: str
+    clan_id: int
+    clantag: str
+    points: int
+
+
+class _Board:
+    """
+    One season's players in a channel, ordered overall and within each clan.
+    """
+
+    def __init__(self) -> None:
+        self.entries: Dict[int, _Entry] = {}
+        self._players = _SortedKeys()
+        self._clans: Dict[int, _SortedKeys] = defaultdict(_SortedKeys)
+
+    @staticmethod
+    def _key(player_id: int, entry: _Entry) -> RankKey:
+        # Most points first, ties listed by name.
+        return (-entry.points, entry.name, player_id)
+
+    def set(self, player_id: int, entry: _Entry) -> None:
+        previous = self.entries.get(player_id)
+        if previous is not None:
+            self._players.discard(self._key(player_id, previous))
+            self._clans[previous.clan_id].discard(self._key(player_id, previous))
+        self.entries[player_id] = entry
+        self._players.add(self._key(player_id, entry))
+        self._clans[entry.clan_id].add(self._key(player_id, entry))
+
+    def ranked(self, player_id: int) -> RankedPlayer:
+        entry = self.entries[player_id]
+        # Only players with more points sort before this, so players tied on points share a rank.
+        ahead = (-entry.points,)
+        return {
+            "player_id": player_id,
+            "name": entry.name,
+            "clan_id": entry.clan_id,
+            "clantag": entry.clantag,
+            "points": entry.points,
+            "rank": self._players.count_before(ahead) + 1,
+            "clan_rank": self._clans[entry.clan_id].count_before(ahead) + 1,
+        }
+
+    def top(self, limit: int, clan_id: Optional[int] = None) -> List[RankedPlayer]:
+        keys = self._players if clan_id is None else self._clans.get(clan_id, _SortedKeys())
+        return [self.ranked(key[-1]) for key in keys.head(limit)]
+
+
+class LeaderboardIndex:
+    """
+    Leaderboard boards per (channel, season), kept current from the totals the ledger writes.
+    """
+
+    def __init__(self) -> None:
+        self._boards: Dict[BoardKey, _Board] = {}
+        self._loading: Dict[BoardKey, List[Dict[str, Any]]] = {}
+        # The latest total of players whose name or clan tag is still being looked up.
+        self._unnamed: Dict[Tuple[int, int, int], Dict[str, Any]] = {}
+        self._names: Dict[int, str] = {}
+        self._tags: Dict[int, str] = {}
+        self._lock = asyncio.Lock()
+
+    async def board(self, channel_id: int, season_id: int) -> _Board:
+        """
+        Returns the board of a season, loading it from the database on first use.
+        """
+        key = (channel_id, season_id)
+        if key not in self._boards:
+            async with self._lock:
+                if key not in self._boards:
+                    await self._load(key)
+        return self._boards[key]
+
+    async def warm(self, channel_id: int, season_id: int) -> None:
+        """
+        Loads, or reloads, the board of a season from the database.
+        """
+        async with self._lock:
+            await self._load((channel_id, season_id))
+
+    async def update(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """
+        Applies totals written by the ledger, given as dicts with player_id, season_id,
+        channel_id, clan_id and points. Seasons that have not been loaded are skipped, they
+        are read from the database when they are.
+
+        Totals are applied in the order update() is called, before anything is awaited. Only
+        a player seen for the first time waits for their name, and then gets whichever of
+        their totals came in last.
+        """
+        unnamed = []
+        for row in rows:
+            if self._is_named(row):
+                # Supersedes a total still waiting for a name lookup started earlier.
+                self._unnamed.pop((row["channel_id"], row["season_id"], row["player_id"]), None)
+                self._apply(row)
+            elif (row["channel_id"], row["season_id"]) in self._boards:
+                key = (row["channel_id"], row["season_id"], row["player_id"])
+                self._unnamed[key] = row
+                unnamed.append(key)
+            elif (row["channel_id"], row["season_id"]) in self._loading:
+                self._loading[(row["channel_id"], row["season_id"])].append(row)
+        if not unnamed:
+            return
+        await self._look_up_names([self._unnamed[key] for key in unnamed])
+        for key in unnamed:
+            row = self._unnamed.pop(key, None)
+            if row is not None:
+                self._apply(row)
+
+    async def _load(self, key: BoardKey) -> None:
+        self._loading[key] = []
+        try:
+            rows = await Points._meta.db.execute_query_dict(_BOARD_SQL, list(key))
+            board = _Board()
+            for row in rows:
+                self._names[row["player_id"]] = row["name"]
+                self._tags[row["clan_id"]] = row["clantag"]
+                self._set(board, row)
+            # Totals written while loading may be newer than what the query read, they are
+            # applied on top once every name they need is known.
+            while not all(self._is_named(row) for row in self._loading[key]):
+                await self._look_up_names(self._loading[key])
+            for row in self._loading[key]:
+                self._set(board, row)
+            self._boards[key] = board
+        finally:
+            del self._loading[key]
+
+    async def _look_up_names(self, rows: List[Dict[str, Any]]) -> None:
+        players = {row["player_id"] for row in rows} - self._names.keys()
+        if players:
+            self._names.update(await Player.filter(id__in=players).values_list("id", "name"))
+        clans = {row["clan_id"] for row in rows} - self._tags.keys()
+        if clans:
+            self._tags.update(await Clan.filter(id__in=clans).values_list("id", "tag"))
+
+    def _is_named(self, row: Dict[str, Any]) -> bool:
+        return row["player_id"] in self._names and row["clan_id"] in self._tags
+
+    def _apply(self, row: Dict[str, Any]) -> None:
+        key = (row["channel_id"], row["season_id"])
+        if key in self._loading:
+            self._loading[key].append(row)
+        elif key in self._boards:
+            self._set(self._boards[key], row)
+
+    def _set(self, board: _Board, row: Dict[str, Any]) -> None:
+        board.set(
+            row["player_id"],
+            _Entry(
+                name=self._names[row["player_id"]],
+                clan_id=row["clan_id"],
+                clantag=self._tags[row["clan_id"]],
+                points=row["points"],
+            ),
+        )
+
+
+leaderboard_index = LeaderboardIndex()
+
+
+def _id(instance: Union[Channel, Clan, Season, int]) -> int:
+    return instance if isinstance(instance, int) else instance.id
+
+
+async def top_players(
+    channel: Union[Channel, int],
+    season: Union[Season, int],
+    limit: int = 10,
+    clan: Union[Clan, int, None] = None,
+) -> List[RankedPlayer]:
+    """
+    Returns the `limit` best players of a season, or of one clan in that season, best first.
+    """
+    board = await leaderboard_index.board(_id(channel), _id(season))
+    return board.top(limit, None if clan is None else _id(clan))
+
+
+async def player_rank(
+    channel: Union[Channel, int], season: Union[Season, int], player_id: int
+) -> Optional[RankedPlayer]:
+    """
+    Returns a player's points, overall rank and rank in their clan for a season, or None if
+    they have no points that season.
+    """
+    board = await leaderboard_index.board(_id(channel), _id(season))
+    return board.ranked(player_id) if player_id in board.entries else None
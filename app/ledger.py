@@ -0,0 +1,550 @@
+"""
+The points ledger. Every change to a player's season points goes through here as an
+increment in the database, so concurrent awards for the same player cannot overwrite each
+other, and the clan's ClanStanding total and the player's lifetime points are changed in
+the same transaction.
+
+When the write-behind buffer is enabled (APP.POINTS_BUFFER in config.yaml), awards are
+summed in memory per (player, season, channel) and written in one multi-row upsert every
+flush interval, or sooner once enough awards are pending. With a journal, award_points()
+returns once the award is fsynced to it (a few milliseconds of awards share one fsync), and
+the journal is replayed at startup so a crash does not lose points. Each flush records the
+last journal entry it wrote in the same transaction, so a replay never applies an award twice.
+
+Every total written is passed on to the in-memory leaderboard index.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from tortoise import BaseDBAsyncClient
+from tortoise.transactions import in_transaction
+
+from app.leaderboard import leaderboard_index
+from app.models import Points, PointsJournal
+
+logger = logging.getLogger(__name__)
+
+# A batch row carries both the value a new row starts with and the increment for an existing
+# row, the conflict branch looks the increment up in the batch. "inserted" tells the caller
+# which of the two landed, xmax is only set on a row version written by an update.
+_AWARD_SQL = """
+    WITH "batch" ("player_id", "season_id", "channel_id", "clan_id", "initial", "delta") AS (
+        VALUES {rows}
+    )
+    INSERT INTO "points" ("player_id", "season_id", "channel_id", "clan_id", "points")
+    SELECT "player_id", "season_id", "channel_id", "clan_id", "initial" FROM "batch" WHERE TRUE
+    ON CONFLICT ("player_id", "season_id", "channel_id")
+    DO UPDATE SET "points" = "points"."points" + (
+        SELECT "batch"."delta" FROM "batch"
+        WHERE "batch"."player_id" = "excluded"."player_id"
+            AND "batch"."season_id" = "excluded"."season_id"
+            AND "batch"."channel_id" = "excluded"."channel_id"
+    )
+    RETURNING
+        "player_id", "season_id", "channel_id", "clan_id", "points", ("xmax" = 0) AS "inserted"
+"""
+
+_RAID_BONUS_SQL = """
+    INSERT INTO "points" ("player_id", "season_id", "channel_id", "clan_id", "points")
+    SELECT DISTINCT "player"."id", $1, $2, "player"."clan_id", $3
+    FROM "raidcheckin"
+    JOIN "player" ON "player"."id" = "raidcheckin"."player_id"
+    WHERE "raidcheckin"."session_id" = $4 AND "player"."clan_id" IS NOT NULL
+    ON CONFLICT ("player_id", "season_id", "channel_id")
+    DO UPDATE SET "points" = "points"."points" + "excluded"."points"
+    RETURNING "player_id", "clan_id", "points"
+"""
+
+# Clan rows are written in key order so concurrent transactions lock them in the same order.
+_CLAN_TOTALS_SQL = """
+    WITH "change" ("season_id", "channel_id", "clan_id", "points") AS (
+        VALUES {rows}
+    )
+    INSERT INTO "clanstanding" ("season_id", "channel_id", "clan_id", "points")
+    SELECT "season_id", "channel_id", "clan_id", "points" FROM "change" WHERE TRUE
+    ORDER BY "season_id", "channel_id", "clan_id"
+    ON CONFLICT ("season_id", "channel_id", "clan_id")
+    DO UPDATE SET "points" = "clanstanding"."points" + "excluded"."points"
+"""
+
+_LIFETIME_POINTS_SQL = """
+    WITH "change" ("player_id", "channel_id", "points") AS (
+        VALUES {rows}
+    )
+    INSERT INTO "playerlifetimestats" ("player_id", "channel_id", "points")
+    SELECT "player_id", "channel_id", "points" FROM "change" WHERE TRUE
+    ORDER BY "player_id", "channel_id"
+    ON CONFLICT ("player_id", "channel_id")
+    DO UPDATE SET "points" = "playerlifetimestats"."points" + "excluded"."points"
+"""
+
+_JOURNAL_SQL = """
+    INSERT INTO "pointsjournal" ("name", "applied_seq") VALUES ($1, $2)
+    ON CONFLICT ("name") DO UPDATE SET "applied_seq" = "excluded"."applied_seq"
+"""
+
+PointsKey = Tuple[int, int, int]
+ClanKey = Tuple[int, int, int]
+LifetimeKey = Tuple[int, int]
+
+
+@dataclass(slots=True)
+class PendingAward:
+    """
+    The awards buffered for one (player, season, channel). `initial` is what the row is
+    created with if it does not exist yet, `delta` is what is added to it otherwise.
+    """
+
+    clan_id: int
+    initial: int
+    delta: int
+    # The journal sequence number of the latest award merged in.
+    seq: int = 0
+
+    def merge(self, later: "PendingAward") -> None:
+        # Whichever award comes first creates the row, the ones after it only add.
+        self.initial += later.delta
+        self.delta += later.delta
+        self.seq = max(self.seq, later.seq)
+
+
+def _values(rows: Iterable[Tuple[int, ...]]) -> Tuple[str, List[int]]:
+    """
+    Renders rows of integers as a VALUES list of placeholders, with the values to bind.
+    """
+    values: List[int] = []
+    placeholders = []
+    for row in rows:
+        start = len(values)
+        values.extend(row)
+        placeholders.append(
+            "(" + ", ".join(f"CAST(${start + i} AS INTEGER)" for i in range(1, len(row) + 1)) + ")"
+        )
+    return ", ".join(placeholders), values
+
+
+async def _change_totals(
+    connection: BaseDBAsyncClient,
+    clan_changes: Dict[ClanKey, int],
+    lifetime_changes: Dict[LifetimeKey, int],
+) -> None:
+    """
+    Adds to the ClanStanding totals of (season, channel, clan) and the lifetime points of
+    (player, channel), creating missing rows.
+    """
+    if clan_changes:
+        rows, values = _values((*key, change) for key, change in clan_changes.items())
+        await connection.execute_query(_CLAN_TOTALS_SQL.format(rows=rows), values)
+    if lifetime_changes:
+        rows, values = _values((*key, change) for key, change in lifetime_changes.items())
+        await connection.execute_query(_LIFETIME_POINTS_SQL.format(rows=rows), values)
+
+
+async def _apply_awards(
+    connection: BaseDBAsyncClient, batch: Dict[PointsKey, PendingAward]
+) -> List[Dict[str, Any]]:
+    """
+    Writes a batch of awards in one upsert, and the clan totals and lifetime points they
+    change, on a connection that is in a transaction. Returns the written rows as dicts with
+    player_id, season_id, channel_id, clan_id, points and whether the row was inserted.
+    """
+    rows, values = _values(
+        (*key, award.clan_id, award.initial, award.delta) for key, award in batch.items()
+    )
+    written = await connection.execute_query_dict(_AWARD_SQL.format(rows=rows), values)
+
+    clan_changes: Dict[ClanKey, int] = defaultdict(int)
+    lifetime_changes: Dict[LifetimeKey, int] = defaultdict(int)
+    for row in written:
+        award = batch[(row["player_id"], row["season_id"], row["channel_id"])]
+        change = award.initial if row["inserted"] else award.delta
+        # The clan total follows the clan the row is booked to, which is where it was created.
+        clan_changes[(row["season_id"], row["channel_id"], row["clan_id"])] += change
+        lifetime_changes[(row["player_id"], row["channel_id"])] += change
+
+    await _change_totals(connection, clan_changes, lifetime_changes)
+    return written
+
+
+class PointsAggregator:
+    """
+    Write-behind buffer for award_points(). Awards are flushed every `flush_interval` seconds,
+    or as soon as `max_pending` awards are waiting, and once more by stop().
+
+    With a `journal_path`, every award is numbered and appended to a JSON lines file before
+    add() returns. Awards added within `journal_delay` seconds of each other share one write
+    and fsync, which run off the event loop. After each flush the file is rewritten with what
+    is still pending. A flush stores the last sequence number it wrote in PointsJournal in the
+    same transaction as the points, and the replay at startup skips entries up to it, so a
+    crash between a flush committing and the journal being rewritten does not award twice.
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = 0.5,
+        max_pending: int = 500,
+        journal_path: Optional[str] = None,
+        journal_delay: float = 0.002,
+    ):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.journal_path = journal_path
+        self.journal_delay = journal_delay
+        self._pending: Dict[PointsKey, PendingAward] = {}
+        self._pending_count = 0
+        self._lock = asyncio.Lock()
+        self._journal: Optional[Any] = None
+        self._journal_lock = asyncio.Lock()
+        self._journal_sync: Optional[asyncio.Future] = None
+        self._unsynced: List[str] = []
+        self._seq = 0
+        self._flusher: Optional[asyncio.Task] = None
+        self._size_flush: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """
+        Replays the journal left by the previous run and starts the periodic flush.
+        """
+        if self.journal_path:
+            journal = await PointsJournal.get_or_none(name=self.journal_path)
+            applied = journal.applied_seq if journal is not None else 0
+            self._seq = applied
+            skipped = 0
+            for entry in self._read_journal():
+                seq = entry.get("seq")
+                if seq is not None and seq <= applied:
+                    # Written by a flush that committed before the journal was rewritten.
+                    skipped += 1
+                    continue
+                self._seq = max(self._seq, seq or 0)
+                self._buffer(**entry)
+            if skipped:
+                logger.info(
+                    f"Skipping {skipped} journalled point awards that were already written."
+                )
+            self._journal = open(self.journal_path, "a", encoding="utf-8")
+            if self._pending:
+                logger.info(f"Replaying {self._pending_count} journalled point awards.")
+                await self.flush()
+        self._flusher = asyncio.create_task(self._flush_periodically())
+
+    async def stop(self) -> None:
+        """
+        Stops the periodic flush and writes out everything still pending.
+        """
+        if self._flusher is not None:
+            # Cancel between flushes, never in the middle of one.
+            async with self._lock:
+                self._flusher.cancel()
+            self._flusher = None
+        if self._size_flush is not None:
+            await asyncio.gather(self._size_flush, return_exceptions=True)
+        await self.flush()
+        if self._journal_sync is not None:
+            await asyncio.gather(self._journal_sync, return_exceptions=True)
+        async with self._journal_lock:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+
+    async def add(
+        self,
+        player_id: int,
+        season_id: int,
+        channel_id: int,
+        clan_id: int,
+        points: int,
+        initial_points: int,
+    ) -> None:
+        """
+        Buffers an award and, with a journal, returns once it has been written to it.
+        """
+        self._seq += 1
+        entry = {
+            "player_id": player_id,
+            "season_id": season_id,
+            "channel_id": channel_id,
+            "clan_id": clan_id,
+            "points": points,
+            "initial_points": initial_points,
+            "seq": self._seq,
+        }
+        # Buffered in the same step as it is numbered, so every number up to self._seq is
+        # pending or flushed.
+        self._buffer(**entry)
+        if self._pending_count >= self.max_pending and (
+            self._size_flush is None or self._size_flush.done()
+        ):
+            self._size_flush = asyncio.create_task(self.flush())
+        if self._journal is not None:
+            self._unsynced.append(json.dumps(entry) + "\n")
+            if self._journal_sync is None or self._journal_sync.done():
+                self._journal_sync = asyncio.ensure_future(self._sync_soon())
+            # Shielded so a cancelled caller does not cancel the sync for everyone else.
+            await asyncio.shield(self._journal_sync)
+
+    async def flush(self) -> List[Dict[str, Any]]:
+        """
+        Writes the pending awards in one statement and returns the updated rows as dicts with
+        player_id, season_id, channel_id and points.
+        """
+        async with self._lock:
+            if not self._pending:
+                return []
+            batch, self._pending = self._pending, {}
+            count, self._pending_count = self._pending_count, 0
+            try:
+                rows = await self._upsert(batch, self._seq)
+            except Exception:
+                # Keep the batch ahead of anything buffered while the upsert was running.
+                for key, later in self._pending.items():
+                    if key in batch:
+                        batch[key].merge(later)
+                    else:
+                        batch[key] = later
+                self._pending = batch
+                self._pending_count += count
+                logger.exception(f"Failed to flush {count} point awards, will retry.")
+                return []
+            try:
+                await self._rewrite_journal()
+            except Exception:
+                # The points are committed, the next flush rewrites the journal again.
+                logger.exception("Failed to rewrite the points journal.")
+            await leaderboard_index.update(rows)
+            return rows
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Periodic points flush failed.")
+
+    def _buffer(
+        self,
+        player_id: int,
+        season_id: int,
+        channel_id: int,
+        clan_id: int,
+        points: int,
+        initial_points: int,
+        seq: int = 0,
+    ) -> None:
+        key = (player_id, season_id, channel_id)
+        award = PendingAward(clan_id=clan_id, initial=initial_points, delta=points, seq=seq)
+        if key in self._pending:
+            self._pending[key].merge(award)
+        else:
+            self._pending[key] = award
+        self._pending_count += 1
+
+    async def _upsert(self, batch: Dict[PointsKey, PendingAward], seq: int) -> List[Dict[str, Any]]:
+        async with in_transaction() as connection:
+            rows = await _apply_awards(connection, batch)
+            if self.journal_path:
+                await connection.execute_query(_JOURNAL_SQL, [self.journal_path, seq])
+            return rows
+
+    def _read_journal(self) -> Iterable[Dict[str, int]]:
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as journal:
+                lines = journal.readlines()
+        except FileNotFoundError:
+            return []
+        entries = []
+        for line in lines:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                # A line cut short by a crash mid-write was never buffered.
+                logger.warning(f"Skipping damaged journal line: {line!r}")
+        return entries
+
+    async def _sync_soon(self) -> None:
+        await asyncio.sleep(self.journal_delay)
+        # Awards added from here on wait for the next sync, this one may not include them.
+        self._journal_sync = None
+        await self._sync_journal()
+
+    async def _sync_journal(self) -> None:
+        """
+        Appends the awards added since the last sync to the journal and fsyncs it, in the
+        default executor.
+        """
+        async with self._journal_lock:
+            if self._journal is None or not self._unsynced:
+                return
+            lines, self._unsynced = self._unsynced, []
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, self._write_journal, lines)
+            except Exception:
+                # Still pending, so the rewrite after a successful flush puts them in the journal.
+                self._unsynced[:0] = lines
+                logger.exception(f"Failed to sync {len(lines)} point awards to the journal.")
+
+    def _write_journal(self, lines: List[str]) -> None:
+        self._journal.writelines(lines)
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+
+    async def _rewrite_journal(self) -> None:
+        async with self._journal_lock:
+            if self._journal is None:
+                return
+            # Everything added so far is still pending, so it is in the rewritten file. Awards
+            # added while it is written are appended to the new file by the next sync.
+            lines = []
+            for (player_id, season_id, channel_id), award in self._pending.items():
+                entry = {
+                    "player_id": player_id,
+                    "season_id": season_id,
+                    "channel_id": channel_id,
+                    "clan_id": award.clan_id,
+                    "points": award.delta,
+                    "initial_points": award.initial,
+                    "seq": award.seq,
+                }
+                lines.append(json.dumps(entry) + "\n")
+            synced = len(self._unsynced)
+            await asyncio.get_running_loop().run_in_executor(None, self._replace_journal, lines)
+            del self._unsynced[:synced]
+
+    def _replace_journal(self, lines: List[str]) -> None:
+        temporary_path = f"{self.journal_path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as journal:
+            journal.writelines(lines)
+            journal.flush()
+            os.fsync(journal.fileno())
+        # The old file stays open, and the journal, until the new one has replaced it.
+        os.replace(temporary_path, self.journal_path)
+        self._journal.close()
+        self._journal = open(self.journal_path, "a", encoding="utf-8")
+
+
+points_buffer: Optional[PointsAggregator] = None
+
+
+async def start_points_buffer(
+    flush_interval: float,
+    max_pending: int,
+    journal_path: Optional[str] = None,
+    journal_delay: float = 0.002,
+) -> PointsAggregator:
+    """
+    Routes award_points() through a write-behind buffer until stop_points_buffer().
+    """
+    global points_buffer
+    aggregator = PointsAggregator(flush_interval, max_pending, journal_path, journal_delay)
+    await aggregator.start()
+    points_buffer = aggregator
+    return aggregator
+
+
+async def stop_points_buffer() -> None:
+    global points_buffer
+    if points_buffer is not None:
+        aggregator, points_buffer = points_buffer, None
+        await aggregator.stop()
+
+
+async def award_points(
+    player_id: int,
+    season_id: int,
+    channel_id: int,
+    clan_id: int,
+    points: int,
+    initial_points: Optional[int] = None,
+) -> Optional[int]:
+    """
+    Adds points to a player's season total, creating the row if needed, and returns the new
+    total. `initial_points` is what a new row starts with when it differs from the increment
+    (a first raid check-in is worth 250, later ones 100).
+
+    Returns None when the award was buffered, the total is not known until the next flush.
+    """
+    if initial_points is None:
+        initial_points = points
+    if points_buffer is not None:
+        await points_buffer.add(player_id, season_id, channel_id, clan_id, points, initial_points)
+        return None
+    award = PendingAward(clan_id=clan_id, initial=initial_points, delta=points)
+    async with in_transaction() as connection:
+        rows = await _apply_awards(connection, {(player_id, season_id, channel_id): award})
+    await leaderboard_index.update(rows)
+    return rows[0]["points"]
+
+
+async def award_raid_bonus(session_id: int, season_id: int, channel_id: int, points: int) -> int:
+    """
+    Adds points to everyone checked into a raid session in one statement and returns how many
+    players were awarded. Raiders without a clan are skipped.
+    """
+    if points_buffer is not None:
+        # Buffered first check-ins must create their rows before the bonus does.
+        await points_buffer.flush()
+    async with in_transaction() as connection:
+        rows = await connection.execute_query_dict(
+            _RAID_BONUS_SQL, [season_id, channel_id, points, session_id]
+        )
+        clan_changes: Dict[ClanKey, int] = defaultdict(int)
+        for row in rows:
+            clan_changes[(season_id, channel_id, row["clan_id"])] += points
+        await _change_totals(
+            connection,
+            clan_changes,
+            {(row["player_id"], channel_id): points for row in rows},
+        )
+    await leaderboard_index.update(
+        {**row, "season_id": season_id, "channel_id": channel_id} for row in rows
+    )
+    return len(rows)
+
+
+async def remove_points(
+    player_id: int, season_id: int, channel_id: int, points: int, floor: Optional[int] = 0
+) -> Optional[int]:
+    """
+    Takes points from a player's season total without going below `floor` (pass None to allow
+    negative totals). Returns the new total, or None if the player has no points this season.
+    """
+    if points_buffer is not None:
+        # The floor has to apply to the real total, so write out buffered awards first.
+        await points_buffer.flush()
+    async with in_transaction() as connection:
+        row = (
+            await Points.filter(player_id=player_id, season_id=season_id, channel_id=channel_id)
+            .select_for_update()
+            .using_db(connection)
+            .first()
+        )
+        if row is None:
+            return None
+        total = row.points - points
+        if floor is not None and total < floor:
+            total = floor
+        await Points.filter(id=row.id).using_db(connection).update(points=total)
+        await _change_totals(
+            connection,
+            {(season_id, channel_id, row.clan_id): total - row.points},
+            {(player_id, channel_id): total - row.points},
+        )
+    await leaderboard_index.update(
+        [
+            {
+                "player_id": player_id,
+                "season_id": season_id,
+                "channel_id": channel_id,
+                "clan_id": row.clan_id,
+                "points": total,
+            }
+        ]
+    )
+    return total
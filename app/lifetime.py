@@ -0,0 +1,117 @@
+"""
+Lifetime stats per player and channel (points, check-ins, raid and sentry check-ins and
+spoils claims) kept as counters, so profiles and lifetime leaderboards read one indexed row.
+
+The points ledger keeps the points counter, record_activity() the others, each in the same
+transaction as the change it counts. rebuild_lifetime_stats() recomputes them all.
+"""
+
+from typing import Any, Dict, Optional, Type, Union
+
+from tortoise.models import Model
+from tortoise.transactions import in_transaction
+
+from app.models import (
+    Channel,
+    Checkin,
+    ClanSpoilsClaim,
+    PlayerLifetimeStats,
+    RaidCheckin,
+    SentryCheckin,
+    SpoilsClaim,
+)
+
+_COUNTERS: Dict[Type[Model], str] = {
+    Checkin: "checkins",
+    RaidCheckin: "raid_checkins",
+    SentryCheckin: "sentry_checkins",
+    SpoilsClaim: "claims",
+    ClanSpoilsClaim: "claims",
+}
+
+_COUNT_SQL = """
+    INSERT INTO "playerlifetimestats" ("player_id", "channel_id", "{counter}")
+    VALUES ($1, $2, 1)
+    ON CONFLICT ("player_id", "channel_id")
+    DO UPDATE SET "{counter}" = "playerlifetimestats"."{counter}" + 1
+    RETURNING "{counter}"
+"""
+
+# Creates the rows the rebuild locks, so a change that would create one waits for the
+# rebuild to commit instead of being overwritten by it.
+_SEED_SQL = """
+    INSERT INTO "playerlifetimestats" ("player_id", "channel_id")
+    SELECT "player"."id", "player"."channel_id" FROM "player" {filter}
+    ON CONFLICT ("player_id", "channel_id") DO NOTHING
+"""
+
+
+def _count(table: str) -> str:
+    return f"""(
+            SELECT COUNT(*) FROM "{table}"
+            WHERE "{table}"."player_id" = "playerlifetimestats"."player_id"
+                AND "{table}"."channel_id" = "playerlifetimestats"."channel_id"
+        )"""
+
+
+_REBUILD_SQL = f"""
+    UPDATE "playerlifetimestats" SET
+        "points" = COALESCE((
+            SELECT SUM("points"."points") FROM "points"
+            WHERE "points"."player_id" = "playerlifetimestats"."player_id"
+                AND "points"."channel_id" = "playerlifetimestats"."channel_id"
+        ), 0),
+        "checkins" = {_count("checkin")},
+        "raid_checkins" = {_count("raidcheckin")},
+        "sentry_checkins" = {_count("sentrycheckin")},
+        "claims" = {_count("spoilsclaim")} + {_count("clanspoilsclaim")}
+    {{filter}}
+"""
+
+
+async def record_activity(
+    model: Type[Model], player_id: int, channel_id: int, **fields: Any
+) -> int:
+    """
+    Creates a check-in or spoils claim and counts it in the player's lifetime stats in one
+    transaction. Returns the player's new lifetime count of that activity.
+    """
+    counter = _COUNTERS[model]
+    async with in_transaction() as connection:
+        await model.create(
+            player_id=player_id, channel_id=channel_id, using_db=connection, **fields
+        )
+        rows = await connection.execute_query_dict(
+            _COUNT_SQL.format(counter=counter), [player_id, channel_id]
+        )
+    return rows[0][counter]
+
+
+async def rebuild_lifetime_stats(channel: Union[Channel, int, None] = None) -> int:
+    """
+    Recomputes the lifetime stats of every player in `channel`, or in every channel, from
+    Points and the check-in and claim tables. Returns how many players were rebuilt.
+    """
+    channel_id: Optional[int] = (
+        channel if channel is None or isinstance(channel, int) else channel.id
+    )
+    async with in_transaction() as connection:
+        if channel_id is None:
+            await connection.execute_query(_SEED_SQL.format(filter="WHERE TRUE"))
+            stats = PlayerLifetimeStats.all()
+        else:
+            await connection.execute_query(
+                _SEED_SQL.format(filter='WHERE "player"."channel_id" = $1'), [channel_id]
+            )
+            stats = PlayerLifetimeStats.filter(channel_id=channel_id)
+        # Changes committed before the lock are in the counts below, later ones wait for it
+        # and add to the rebuilt counters.
+        rows = await stats.select_for_update().using_db(connection)
+        if channel_id is None:
+            await connection.execute_query(_REBUILD_SQL.format(filter=""))
+        else:
+            await connection.execute_query(
+                _REBUILD_SQL.format(filter='WHERE "playerlifetimestats"."channel_id" = $1'),
+                [channel_id],
+            )
+    return len(rows)
@@ -238,6 +238,60 @@ class Points(Model):
     points = fields.IntField(default=0)
     new_guid_id = fields.UUIDField(null=True)
 
+    class Meta:
+        unique_together = (("player", "season", "channel"),)
+        indexes = (("channel", "season", "points"), ("channel", "season", "clan", "points"))
+
+
+class ClanStanding(Model):
+    """
+    Clan points totals per season and channel.
+
+    Kept by the points ledger in the same transaction as the points and reconciled against
+    Points by reconcile_standings(). Player points and ranks are not copied here: a player's
+    season total is already one indexed Points row, and ranks come from the in-memory
+    leaderboard index (app.leaderboard), which is warmed for the active seasons at startup and
+    loads any other season from Points when it is first read.
+    """
+
+    id = fields.IntField(pk=True)
+    season: ForeignKeyRelation[Season] = fields.ForeignKeyField(
+        "models.Season", related_name="clan_standings"
+    )
+    channel = fields.ForeignKeyField("models.Channel", related_name="clan_standings")
+    clan: ForeignKeyRelation[Clan] = fields.ForeignKeyField("models.Clan", related_name="standings")
+    points = fields.IntField(default=0)
+    new_guid_id = fields.UUIDField(null=True)
+
+    class Meta:
+        unique_together = (("season", "channel", "clan"),)
+
+
+class PlayerLifetimeStats(Model):
+    id = fields.IntField(pk=True)
+    player: ForeignKeyRelation[Player] = fields.ForeignKeyField(
+        "models.Player", related_name="lifetime_stats"
+    )
+    channel = fields.ForeignKeyField("models.Channel", related_name="player_lifetime_stats")
+    points = fields.IntField(default=0)
+    checkins = fields.IntField(default=0)
+    raid_checkins = fields.IntField(default=0)
+    sentry_checkins = fields.IntField(default=0)
+    claims = fields.IntField(default=0)
+    new_guid_id = fields.UUIDField(null=True)
+
+    class Meta:
+        unique_together = (("player", "channel"),)
+        indexes = (("channel", "points"), ("channel", "checkins"), ("channel", "raid_checkins"))
+
+
+# The last journal sequence number the points write-behind buffer has written to Points,
+# updated in the same transaction as the points, so a replayed journal skips what it wrote.
+class PointsJournal(Model):
+    id = fields.IntField(pk=True)
+    name = fields.CharField(max_length=255, unique=True)
+    applied_seq = fields.BigIntField(default=0)
+
 
 class EventSubscriptions(Model):
     id = fields.IntField(pk=True)
@@ -1,6 +1,7 @@
 from discord.ext import commands as discord_commands
 from twitchio.ext import commands
 
+from app.cache import cached_channel, invalidate_channels
 from app.models import Channel
 
 
@@ -17,7 +18,7 @@ class BomBroadcasterCommandsCog(commands.Cog):
         """
         ?registerchannel command
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
+        if await cached_channel(ctx.channel.name):
             await ctx.send("This channel has already been registered.")
         else:
             channel = await ctx.channel.user()
@@ -30,6 +31,7 @@ class BomBroadcasterCommandsCog(commands.Cog):
                     discord_server_id=discord_server_id,
                     twitch_channel_id=channel_id,
                 )
+            invalidate_channels()
             await ctx.send("This channel has been registered.")
 
     @commands.command()
@@ -37,10 +39,11 @@ class BomBroadcasterCommandsCog(commands.Cog):
         """
         ?registerdiscordserver command
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
             channel.discord_server_id = discord_server_id
             await channel.save()
+            invalidate_channels()
             await ctx.send("This channel has been registered.")
         else:
             await ctx.send("This channel has not been registered yet.")
@@ -3,20 +3,21 @@ from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, List, TypedDict
 
 from discord.ext import commands as discord_commands
-from tortoise.functions import Sum
 from twitchio.ext import commands
 
+from app.cache import cached_active_season, cached_channel, cached_clan, player_cache, session_state
+from app.leaderboard import player_rank, top_players
+from app.ledger import award_points
+from app.lifetime import record_activity
 from app.models import (
-    Channel,
     Checkin,
-    Clan,
     ClanSpoilsClaim,
     ClanSpoilsSession,
     FollowerGiveaway,
     FollowerGiveawayEntry,
     FollowerGiveawayPrize,
     GiftedSubsLeaderboard,
-    Player,
+    PlayerLifetimeStats,
     PlayerWatchTime,
     Points,
     RaidCheckin,
@@ -28,6 +29,7 @@ from app.models import (
     SpoilsClaim,
     SpoilsSession,
 )
+from app.standings import clan_standings
 
 if TYPE_CHECKING:
     from bot import DiscordBot, TwitchBot
@@ -36,12 +38,6 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-class Standings(TypedDict):
-    name: str
-    points: int
-    tag: str
-
-
 class PlayerStandings(TypedDict):
     name: str
     points: int
@@ -65,8 +61,8 @@ class BomCommandsCog(commands.Cog):
 
         Display the top 10 leaderboard for gifted subs.
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
             leaderboard: List[GiftedSubsLeaderboard] = []
             for player_row in await GiftedSubsLeaderboard.filter(channel=channel):
                 player_object = await player_row.player.get()
@@ -91,30 +87,16 @@ class BomCommandsCog(commands.Cog):
 
         Display the top 10 players in the clan for the current season.
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                season = await Season.active_seasons.all().filter(channel=channel).first()
-                if await Clan.get_or_none(tag=clanname, channel=channel):
-                    clan = await Clan.get(tag=clanname, channel=channel)
-                    standings: List[PlayerStandings] = []
-                    for points_row in await Points.filter(
-                        season=season, clan=clan, channel=channel
-                    ):
-                        player = await points_row.player.get()
-                        player_standings: PlayerStandings = {
-                            "points": points_row.points,
-                            "name": player.name,
-                            "clantag": clan.tag,
-                        }
-                        standings.append(player_standings)
-                    sorted_standings = sorted(standings, key=lambda k: k["points"], reverse=True)
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
+            season = await cached_active_season(channel)
+            if season:
+                clan = await cached_clan(channel, clanname)
+                if clan:
                     await ctx.send(f"BOM | {season.name}:")
-                    count = 0
-                    for result in sorted_standings[:10]:
-                        count += 1
+                    for result in await top_players(channel, season, limit=10, clan=clan):
                         await ctx.send(
-                            f"{count}. [{result['clantag']}] {result['name']} - {result['points']}"
+                            f"{result['clan_rank']}. [{result['clantag']}] {result['name']} - {result['points']}"
                         )
                 else:
                     await ctx.send(f"Clan {clanname} does not exist.")
@@ -128,21 +110,11 @@ class BomCommandsCog(commands.Cog):
         """
         ?standings command
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                season = await Season.active_seasons.all().filter(channel=channel).first()
-                standings: List[Standings] = []
-                for clan in await Clan.all().filter(channel=channel):
-                    clan_standings: Standings = {
-                        "points": 0,
-                        "name": clan.name,
-                        "tag": clan.tag,
-                    }
-                    for points in await Points.filter(season=season, clan=clan, channel=channel):
-                        clan_standings["points"] += points.points
-                    standings.append(clan_standings)
-                sorted_standings = sorted(standings, key=lambda k: k["points"], reverse=True)
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
+            season = await cached_active_season(channel)
+            if season:
+                sorted_standings = await clan_standings(channel, season)
                 await ctx.send(f"BOM | {season.name}:")
                 count = 0
                 for result in sorted_standings:
@@ -160,27 +132,14 @@ class BomCommandsCog(commands.Cog):
         """
         ?overallrank command
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                season = await Season.active_seasons.all().filter(channel=channel).first()
-                standings: List[PlayerStandings] = []
-                for points_row in await Points.filter(season=season, channel=channel):
-                    player = await points_row.player.get()
-                    assert player.clan is not None
-                    player_standings: PlayerStandings = {
-                        "points": points_row.points,
-                        "name": player.name,
-                        "clantag": (await player.clan.get()).tag,
-                    }
-                    standings.append(player_standings)
-                sorted_standings = sorted(standings, key=lambda k: k["points"], reverse=True)
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
+            season = await cached_active_season(channel)
+            if season:
                 await ctx.send(f"BOM | {season.name}:")
-                count = 0
-                for result in sorted_standings[:10]:
-                    count += 1
+                for result in await top_players(channel, season, limit=10):
                     await ctx.send(
-                        f"{count}. [{result['clantag']}] {result['name']} - {result['points']}"
+                        f"{result['rank']}. [{result['clantag']}] {result['name']} - {result['points']}"
                     )
             else:
                 await ctx.send("No active seasons!")
@@ -194,96 +153,27 @@ class BomCommandsCog(commands.Cog):
 
         Display current season points, lifetime points, current season rank in clan and overall rank for current season.
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                if await Player.get_or_none(name=ctx.author.name.lower(), channel=channel):
-                    player = await Player.get(name=ctx.author.name.lower(), channel=channel)
-                    active_season = (
-                        await Season.active_seasons.all().filter(channel=channel).first()
-                    )
-                    assert player.clan is not None
-                    if await player.clan.get() is None:
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
+            active_season = await cached_active_season(channel)
+            if active_season:
+                player = await player_cache.get(channel, ctx.author.name)
+                if player:
+                    if player.clan_id is None:
                         await ctx.send("You are not in a clan.")
                     else:
-                        clan = await player.clan.get()
-                        if await Points.get_or_none(
-                            player=player, season=active_season, channel=channel
-                        ):
-                            current_season_points = (
-                                await Points.get(
-                                    player=player, season=active_season, channel=channel
-                                )
-                            ).points
-                        else:
-                            current_season_points = 0
-                        if await Player.get_or_none(name=player.name, channel=channel):
-                            lifetime_points = (
-                                await Points.get(player=player, channel=channel)
-                                .annotate(sum=Sum("points"))
-                                .values_list("sum")
-                            )[0]
-                            print(lifetime_points)
-                        else:
-                            lifetime_points = 0
-
-                        if await Points.get_or_none(
-                            player=player, season=active_season, channel=channel
-                        ):
-                            standings: List[PlayerStandings] = []
-                            for points_row in await Points.filter(
-                                season=active_season, channel=channel
-                            ):
-                                player = await points_row.player.get()
-                                assert player.clan is not None
-                                player_standings: PlayerStandings = {
-                                    "points": points_row.points,
-                                    "name": player.name,
-                                    "clantag": (await player.clan.get()).tag,
-                                }
-                                standings.append(player_standings)
-                            sorted_standings = sorted(
-                                standings, key=lambda k: k["points"], reverse=True
-                            )
-                            count = 0
-                            for result in sorted_standings:
-                                count += 1
-                                if result["name"] == ctx.author.name.lower():
-                                    current_season_overall_rank = count
-                                    break
-                        else:
-                            current_season_overall_rank = 0
-
-                        if await Points.get_or_none(
-                            player=player, season=active_season, channel=channel
-                        ):
-                            clan_standings: List[PlayerStandings] = []
-                            for points_row in await Points.filter(
-                                season=active_season, clan=clan, channel=channel
-                            ):
-                                player = await points_row.player.get()
-                                assert player.clan is not None
-                                clan_player_standings: PlayerStandings = {
-                                    "points": points_row.points,
-                                    "name": player.name,
-                                    "clantag": (await player.clan.get()).tag,
-                                }
-                                clan_standings.append(clan_player_standings)
-                            clan_sorted_standings = sorted(
-                                clan_standings, key=lambda k: k["points"], reverse=True
-                            )
-                            count = 0
-                            for result in clan_sorted_standings:
-                                count += 1
-                                if result["name"] == ctx.author.name.lower():
-                                    current_season_clan_rank = count
-                                    break
-                        else:
-                            current_season_clan_rank = 0
+                        ranked = await player_rank(channel, active_season, player.id)
+                        current_season_points = ranked["points"] if ranked else 0
+                        lifetime = await PlayerLifetimeStats.get_or_none(
+                            player_id=player.id, channel=channel
+                        )
+                        lifetime_points = lifetime.points if lifetime else 0
+                        current_season_overall_rank = ranked["rank"] if ranked else 0
+                        current_season_clan_rank = ranked["clan_rank"] if ranked else 0
 
-                        await ctx.send(f"{ctx.author.name.lower()} [{clan.tag}]:")
+                        await ctx.send(f"{ctx.author.name.lower()} [{player.clan_tag}]:")
                         await ctx.send(f"Current season points: {current_season_points}")
-                        await ctx.send(f"{clan.tag} rank: {current_season_clan_rank}")
+                        await ctx.send(f"{player.clan_tag} rank: {current_season_clan_rank}")
                         await ctx.send(f"Overall rank: {current_season_overall_rank}")
                         await ctx.send(f"Lifetime points: {lifetime_points}")
                 else:
@@ -298,10 +188,10 @@ class BomCommandsCog(commands.Cog):
         """
         ?dates command
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                season = await Season.active_seasons.all().filter(channel=channel).first()
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
+            season = await cached_active_season(channel)
+            if season:
                 start_date = season.start_date.strftime("%d/%m/%Y")
                 if season.info_end_date == None:
                     await ctx.send(
@@ -322,8 +212,8 @@ class BomCommandsCog(commands.Cog):
         """
         ?mvp command
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
             if await Season.all().filter(channel=channel).exists():
                 previous_season = (
                     await Season.previous_seasons.filter(channel=channel)
@@ -356,17 +246,17 @@ class BomCommandsCog(commands.Cog):
         """
         ?checkin command
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                season = await Season.active_seasons.filter(channel=channel).first()
-                if await Session.active_session.all().filter(channel=channel).exists():
-                    session = await Session.active_session.filter(channel=channel).first()
-                    if await Player.get_or_none(name=ctx.author.name.lower(), channel=channel):
-                        player = await Player.get(name=ctx.author.name.lower(), channel=channel)
-                        if player.is_enabled() and player.clan:
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
+            season = await cached_active_season(channel)
+            if season:
+                session = await session_state.active(Session, channel)
+                if session:
+                    player = await player_cache.get(channel, ctx.author.name)
+                    if player:
+                        if player.is_enabled() and player.clan_id:
                             if await Checkin.get_or_none(
-                                player=player, session=session, channel=channel
+                                player_id=player.id, session=session, channel=channel
                             ):
                                 await ctx.send(
                                     f"@{ctx.author.name.lower()} has already checked in!"
@@ -404,39 +294,21 @@ class BomCommandsCog(commands.Cog):
                                 else:
                                     points_to_give = 100
 
-                                await Checkin.create(
-                                    player=player, session=session, channel=channel
+                                user_lifetime_checkins = await record_activity(
+                                    Checkin, player.id, channel.id, session=session
                                 )
-                                clan = await player.clan.get()
 
-                                if await Points.get_or_none(
-                                    player=player, season=season, channel=channel
-                                ):
-                                    points = await Points.get(
-                                        player=player, season=season, channel=channel
-                                    )
-                                    points.points += points_to_give
-                                    await points.save()
-                                else:
-                                    assert player.clan is not None
-                                    await Points.create(
-                                        player_id=player.id,
-                                        season_id=season.id,
-                                        points=points_to_give,
-                                        clan_id=clan.id,
-                                        channel=channel,
-                                    )
+                                await award_points(
+                                    player.id, season.id, channel.id, player.clan_id, points_to_give
+                                )
 
-                                user_lifetime_checkins = await Checkin.filter(
-                                    player=player, channel=channel
-                                ).count()
                                 if player.nickname:
                                     await ctx.send(
-                                        f"@{ctx.author.name.lower()} ({player.nickname}) has checked in and earned {points_to_give} VP for the {clan.name.upper()}! HEIMDALL see's you watching! Total lifetime check-ins: ({user_lifetime_checkins})"
+                                        f"@{ctx.author.name.lower()} ({player.nickname}) has checked in and earned {points_to_give} VP for the {player.clan_name.upper()}! HEIMDALL see's you watching! Total lifetime check-ins: ({user_lifetime_checkins})"
                                     )
                                 else:
                                     await ctx.send(
-                                        f"@{ctx.author.name.lower()} has checked in and earned {points_to_give} VP for the {clan.name.upper()}! HEIMDALL see's you watching! Total lifetime check-ins: ({user_lifetime_checkins})"
+                                        f"@{ctx.author.name.lower()} has checked in and earned {points_to_give} VP for the {player.clan_name.upper()}! HEIMDALL see's you watching! Total lifetime check-ins: ({user_lifetime_checkins})"
                                     )
 
                                 discord_server = self.discord_bot.get_guild(
@@ -449,7 +321,7 @@ class BomCommandsCog(commands.Cog):
                                 )
 
                                 await discord_channel.send(
-                                    f"{ctx.author.name.lower()} has checked in for the {clan.name.upper()}! HEIMDALL see's them watching! Total lifetime check-ins: ({user_lifetime_checkins})"
+                                    f"{ctx.author.name.lower()} has checked in for the {player.clan_name.upper()}! HEIMDALL see's them watching! Total lifetime check-ins: ({user_lifetime_checkins})"
                                 )
                         else:
                             await ctx.send(f"@{ctx.author.name.lower()} is not in a Clan roster!")
@@ -467,43 +339,33 @@ class BomCommandsCog(commands.Cog):
         """
         ?raid command
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                season = await Season.active_seasons.filter(channel=channel).first()
-                if await RaidSession.active_session.all().filter(channel=channel).exists():
-                    session = await RaidSession.active_session.filter(channel=channel).first()
-                    if await Player.get_or_none(name=ctx.author.name.lower(), channel=channel):
-                        player = await Player.get(name=ctx.author.name.lower(), channel=channel)
-                        if player.is_enabled() and player.clan:
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
+            season = await cached_active_season(channel)
+            if season:
+                session = await session_state.active(RaidSession, channel)
+                if session:
+                    player = await player_cache.get(channel, ctx.author.name)
+                    if player:
+                        if player.is_enabled() and player.clan_id:
                             if await RaidCheckin.get_or_none(
-                                player=player, session=session, channel=channel
+                                player_id=player.id, session=session, channel=channel
                             ):
                                 await ctx.send(
                                     f"@{ctx.author.name.lower()} is already in the raid boat! vander60RAIDBOAT"
                                 )
                             else:
-                                await RaidCheckin.create(
-                                    player=player, session=session, channel=channel
+                                await record_activity(
+                                    RaidCheckin, player.id, channel.id, session=session
+                                )
+                                await award_points(
+                                    player.id,
+                                    season.id,
+                                    channel.id,
+                                    player.clan_id,
+                                    100,
+                                    initial_points=250,
                                 )
-                                clan = await player.clan.get()
-                                if await Points.get_or_none(
-                                    player=player, season=season, channel=channel
-                                ):
-                                    points = await Points.get(
-                                        player=player, season=season, channel=channel
-                                    )
-                                    points.points += 100
-                                    await points.save()
-                                else:
-                                    assert player.clan is not None
-                                    await Points.create(
-                                        player_id=player.id,
-                                        season_id=season.id,
-                                        points=250,
-                                        clan_id=clan.id,
-                                        channel=channel,
-                                    )
                                 await ctx.send(
                                     f"vander60RAIDBOAT Hej @{ctx.author.name.lower()}, welcome aboard! vander60RAIDBOAT We set sail soon so sharpen your weapons and get ready to row! vander60RAIDBOAT"
                                 )
@@ -531,21 +393,21 @@ class BomCommandsCog(commands.Cog):
         else:
             playername = playername.strip("@").lower()
 
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
             if await FollowerGiveaway.get_or_none(channel=channel, follower=playername):
                 follower_giveaway = await FollowerGiveaway.get(channel=channel, follower=playername)
                 # We need to check if the giveaway is still active by checking the end time.
                 if follower_giveaway.end_time > datetime.now(timezone.utc):
-                    if await Player.get_or_none(name=ctx.author.name.lower(), channel=channel):
-                        player = await Player.get(name=ctx.author.name.lower(), channel=channel)
+                    player = await player_cache.get(channel, ctx.author.name)
+                    if player:
                         if await FollowerGiveawayEntry.get_or_none(
-                            giveaway=follower_giveaway, player=player, channel=channel
+                            giveaway=follower_giveaway, player_id=player.id, channel=channel
                         ):
                             pass
                         else:
                             await FollowerGiveawayEntry.create(
-                                giveaway=follower_giveaway, player=player, channel=channel
+                                giveaway=follower_giveaway, player_id=player.id, channel=channel
                             )
                             await ctx.send(f"@{ctx.author.name.lower()} is searching...")
                     else:
@@ -562,41 +424,32 @@ class BomCommandsCog(commands.Cog):
         """
         ?claim command
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                season = await Season.active_seasons.filter(channel=channel).first()
-                if await SpoilsSession.active_session.all().filter(channel=channel).exists():
-                    session = await SpoilsSession.active_session.filter(channel=channel).first()
-                    if await Player.get_or_none(name=ctx.author.name.lower(), channel=channel):
-                        player = await Player.get(name=ctx.author.name.lower(), channel=channel)
-                        if player.is_enabled() and player.clan:
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
+            season = await cached_active_season(channel)
+            if season:
+                session = await session_state.active(SpoilsSession, channel)
+                if session:
+                    player = await player_cache.get(channel, ctx.author.name)
+                    if player:
+                        if player.is_enabled() and player.clan_id:
                             if await SpoilsClaim.get_or_none(
-                                player=player, channel=channel, spoils_session=session
+                                player_id=player.id, channel=channel, spoils_session=session
                             ):
                                 await ctx.send(
                                     f"@{ctx.author.name.lower()} has already claimed the spoils!"
                                 )
                             else:
-                                await SpoilsClaim.create(
-                                    player=player, channel=channel, spoils_session=session
+                                await record_activity(
+                                    SpoilsClaim, player.id, channel.id, spoils_session=session
+                                )
+                                await award_points(
+                                    player.id,
+                                    season.id,
+                                    channel.id,
+                                    player.clan_id,
+                                    session.points_reward,
                                 )
-                                if await Points.get_or_none(
-                                    player=player, season=season, channel=channel
-                                ):
-                                    points = await Points.get(
-                                        player=player, season=season, channel=channel
-                                    )
-                                    points.points += session.points_reward
-                                    await points.save()
-                                else:
-                                    await Points.create(
-                                        player_id=player.id,
-                                        season_id=season.id,
-                                        points=session.points_reward,
-                                        clan_id=0,
-                                        channel=channel,
-                                    )
                                 await ctx.send(
                                     f"Thank you, @{ctx.author.name.lower()} for your aid on the battlefield! ⚔️ You have claimed ({session.points_reward}) Valor Points!"
                                 )
@@ -624,50 +477,36 @@ class BomCommandsCog(commands.Cog):
         ## 4. If the user is registered.
         ## 5. If the user has not claimed the spoils yet.
 
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                season = await Season.active_seasons.filter(channel=channel).first()
-                if await Player.get_or_none(name=ctx.author.name.lower(), channel=channel):
-                    player = await Player.get(name=ctx.author.name.lower(), channel=channel)
-                    if player.is_enabled() and player.clan:
-                        clan = await player.clan.get()
-                        if (
-                            await ClanSpoilsSession.active_sessions.all()
-                            .filter(channel=channel, clan=clan)
-                            .exists()
-                        ):
-                            session = await ClanSpoilsSession.active_sessions.filter(
-                                channel=channel, clan=clan
-                            ).first()
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
+            season = await cached_active_season(channel)
+            if season:
+                player = await player_cache.get(channel, ctx.author.name)
+                if player:
+                    if player.is_enabled() and player.clan_id:
+                        session = await session_state.active(
+                            ClanSpoilsSession, channel, player.clan_id
+                        )
+                        if session:
                             if await ClanSpoilsClaim.get_or_none(
-                                player=player, channel=channel, spoils_session=session
+                                player_id=player.id, channel=channel, spoils_session=session
                             ):
                                 await ctx.send(
                                     f"@{ctx.author.name.lower()} has already claimed the spoils!"
                                 )
                             else:
-                                await ClanSpoilsClaim.create(
-                                    player=player, channel=channel, spoils_session=session
+                                await record_activity(
+                                    ClanSpoilsClaim, player.id, channel.id, spoils_session=session
+                                )
+                                await award_points(
+                                    player.id,
+                                    season.id,
+                                    channel.id,
+                                    player.clan_id,
+                                    session.points_reward,
                                 )
-                                if await Points.get_or_none(
-                                    player=player, season=season, channel=channel
-                                ):
-                                    points = await Points.get(
-                                        player=player, season=season, channel=channel
-                                    )
-                                    points.points += session.points_reward
-                                    await points.save()
-                                else:
-                                    await Points.create(
-                                        player_id=player.id,
-                                        season_id=season.id,
-                                        points=session.points_reward,
-                                        clan_id=clan.id,
-                                        channel=channel,
-                                    )
                                 await ctx.send(
-                                    f"Thank you, @{ctx.author.name.lower()} for your aid on the battlefield! ⚔️ You have claimed ({session.points_reward}) Valor Points for {clan.name.upper()}!"
+                                    f"Thank you, @{ctx.author.name.lower()} for your aid on the battlefield! ⚔️ You have claimed ({session.points_reward}) Valor Points for {player.clan_name.upper()}!"
                                 )
                         else:
                             await ctx.send(
@@ -687,48 +526,33 @@ class BomCommandsCog(commands.Cog):
         """
         ?sentry command
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                season = await Season.active_seasons.filter(channel=channel).first()
-                if await SentrySession.active_session.all().filter(channel=channel).exists():
-                    session = await SentrySession.active_session.filter(channel=channel).first()
-                    if await Player.get_or_none(name=ctx.author.name.lower(), channel=channel):
-                        player = await Player.get(name=ctx.author.name.lower(), channel=channel)
-                        if player.is_enabled() and player.clan:
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
+            season = await cached_active_season(channel)
+            if season:
+                session = await session_state.active(SentrySession, channel)
+                if session:
+                    player = await player_cache.get(channel, ctx.author.name)
+                    if player:
+                        if player.is_enabled() and player.clan_id:
                             if await SentryCheckin.get_or_none(
-                                player=player, session=session, channel=channel
+                                player_id=player.id, session=session, channel=channel
                             ):
                                 # The user has already checked in for the sentry session
                                 pass
                             else:
-                                await SentryCheckin.create(
-                                    player=player, session=session, channel=channel
+                                await record_activity(
+                                    SentryCheckin, player.id, channel.id, session=session
+                                )
+                                await award_points(
+                                    player.id, season.id, channel.id, player.clan_id, 25
                                 )
-                                clan = await player.clan.get()
-                                if await Points.get_or_none(
-                                    player=player, season=season, channel=channel
-                                ):
-                                    points = await Points.get(
-                                        player=player, season=season, channel=channel
-                                    )
-                                    points.points += 25
-                                    await points.save()
-                                else:
-                                    assert player.clan is not None
-                                    await Points.create(
-                                        player_id=player.id,
-                                        season_id=season.id,
-                                        points=25,
-                                        clan_id=clan.id,
-                                        channel=channel,
-                                    )
 
                                 if await PlayerWatchTime.get_or_none(
-                                    player=player, channel=channel, season=season
+                                    player_id=player.id, channel=channel, season=season
                                 ):
                                     watchtime = await PlayerWatchTime.get(
-                                        player=player, channel=channel, season=season
+                                        player_id=player.id, channel=channel, season=season
                                     )
                                     watchtime.watch_time += 30
                                     await watchtime.save()
@@ -767,104 +591,28 @@ class BomCommandsCog(commands.Cog):
 
         Display current season points, lifetime points, current season rank in clan and overall rank for current season, checkins, raids, sentry time in hours and gift subs.
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                if await Player.get_or_none(name=ctx.author.name.lower(), channel=channel):
-                    player = await Player.get(name=ctx.author.name.lower(), channel=channel)
-                    actual_player_object = await Player.get(
-                        name=ctx.author.name.lower(), channel=channel
-                    )
-                    active_season = (
-                        await Season.active_seasons.all().filter(channel=channel).first()
-                    )
-                    assert player.clan is not None
-                    if await player.clan.get() is None:
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
+            active_season = await cached_active_season(channel)
+            if active_season:
+                player = await player_cache.get(channel, ctx.author.name)
+                if player:
+                    if player.clan_id is None:
                         await ctx.send("You are not in a clan.")
                     else:
-                        clan = await player.clan.get()
-                        if await Points.get_or_none(
-                            player=player, season=active_season, channel=channel
-                        ):
-                            current_season_points = (
-                                await Points.get(
-                                    player=player, season=active_season, channel=channel
-                                )
-                            ).points
-                        else:
-                            current_season_points = 0
-                        if await Player.get_or_none(name=player.name, channel=channel):
-                            lifetime_points = (
-                                await Points.get(player=player, channel=channel)
-                                .annotate(sum=Sum("points"))
-                                .values_list("sum")
-                            )[0]
-                            print(lifetime_points)
-                        else:
-                            lifetime_points = 0
-
-                        if await Points.get_or_none(
-                            player=player, season=active_season, channel=channel
-                        ):
-                            standings: List[PlayerStandings] = []
-                            for points_row in await Points.filter(
-                                season=active_season, channel=channel
-                            ):
-                                player = await points_row.player.get()
-                                assert player.clan is not None
-                                player_standings: PlayerStandings = {
-                                    "points": points_row.points,
-                                    "name": player.name,
-                                    "clantag": (await player.clan.get()).tag,
-                                }
-                                standings.append(player_standings)
-                            sorted_standings = sorted(
-                                standings, key=lambda k: k["points"], reverse=True
-                            )
-                            count = 0
-                            for result in sorted_standings:
-                                count += 1
-                                if result["name"] == ctx.author.name.lower():
-                                    current_season_overall_rank = count
-                                    break
-                        else:
-                            current_season_overall_rank = 0
+                        ranked = await player_rank(channel, active_season, player.id)
+                        current_season_points = ranked["points"] if ranked else 0
+                        lifetime = await PlayerLifetimeStats.get_or_none(
+                            player_id=player.id, channel=channel
+                        )
+                        lifetime_points = lifetime.points if lifetime else 0
+                        current_season_overall_rank = ranked["rank"] if ranked else 0
+                        current_season_clan_rank = ranked["clan_rank"] if ranked else 0
 
-                        if await Points.get_or_none(
-                            player=player, season=active_season, channel=channel
-                        ):
-                            clan_standings: List[PlayerStandings] = []
-                            for points_row in await Points.filter(
-                                season=active_season, clan=clan, channel=channel
-                            ):
-                                player = await points_row.player.get()
-                                assert player.clan is not None
-                                clan_player_standings: PlayerStandings = {
-                                    "points": points_row.points,
-                                    "name": player.name,
-                                    "clantag": (await player.clan.get()).tag,
-                                }
-                                clan_standings.append(clan_player_standings)
-                            clan_sorted_standings = sorted(
-                                clan_standings, key=lambda k: k["points"], reverse=True
-                            )
-                            count = 0
-                            for result in clan_sorted_standings:
-                                count += 1
-                                if result["name"] == ctx.author.name.lower():
-                                    current_season_clan_rank = count
-                                    break
-                        else:
-                            current_season_clan_rank = 0
-
-                        checkins = await Checkin.filter(
-                            player=actual_player_object, channel=channel
-                        ).count()
-                        raids = await RaidCheckin.filter(
-                            player=actual_player_object, channel=channel
-                        ).count()
+                        checkins = lifetime.checkins if lifetime else 0
+                        raids = lifetime.raid_checkins if lifetime else 0
                         sentry_watchtimes = await PlayerWatchTime.filter(
-                            player=actual_player_object, channel=channel, season=active_season
+                            player_id=player.id, channel=channel, season=active_season
                         ).values_list("watch_time")
                         total_sentry_watchtime = 0
                         for watchtime in sentry_watchtimes:
@@ -877,18 +625,18 @@ class BomCommandsCog(commands.Cog):
                         )
 
                         if await GiftedSubsLeaderboard.get_or_none(
-                            player=actual_player_object, channel=channel
+                            player_id=player.id, channel=channel
                         ):
                             gifted_subs = (
                                 await GiftedSubsLeaderboard.get(
-                                    player=actual_player_object, channel=channel
+                                    player_id=player.id, channel=channel
                                 )
                             ).gifted_subs
                         else:
                             gifted_subs = 0
 
                         await ctx.send(
-                            f"{clan.twitch_emoji_name} [{clan.tag}] {actual_player_object.name.upper()} (RANKS - CLAN: {current_season_clan_rank} | OVERALL: {current_season_overall_rank}) | SEASON VP: {current_season_points} | LIFETIME VP: {lifetime_points} | CHECKINS: {checkins} | RAIDS: {raids} | ?SENTRY TIME: {total_sentry_watchtime_hours}hrs | GIFTED SUBS: {gifted_subs} {clan.twitch_emoji_name}"
+                            f"{player.clan_emoji} [{player.clan_tag}] {player.name.upper()} (RANKS - CLAN: {current_season_clan_rank} | OVERALL: {current_season_overall_rank}) | SEASON VP: {current_season_points} | LIFETIME VP: {lifetime_points} | CHECKINS: {checkins} | RAIDS: {raids} | ?SENTRY TIME: {total_sentry_watchtime_hours}hrs | GIFTED SUBS: {gifted_subs} {player.clan_emoji}"
                         )
                 else:
                     await ctx.send("You are not registered.")
@@ -6,13 +6,22 @@ from discord.ext import commands as discord_commands
 from tortoise import timezone
 from twitchio.ext import commands
 
+from app.cache import (
+    cached_active_season,
+    cached_channel,
+    cached_clan,
+    cached_clans,
+    invalidate_active_season,
+    invalidate_clans,
+    player_cache,
+    session_state,
+)
 from app.helpers import date_validate
+from app.ledger import award_points, award_raid_bonus, remove_points
 from app.models import (
-    Channel,
     Clan,
     ClanSpoilsSession,
     Player,
-    Points,
     RaidCheckin,
     RaidSession,
     RewardLevel,
@@ -39,12 +48,10 @@ class BomModCommandsCog(commands.Cog):
 
         Check how many people have checked in for the current raid session.
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
-            if await RaidSession.active_session.all().filter(channel=channel).exists():
-                raid_session = (
-                    await RaidSession.active_session.all().filter(channel=channel).first()
-                )
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
+            raid_session = await session_state.active(RaidSession, channel)
+            if raid_session:
                 checkins = await RaidCheckin.all().filter(session=raid_session)
                 await ctx.send(
                     f"{len(checkins)} vikings have got in the boats for the raid! vander60RAIDBOAT Use ?raid to get in the boats and earn your Tag of Ægir! Get ready to row! 🚣🚣🚣"
@@ -78,24 +85,26 @@ class BomModCommandsCog(commands.Cog):
 
         playername = playername.strip("@")
 
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
-            if await Clan.get_or_none(tag=clantag, channel=channel):
-                clan = await Clan.get(tag=clantag, channel=channel)
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
+            clan = await cached_clan(channel, clantag)
+            if clan:
                 if await Player.get_or_none(name=playername.lower(), channel=channel):
-                    if await Season.active_seasons.all().filter(channel=channel).exists():
+                    if await cached_active_season(channel):
                         await ctx.send("Cannot move players between clans during an active season.")
                     else:
                         player = await Player.get(name=playername.lower(), channel=channel)
                         if player.is_enabled():
                             player.clan = clan
                             await player.save()
+                            player_cache.invalidate(channel, playername)
                             await ctx.send(
                                 f"Welcome @{playername.lower()} to the [{clan.tag}] {clan.name} Clan roster!"
                             )
                         else:
                             player.clan = clan
                             await player.save()
+                            player_cache.invalidate(channel, playername)
                             await ctx.send(
                                 f"Welcome @{playername.lower()} to the [{clan.tag}] {clan.name} Clan roster!"
                             )
@@ -103,6 +112,7 @@ class BomModCommandsCog(commands.Cog):
                     await Player.create(
                         name=playername.lower(), clan=clan, enabled=True, channel=channel
                     )
+                    player_cache.invalidate(channel, playername)
                     await ctx.send(
                         f"Welcome @{playername.lower()} to the [{clan.tag}] {clan.name} Clan roster!"
                     )
@@ -119,14 +129,15 @@ class BomModCommandsCog(commands.Cog):
 
         playername = playername.strip("@")
 
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
             if await Player.get_or_none(name=playername.lower(), channel=channel):
                 player = await Player.get(name=playername.lower(), channel=channel)
                 if player.is_enabled():
                     player.clan = None
                     player.enabled = False
                     await player.save()
+                    player_cache.invalidate(channel, playername)
                     await ctx.send(f"Removed @{playername.lower()} from their clan!")
                 else:
                     await ctx.send(f"@{playername.lower()} is not in a Clan roster!")
@@ -143,33 +154,19 @@ class BomModCommandsCog(commands.Cog):
 
         playername = playername.strip("@")
 
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                season: Season = await Season.active_seasons.all().filter(channel=channel).first()
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
+            season: Season = await cached_active_season(channel)
+            if season:
                 if await Player.get_or_none(name=playername.lower(), channel=channel):
                     player = await Player.get(name=playername.lower(), channel=channel)
                     if player.is_enabled() and player.clan:
-                        clan = await player.clan.get()
-                        if await Points.get_or_none(player=player, season=season, channel=channel):
-                            points = await Points.get(player=player, season=season, channel=channel)
-                            points.points += newpoints
-                            await points.save()
-                            await ctx.send(
-                                f"Added {newpoints} valor points to @{playername.lower()} for the {season.name} season!"
-                            )
-                        else:
-                            assert player.clan is not None
-                            await Points.create(
-                                player_id=player.id,
-                                season_id=season.id,
-                                points=newpoints,
-                                clan_id=clan.id,
-                                channel=channel,
-                            )
-                            await ctx.send(
-                                f"Added {newpoints} valor points to @{playername.lower()} for the {season.name} season!"
-                            )
+                        await award_points(
+                            player.id, season.id, channel.id, player.clan_id, newpoints
+                        )
+                        await ctx.send(
+                            f"Added {newpoints} valor points to @{playername.lower()} for the {season.name} season!"
+                        )
                     else:
                         await ctx.send(f"@{playername.lower()} is not in a Clan roster!")
                 else:
@@ -187,21 +184,17 @@ class BomModCommandsCog(commands.Cog):
 
         playername = playername.strip("@")
 
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                season: Season = await Season.active_seasons.all().filter(channel=channel).first()
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
+            season: Season = await cached_active_season(channel)
+            if season:
                 if await Player.get_or_none(name=playername.lower(), channel=channel):
                     player = await Player.get(name=playername.lower(), channel=channel)
                     if player.is_enabled() and player.clan:
-                        if await Points.get_or_none(player=player, season=season, channel=channel):
-                            points = await Points.get(player=player, season=season, channel=channel)
-                            newpoints = points.points - losepoints
-                            if newpoints <= 0:
-                                points.points = 0
-                            else:
-                                points.points -= losepoints
-                            await points.save()
+                        if (
+                            await remove_points(player.id, season.id, channel.id, losepoints)
+                            is not None
+                        ):
                             await ctx.send(
                                 f"Removed {losepoints} valor points from @{playername.lower()} for the {season.name} season!"
                             )
@@ -223,12 +216,13 @@ class BomModCommandsCog(commands.Cog):
         """
         ?startseason command
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
+            if await cached_active_season(channel):
                 await ctx.send("Battle of Midgard | A Season is already in progress.")
             else:
                 await Season.create(name=season_name, channel=channel)
+                invalidate_active_season(channel)
                 await ctx.send(f"Battle of Midgard | {season_name} has commenced! Good luck!")
         else:
             pass
@@ -238,18 +232,17 @@ class BomModCommandsCog(commands.Cog):
         """
         ?endseason command
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                if await Session.active_session.all().filter(channel=channel).exists():
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
+            active_season = await cached_active_season(channel)
+            if active_season:
+                if await session_state.active(Session, channel):
                     await ctx.send("Please end the current session first!")
                 else:
-                    active_season = (
-                        await Season.active_seasons.all().filter(channel=channel).first()
-                    )
                     await Season.active_seasons.all().filter(channel=channel).update(
                         end_date=timezone.now()
                     )
+                    invalidate_active_season(channel)
                     await ctx.send(
                         f"Battle of Midgard | {active_season.name} has ended. The results will be posted shortly! Thank you to everyone for a great season!"
                     )
@@ -263,16 +256,15 @@ class BomModCommandsCog(commands.Cog):
         """
         ?setdate command
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
             if await date_validate(enddate):
-                if await Season.active_seasons.all().filter(channel=channel).exists():
-                    active_season: Season = (
-                        await Season.active_seasons.all().filter(channel=channel).first()
-                    )
+                active_season: Season = await cached_active_season(channel)
+                if active_season:
                     date = datetime.strptime(enddate, "%d/%m/%Y")
                     date = timezone.make_aware(date)
                     await active_season.select_for_update().update(info_end_date=date)
+                    invalidate_active_season(channel)
                     await ctx.send(
                         f"Battle of Midgard | {active_season.name} will end on {enddate}."
                     )
@@ -288,21 +280,23 @@ class BomModCommandsCog(commands.Cog):
         """
         ?createclan command
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
             if len(clantag) <= 4:
-                if await Clan.get_or_none(tag=clantag, channel=channel):
-                    if await Clan.get_or_none(name=clanname, channel=channel):
+                name_taken = any(clan.name == clanname for clan in await cached_clans(channel))
+                if await cached_clan(channel, clantag):
+                    if name_taken:
                         await ctx.send(
                             f"A clan with the name {clanname} and tag {clantag} already exists."
                         )
                     else:
                         await ctx.send(f"A clan with the tag {clantag} already exists.")
                 else:
-                    if await Clan.get_or_none(name=clanname, channel=channel):
+                    if name_taken:
                         await ctx.send(f"A clan with the name {clanname} already exists.")
                     else:
                         await Clan.create(name=clanname, tag=clantag, channel=channel)
+                        invalidate_clans(channel)
                         await ctx.send(f"Clan {clanname} with tag {clantag} has been created.")
             else:
                 await ctx.send(f"Clan tag {clantag} is too long. It should be max 4 characters.")
@@ -319,22 +313,21 @@ class BomModCommandsCog(commands.Cog):
         logger.info("Spoils command.")
         logger.info(f"Valor points: {valor_points}")
 
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                active_season: Season = (
-                    await Season.active_seasons.all().filter(channel=channel).first()
-                )
-                if await SpoilsSession.active_session.all().filter(channel=channel).exists():
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
+            active_season: Season = await cached_active_season(channel)
+            if active_season:
+                if await session_state.active(SpoilsSession, channel):
                     logger.info("Spoils session exists.")
                 else:
                     end_time = timezone.now() + timedelta(minutes=3)
-                    await SpoilsSession.create(
+                    spoils_session = await SpoilsSession.create(
                         season=active_season,
                         channel=channel,
                         points_reward=valor_points,
                         end_time=end_time,
                     )
+                    session_state.started(spoils_session)
                     await ctx.send(
                         f"🏆 VANDERWOOD is VICTORIOUS! Use ?claim to collect your share of the spoils! You have 3 minutes ⏰"
                     )
@@ -352,25 +345,24 @@ class BomModCommandsCog(commands.Cog):
         logger.info(f"Clan tag: {clan_tag}")
         logger.info(f"Valor points: {valor_points}")
 
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                active_season: Season = (
-                    await Season.active_seasons.all().filter(channel=channel).first()
-                )
-                if await Clan.get_or_none(tag=clan_tag, channel=channel):
-                    clan = await Clan.get(tag=clan_tag, channel=channel)
-                    if await ClanSpoilsSession.active_sessions.all().filter(clan=clan).exists():
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
+            active_season: Season = await cached_active_season(channel)
+            if active_season:
+                clan = await cached_clan(channel, clan_tag)
+                if clan:
+                    if await session_state.active(ClanSpoilsSession, channel, clan):
                         logger.info("Clan spoils session exists.")
                     else:
                         end_time = timezone.now() + timedelta(minutes=3)
-                        await ClanSpoilsSession.create(
+                        clan_spoils_session = await ClanSpoilsSession.create(
                             season=active_season,
                             channel=channel,
                             clan=clan,
                             points_reward=valor_points,
                             end_time=end_time,
                         )
+                        session_state.started(clan_spoils_session)
                         await ctx.send(
                             f"{clan.twitch_emoji_name} The {clan.name.upper()} grow stronger! {clan.twitch_emoji_name} Use ?clanclaim to collect your share of the spoils! You have 3 minutes ⏰"
                         )
@@ -386,16 +378,15 @@ class BomModCommandsCog(commands.Cog):
         """
         ?startsession command
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                active_season: Season = (
-                    await Season.active_seasons.all().filter(channel=channel).first()
-                )
-                if await Session.active_session.all().filter(channel=channel).exists():
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
+            active_season: Season = await cached_active_season(channel)
+            if active_season:
+                if await session_state.active(Session, channel):
                     await ctx.send("A session is already in progress.")
                 else:
-                    await Session.create(season=active_season, channel=channel)
+                    session = await Session.create(season=active_season, channel=channel)
+                    session_state.started(session)
                     await ctx.send("A session has been created for the current season.")
 
                     discord_server = self.discord_bot.get_guild(
@@ -422,16 +413,15 @@ class BomModCommandsCog(commands.Cog):
         """
         ?startraid command
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                active_season: Season = (
-                    await Season.active_seasons.all().filter(channel=channel).first()
-                )
-                if await RaidSession.active_session.all().filter(channel=channel).exists():
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
+            active_season: Season = await cached_active_season(channel)
+            if active_season:
+                if await session_state.active(RaidSession, channel):
                     await ctx.send("A raid is already in progress.")
                 else:
-                    await RaidSession.create(season=active_season, channel=channel)
+                    raid_session = await RaidSession.create(season=active_season, channel=channel)
+                    session_state.started(raid_session)
                     await ctx.send(
                         "vander60RAIDBOAT The raiding party has begun! vander60RAIDBOAT Use ?raid to get in the boats and earn your Tag of Ægir! Get ready to row! 🚣🚣🚣"
                     )
@@ -445,16 +435,15 @@ class BomModCommandsCog(commands.Cog):
         """
         ?endsession command
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                active_season: Season = (
-                    await Season.active_seasons.all().filter(channel=channel).first()
-                )
-                if await Session.active_session.all().filter(channel=channel).exists():
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
+            active_season: Season = await cached_active_season(channel)
+            if active_season:
+                if await session_state.active(Session, channel):
                     await Session.active_session.all().filter(channel=channel).update(
                         end_time=timezone.now()
                     )
+                    session_state.ended(Session, channel)
                     await ctx.send("The current session has been ended.")
 
                     discord_server = self.discord_bot.get_guild(
@@ -482,13 +471,14 @@ class BomModCommandsCog(commands.Cog):
         """
         ?endraid command
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                if await RaidSession.active_session.all().filter(channel=channel).exists():
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
+            if await cached_active_season(channel):
+                if await session_state.active(RaidSession, channel):
                     await RaidSession.active_session.all().filter(channel=channel).update(
                         end_time=timezone.now()
                     )
+                    session_state.ended(RaidSession, channel)
                     await ctx.send("The raiding party is over!")
                 else:
                     await ctx.send("No raid is currently in progress.")
@@ -502,8 +492,8 @@ class BomModCommandsCog(commands.Cog):
         """
         ?addrewardlevel command
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
             if await RewardLevel.get_or_none(level=level, channel=channel):
                 await ctx.send(f"Reward level {level} already exists.")
             else:
@@ -517,8 +507,8 @@ class BomModCommandsCog(commands.Cog):
         """
         ?editrewardlevel command
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
             if await RewardLevel.get_or_none(level=level, channel=channel):
                 await (await RewardLevel.get(level=level, channel=channel)).update(reward=reward)
                 await ctx.send(f"Reward level {level} has been updated.")
@@ -532,8 +522,8 @@ class BomModCommandsCog(commands.Cog):
         """
         ?removerewardlevel command
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
             if await RewardLevel.get_or_none(level=level, channel=channel):
                 await (await RewardLevel.get(level=level, channel=channel)).delete()
                 await ctx.send(f"Reward level {level} has been deleted.")
@@ -549,8 +539,8 @@ class BomModCommandsCog(commands.Cog):
 
         This commands will post a message to the discord channel with the name of the winner of the wheel of hamingja.
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
 
             logger.info(f"Channel: {channel}")
             logger.info(f"Playername: {playername}")
@@ -592,34 +582,20 @@ class BomModCommandsCog(commands.Cog):
 
         Add the bonus points to everyone who is checked into the current raid session.
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
             logging.info(f"Channel exists: {channel}")
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                season: Season = await Season.active_seasons.all().filter(channel=channel).first()
+            season: Season = await cached_active_season(channel)
+            if season:
                 logging.info(f"Active season: {season}")
-                if await RaidSession.active_session.all().filter(channel=channel).exists():
+                raid_session = await session_state.active(RaidSession, channel)
+                if raid_session:
                     logging.info("Raid session exists.")
-                    raid_session = (
-                        await RaidSession.active_session.all().filter(channel=channel).first()
-                    )
                     logging.info(f"Raid session: {raid_session}")
-                    checkins = await RaidCheckin.all().filter(session=raid_session)
-                    logging.info(f"Checkins: {checkins}")
-                    for checkin in checkins:
-                        player = await checkin.player
-                        if await Points.get_or_none(player=player, season=season, channel=channel):
-                            points = await Points.get(player=player, season=season, channel=channel)
-                            points.points += bonuspoints
-                            await points.save()
-                        else:
-                            await Points.create(
-                                player_id=player.id,
-                                season_id=season.id,
-                                points=bonuspoints,
-                                clan_id=player.clan.id,
-                                channel=channel,
-                            )
+                    raiders = await award_raid_bonus(
+                        raid_session.id, season.id, channel.id, bonuspoints
+                    )
+                    logging.info(f"Raid bonus of {bonuspoints} awarded to {raiders} raiders.")
                     await ctx.send(
                         f"Congratulations Raiders! You've ALL earned a bonus {bonuspoints} VP for opening RAID CHESTS on RAID DAY! vander60SKAL"
                     )
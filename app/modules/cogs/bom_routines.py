@@ -5,17 +5,19 @@ import random
 from discord.ext import commands as discord_commands
 from twitchio.ext import commands, routines
 
+from app.cache import cached_active_season, session_state
+from app.leaderboard import leaderboard_index
+from app.ledger import award_points
 from app.models import (
     Channel,
     FollowerGiveaway,
     FollowerGiveawayEntry,
     FollowerGiveawayPrize,
     Player,
-    Points,
-    Season,
     SentrySession,
     Session,
 )
+from app.standings import reconcile_standings
 
 logger = logging.getLogger(__name__)
 
@@ -32,14 +34,12 @@ class BomRoutinesCog(commands.Cog):
         channels = await Channel.all()
 
         for channel in channels:
-            channel_object = await Channel.get(name=channel.name)
-            if await Season.active_seasons.all().filter(channel=channel_object).exists():
-                season = await Season.active_seasons.get(channel=channel_object)
-                if await Session.active_session.all().filter(channel=channel_object).exists():
-                    session = await Session.active_session.filter(channel=channel_object).first()
-                    if await SentrySession.active_session.filter(
-                        channel=channel_object, session=session
-                    ).exists():
+            season = await cached_active_season(channel)
+            if season:
+                session = await session_state.active(Session, channel)
+                if session:
+                    sentry_session = await session_state.active(SentrySession, channel)
+                    if sentry_session and sentry_session.session_id == session.id:
                         # Sentry session already exists so do nothing
                         pass
                     else:
@@ -47,15 +47,16 @@ class BomRoutinesCog(commands.Cog):
                         end_time = datetime.datetime.now(
                             tz=datetime.timezone.utc
                         ) + datetime.timedelta(minutes=5)
-                        await SentrySession.create(
-                            channel=channel_object,
+                        sentry_session = await SentrySession.create(
+                            channel=channel,
                             session=session,
                             end_time=end_time,
                             season=season,
                         )
+                        session_state.started(sentry_session)
                         message = f"vander60RAIDCHAMP VIKINGS!! vander60RAIDCHAMP We need YOU to keep watch over the WOODLANDS! Use ?sentry to keep VANDERHEIM safe and earn your TAG of ULLR! 🏹👁️"
-                        logger.info(f"Sending message to channel {channel_object.name}: {message}")
-                        await self.send_twitch_message(channel_object.name, message)
+                        logger.info(f"Sending message to channel {channel.name}: {message}")
+                        await self.send_twitch_message(channel.name, message)
                 else:
                     pass
             else:
@@ -72,10 +73,9 @@ class BomRoutinesCog(commands.Cog):
         channels = await Channel.all()
 
         for channel in channels:
-            channel_object = await Channel.get(name=channel.name)
-            if await Season.active_seasons.all().filter(channel=channel_object).exists():
-                season = await Season.active_seasons.get(channel=channel_object)
-                giveaways = await FollowerGiveaway.filter(channel=channel_object, winner=None)
+            season = await cached_active_season(channel)
+            if season:
+                giveaways = await FollowerGiveaway.filter(channel=channel, winner=None)
                 for giveaway in giveaways:
                     if giveaway.end_time <= datetime.datetime.now(tz=giveaway.end_time.tzinfo):
                         entries = await FollowerGiveawayEntry.filter(giveaway=giveaway)
@@ -85,36 +85,19 @@ class BomRoutinesCog(commands.Cog):
                             giveaway.winner = winner
                             await giveaway.save()
                             prize = random.choice(
-                                await FollowerGiveawayPrize.filter(channel=channel_object)
+                                await FollowerGiveawayPrize.filter(channel=channel)
                             )
-                            if await Points.filter(
-                                player=winner, channel=channel_object, season=season
-                            ).exists():
-                                points = await Points.get(
-                                    player=winner, channel=channel_object, season=season
-                                )
-                                points.points += prize.vp_reward
-                                await points.save()
-                            else:
-                                await Points.create(
-                                    player=winner,
-                                    channel=channel_object,
-                                    season=season,
-                                    points=prize.vp_reward,
-                                    clan=winner.clan,
-                                )
-                            message = f"@{winner.name} has searched @{giveaway.follower} and found: {prize.message} Thank you @{giveaway.follower}, you may now enter VANDERHEIM!"
-                            logger.info(
-                                f"Sending message to channel {channel_object.name}: {message}"
+                            await award_points(
+                                winner.id, season.id, channel.id, winner.clan_id, prize.vp_reward
                             )
-                            await self.send_twitch_message(channel_object.name, message)
+                            message = f"@{winner.name} has searched @{giveaway.follower} and found: {prize.message} Thank you @{giveaway.follower}, you may now enter VANDERHEIM!"
+                            logger.info(f"Sending message to channel {channel.name}: {message}")
+                            await self.send_twitch_message(channel.name, message)
                         else:
                             await FollowerGiveaway.filter(id=giveaway.id).delete()
                             message = f"{giveaway.follower} is on the loose in VANDERHEIM!"
-                            logger.info(
-                                f"Sending message to channel {channel_object.name}: {message}"
-                            )
-                            await self.send_twitch_message(channel_object.name, message)
+                            logger.info(f"Sending message to channel {channel.name}: {message}")
+                            await self.send_twitch_message(channel.name, message)
                     else:
                         pass
             else:
@@ -126,6 +109,25 @@ class BomRoutinesCog(commands.Cog):
     async def before_check_follower_giveaway_winners(self) -> None:
         await self.twitch_bot.wait_for_ready()
 
+    @routines.routine(minutes=15, wait_first=True)
+    async def check_clan_standings(self) -> None:
+        logger.info("Reconciling clan standings and leaderboards.")
+
+        for channel in await Channel.all():
+            season = await cached_active_season(channel)
+            if season:
+                corrected = await reconcile_standings(season)
+                if corrected:
+                    logger.warning(
+                        f"Corrected {corrected} clan standings in channel {channel.name}."
+                    )
+                # Also picks up renamed players and clans, and any total the index missed.
+                await leaderboard_index.warm(channel.id, season.id)
+
+    @check_clan_standings.before_routine
+    async def before_check_clan_standings(self) -> None:
+        await self.twitch_bot.wait_for_ready()
+
     async def send_twitch_message(self, channel_name: str, message: str) -> None:
         channel = self.twitch_bot.get_channel(channel_name)
         if channel:
@@ -140,3 +142,4 @@ def prepare(twitch_bot: commands.Bot, discord_bot: discord_commands.Bot) -> None
     twitch_bot.add_cog(cog)
     twitch_bot.check_follower_giveaways = cog.check_follower_giveaway_winners
     twitch_bot.start_sentry_session = cog.start_sentry_session
+    twitch_bot.check_clan_standings = cog.check_clan_standings
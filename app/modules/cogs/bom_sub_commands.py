@@ -4,7 +4,8 @@ from discord.ext import commands as discord_commands
 from tortoise.functions import Count
 from twitchio.ext import commands
 
-from app.models import Channel, Clan, Player
+from app.cache import cached_channel, cached_clans, player_cache
+from app.models import Clan, Player
 
 
 class BomSubCommandsCog(commands.Cog):
@@ -20,18 +21,16 @@ class BomSubCommandsCog(commands.Cog):
         """
         ?join command
         """
-        if await Channel.get_or_none(name=ctx.channel.name):
-            channel = await Channel.get(name=ctx.channel.name)
-            if await Clan.all().filter(channel=channel).count() == 0:
+        channel = await cached_channel(ctx.channel.name)
+        if channel:
+            if not await cached_clans(channel):
                 await ctx.send("No clans have been created yet.")
             else:
-                if await Player.filter(name=ctx.author.name.lower(), channel=channel).exists():
-                    player = await Player.get(name=ctx.author.name.lower(), channel=channel)
+                player = await player_cache.get(channel, ctx.author.name)
+                if player:
                     if player.is_enabled():
-                        clan = await Clan.get(id=player.clan_id)
-                        clan_details = await Clan.get(id=clan.id)
                         await ctx.send(
-                            f"Welcome @{ctx.author.name.lower()} to the [{clan_details.tag}] {clan_details.name} Clan roster!"
+                            f"Welcome @{ctx.author.name.lower()} to the [{player.clan_tag}] {player.clan_name} Clan roster!"
                         )
                     else:
                         await ctx.send(
@@ -52,6 +51,7 @@ class BomSubCommandsCog(commands.Cog):
                     await Player.create(
                         name=ctx.author.name.lower(), clan_id=new_clan, channel=channel
                     )
+                    player_cache.invalidate(channel, ctx.author.name)
                     clan_details = next(clan for clan in clan_totals if clan["id"] == new_clan)
                     print(clan_details)
                     await ctx.send(
@@ -4,20 +4,12 @@ from typing import TYPE_CHECKING, List, TypedDict
 import discord
 from discord import app_commands
 from discord.ext import commands
-from tortoise.functions import Sum
 from twitchio.ext import commands as twitch_commands
 
-from app.models import (
-    Channel,
-    Checkin,
-    Clan,
-    GiftedSubsLeaderboard,
-    Player,
-    PlayerWatchTime,
-    Points,
-    RaidCheckin,
-    Season,
-)
+from app.cache import cached_active_season, cached_channel_by_discord_id, cached_clan, cached_clans
+from app.leaderboard import top_players
+from app.models import GiftedSubsLeaderboard, Player, PlayerLifetimeStats, PlayerWatchTime
+from app.standings import clan_standings
 
 if TYPE_CHECKING:
     from bot import DiscordBot, TwitchBot
@@ -25,12 +17,6 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-class Standings(TypedDict):
-    name: str
-    points: int
-    tag: str
-
-
 class PlayerStandings(TypedDict):
     name: str
     points: int
@@ -66,21 +52,11 @@ class BasicCommandsCog(commands.Cog):
         """
         /standings command
         """
-        if await Channel.get_or_none(discord_server_id=interaction.guild.id):
-            channel = await Channel.get(discord_server_id=interaction.guild.id)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                season = await Season.active_seasons.all().filter(channel=channel).first()
-                standings: List[Standings] = []
-                for clan in await Clan.all().filter(channel=channel):
-                    clan_standings: Standings = {
-                        "points": 0,
-                        "name": clan.name,
-                        "tag": clan.tag,
-                    }
-                    for points in await Points.filter(season=season, clan=clan, channel=channel):
-                        clan_standings["points"] += points.points
-                    standings.append(clan_standings)
-                sorted_standings = sorted(standings, key=lambda k: k["points"], reverse=True)
+        channel = await cached_channel_by_discord_id(interaction.guild.id)
+        if channel:
+            season = await cached_active_season(channel)
+            if season:
+                sorted_standings = await clan_standings(channel, season)
 
                 embed = discord.Embed(title=f"Battle of Midgard Clan Standings | {season.name}:")
                 embed.timestamp = interaction.created_at
@@ -129,21 +105,17 @@ class BasicCommandsCog(commands.Cog):
         """
 
         # Each checkin is a separate row in the database, so we need to sum the checkins for each player.
-        if await Channel.get_or_none(discord_server_id=interaction.guild.id):
-            channel = await Channel.get(discord_server_id=interaction.guild.id)
-            standings: List[CheckinsStandings] = []
-
-            for player in await Player.all().filter(channel=channel):
-                no_of_checkins = await Checkin.all().filter(player=player).count()
-
-                if no_of_checkins is not None and no_of_checkins > 0:
-                    player_standings: CheckinsStandings = {
-                        "points": no_of_checkins,
-                        "name": player.name,
-                    }
-                    standings.append(player_standings)
-
-            sorted_standings = sorted(standings, key=lambda k: k["points"], reverse=True)
+        channel = await cached_channel_by_discord_id(interaction.guild.id)
+        if channel:
+            sorted_standings: List[CheckinsStandings] = [
+                {"points": no_of_checkins, "name": name}
+                for name, no_of_checkins in await PlayerLifetimeStats.filter(
+                    channel=channel, checkins__gt=0
+                )
+                .order_by("-checkins")
+                .limit(50)
+                .values_list("player__name", "checkins")
+            ]
 
             embed = discord.Embed(title=f"Checkin Leaderboard:")
             embed.timestamp = interaction.created_at
@@ -186,21 +158,17 @@ class BasicCommandsCog(commands.Cog):
         """
         /raid-checkin-leaderboard command
         """
-        if await Channel.get_or_none(discord_server_id=interaction.guild.id):
-            channel = await Channel.get(discord_server_id=interaction.guild.id)
-            standings: List[CheckinsStandings] = []
-
-            for player in await Player.all().filter(channel=channel):
-                no_of_checkins = await RaidCheckin.all().filter(player=player).count()
-
-                if no_of_checkins is not None and no_of_checkins > 0:
-                    player_standings: CheckinsStandings = {
-                        "points": no_of_checkins,
-                        "name": player.name,
-                    }
-                    standings.append(player_standings)
-
-            sorted_standings = sorted(standings, key=lambda k: k["points"], reverse=True)
+        channel = await cached_channel_by_discord_id(interaction.guild.id)
+        if channel:
+            sorted_standings: List[CheckinsStandings] = [
+                {"points": no_of_checkins, "name": name}
+                for name, no_of_checkins in await PlayerLifetimeStats.filter(
+                    channel=channel, raid_checkins__gt=0
+                )
+                .order_by("-raid_checkins")
+                .limit(50)
+                .values_list("player__name", "raid_checkins")
+            ]
 
             embed = discord.Embed(title=f"Raid Checkin Leaderboard:")
             embed.timestamp = interaction.created_at
@@ -338,19 +306,9 @@ class BasicCommandsCog(commands.Cog):
         """
         /lifetime-standings command
         """
-        if await Channel.get_or_none(discord_server_id=interaction.guild.id):
-            channel = await Channel.get(discord_server_id=interaction.guild.id)
-            standings: List[Standings] = []
-            for clan in await Clan.all().filter(channel=channel):
-                clan_standings: Standings = {
-                    "points": 0,
-                    "name": clan.name,
-                    "tag": clan.tag,
-                }
-                for points in await Points.filter(clan=clan, channel=channel):
-                    clan_standings["points"] += points.points
-                standings.append(clan_standings)
-            sorted_standings = sorted(standings, key=lambda k: k["points"], reverse=True)
+        channel = await cached_channel_by_discord_id(interaction.guild.id)
+        if channel:
+            sorted_standings = await clan_standings(channel)
 
             embed = discord.Embed(title=f"Battle of Midgard Lifetime Clan Standings:")
             embed.timestamp = interaction.created_at
@@ -391,22 +349,10 @@ class BasicCommandsCog(commands.Cog):
         """
         /leaderboard command
         """
-        if await Channel.get_or_none(discord_server_id=interaction.guild.id):
-            channel = await Channel.get(discord_server_id=interaction.guild.id)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                season = await Season.active_seasons.all().filter(channel=channel).first()
-                standings: List[PlayerStandings] = []
-                for points_row in await Points.filter(season=season, channel=channel):
-                    player = await points_row.player.get()
-                    assert player.clan is not None
-                    player_standings: PlayerStandings = {
-                        "points": points_row.points,
-                        "name": player.name,
-                        "clantag": (await player.clan.get()).tag,
-                    }
-                    standings.append(player_standings)
-                sorted_standings = sorted(standings, key=lambda k: k["points"], reverse=True)
-
+        channel = await cached_channel_by_discord_id(interaction.guild.id)
+        if channel:
+            season = await cached_active_season(channel)
+            if season:
                 embed = discord.Embed(
                     title=f"Battle of Midgard Individual Leaderboard | {season.name}:"
                 )
@@ -421,10 +367,8 @@ class BasicCommandsCog(commands.Cog):
                 names_list = ""
                 points_list = ""
 
-                count = 0
-                for result in sorted_standings[:50]:
-                    count += 1
-                    position_list += f"{count}\n"
+                for result in await top_players(channel, season, limit=50):
+                    position_list += f"{result['rank']}\n"
                     names_list += f" {result['name'].title()}\n"
                     points_list += f"{result['points']}\n"
 
@@ -449,9 +393,9 @@ class BasicCommandsCog(commands.Cog):
         """
         /get-clan-player-counts command
         """
-        if await Channel.get_or_none(discord_server_id=interaction.guild.id):
-            channel = await Channel.get(discord_server_id=interaction.guild.id)
-            clans = await Clan.all().filter(channel=channel)
+        channel = await cached_channel_by_discord_id(interaction.guild.id)
+        if channel:
+            clans = await cached_clans(channel)
             embed = discord.Embed(title=f"Battle of Midgard Clan Player Counts:")
             embed.timestamp = interaction.created_at
             embed.set_footer(
@@ -479,10 +423,10 @@ class BasicCommandsCog(commands.Cog):
         """
         /get-clan-players command
         """
-        if await Channel.get_or_none(discord_server_id=interaction.guild.id):
-            channel = await Channel.get(discord_server_id=interaction.guild.id)
-            if await Clan.all().filter(channel=channel, tag=clantag).exists():
-                clan = await Clan.get(channel=channel, tag=clantag)
+        channel = await cached_channel_by_discord_id(interaction.guild.id)
+        if channel:
+            clan = await cached_clan(channel, clantag)
+            if clan:
                 players = await Player.all().filter(clan=clan)
                 embed = discord.Embed(title=f"Battle of Midgard Players in {clan.name.title()}:")
                 embed.timestamp = interaction.created_at
@@ -518,8 +462,8 @@ class BasicCommandsCog(commands.Cog):
         """
         /check-player-clan command
         """
-        if await Channel.get_or_none(discord_server_id=interaction.guild.id):
-            channel = await Channel.get(discord_server_id=interaction.guild.id)
+        channel = await cached_channel_by_discord_id(interaction.guild.id)
+        if channel:
             if await Player.all().filter(channel=channel, name=player_name).exists():
                 player = await Player.get(channel=channel, name=player_name)
                 clan = await player.clan.get()
@@ -543,28 +487,18 @@ class BasicCommandsCog(commands.Cog):
         """
         /lifetime-leaderboard command
         """
-        if await Channel.get_or_none(discord_server_id=interaction.guild.id):
-            channel = await Channel.get(discord_server_id=interaction.guild.id)
-            standings: List[PlayerStandings] = []
-
-            ## Get all the points for each player, each player can have multiple rows for each season. These need summing together. We can use .annotate(sum=Sum("points")).values_list("sum"))[0]
-
-            for player in await Player.all():
-                lifetime_points = (
-                    await Points.get(player=player, channel=channel)
-                    .annotate(sum=Sum("points"))
-                    .values_list("sum")
-                )[0]
-
-                if lifetime_points is not None:
-                    player_standings: PlayerStandings = {
-                        "points": lifetime_points,
-                        "name": player.name,
-                        "clantag": (await player.clan.get()).tag,
-                    }
-                    standings.append(player_standings)
-
-            sorted_standings = sorted(standings, key=lambda k: k["points"], reverse=True)
+        channel = await cached_channel_by_discord_id(interaction.guild.id)
+        if channel:
+            sorted_standings: List[PlayerStandings] = [
+                {"points": lifetime_points, "name": name, "clantag": clantag}
+                for name, clantag, lifetime_points in await PlayerLifetimeStats.filter(
+                    channel=channel
+                )
+                .exclude(points=0)
+                .order_by("-points")
+                .limit(50)
+                .values_list("player__name", "player__clan__tag", "points")
+            ]
 
             embed = discord.Embed(title=f"Battle of Midgard Lifetime Individual Leaderboard:")
             embed.timestamp = interaction.created_at
@@ -5,6 +5,9 @@ import discord
 from discord.ext import commands
 from twitchio.ext import commands as twitch_commands
 
+from app.lifetime import rebuild_lifetime_stats
+from app.standings import reconcile_standings
+
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
@@ -58,6 +61,22 @@ class DevCommandsCog(commands.Cog):
         await ctx.send(f"Synced the tree to {ret}/{len(guilds)}.")
         logger.info(f"Synced the tree to {ret}/{len(guilds)}.")
 
+    @commands.command()
+    @commands.guild_only()
+    @commands.is_owner()
+    async def rebuild_standings(self, ctx: commands.Context) -> None:
+        corrected = await reconcile_standings()
+        await ctx.send(f"Rebuilt the clan standings, {corrected} totals were corrected.")
+        logger.info(f"Rebuilt the clan standings, {corrected} totals were corrected.")
+
+    @commands.command(name="rebuild_lifetime_stats")
+    @commands.guild_only()
+    @commands.is_owner()
+    async def rebuild_lifetime(self, ctx: commands.Context) -> None:
+        rebuilt = await rebuild_lifetime_stats()
+        await ctx.send(f"Rebuilt the lifetime stats of {rebuilt} players.")
+        logger.info(f"Rebuilt the lifetime stats of {rebuilt} players.")
+
 
 async def setup(bot: commands.Bot, twitch_bot: twitch_commands.Bot) -> None:
     await bot.add_cog(DevCommandsCog(bot, twitch_bot))
@@ -9,7 +9,15 @@ from tortoise import timezone
 from tortoise.functions import Count
 from twitchio.ext import commands as twitch_commands
 
-from app.models import Channel, Checkin, Clan, Player, Points, Season, Session
+from app.cache import (
+    cached_active_season,
+    cached_channel_by_discord_id,
+    invalidate_active_season,
+    player_cache,
+    session_state,
+)
+from app.ledger import award_points, remove_points
+from app.models import Checkin, Clan, Player, Points, Season, Session
 
 if TYPE_CHECKING:
     from bot import DiscordBot, TwitchBot
@@ -99,12 +107,13 @@ class ModCommandsCog(commands.Cog):
         """
         /set-nickname <player> <nickname>
         """
-        if await Channel.get_or_none(discord_server_id=interaction.guild.id):
-            channel = await Channel.get(discord_server_id=interaction.guild.id)
+        channel = await cached_channel_by_discord_id(interaction.guild.id)
+        if channel:
             if await Player.get_or_none(name=player, channel=channel):
                 player_obj = await Player.get(name=player, channel=channel)
                 player_obj.nickname = nickname
                 await player_obj.save()
+                player_cache.invalidate(channel, player)
 
                 await interaction.response.send_message(
                     f"Added the nickname {nickname} to the player {player}."
@@ -126,34 +135,17 @@ class ModCommandsCog(commands.Cog):
         """
         /add-points <player> <points>
         """
-        if await Channel.get_or_none(discord_server_id=interaction.guild.id):
-            channel = await Channel.get(discord_server_id=interaction.guild.id)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                season = await Season.active_seasons.all().filter(channel=channel).first()
+        channel = await cached_channel_by_discord_id(interaction.guild.id)
+        if channel:
+            season = await cached_active_season(channel)
+            if season:
                 if await Player.get_or_none(name=player, channel=channel):
                     player = await Player.get(name=player, channel=channel)
                     if player.is_enabled() and player.clan:
-                        clan = await player.clan.get()
-                        if await Points.get_or_none(player=player, season=season, channel=channel):
-                            points_obj = await Points.get(
-                                player=player, season=season, channel=channel
-                            )
-                            points_obj.points += points
-                            await points_obj.save()
-                            await interaction.response.send_message(
-                                f"Added {points} points to {player.name}.", ephemeral=True
-                            )
-                        else:
-                            await Points.create(
-                                player=player,
-                                season=season,
-                                channel=channel,
-                                points=points,
-                                clan_id=clan.id,
-                            )
-                            await interaction.response.send_message(
-                                f"Added {points} points to {player.name}.", ephemeral=True
-                            )
+                        await award_points(player.id, season.id, channel.id, player.clan_id, points)
+                        await interaction.response.send_message(
+                            f"Added {points} points to {player.name}.", ephemeral=True
+                        )
                     else:
                         await interaction.response.send_message(
                             f"Player {player.name} is not enabled or has no clan.", ephemeral=True
@@ -181,24 +173,18 @@ class ModCommandsCog(commands.Cog):
         """
         /remove-points <player> <points>
         """
-        if await Channel.get_or_none(discord_server_id=interaction.guild.id):
-            channel = await Channel.get(discord_server_id=interaction.guild.id)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                season = await Season.active_seasons.all().filter(channel=channel).first()
+        channel = await cached_channel_by_discord_id(interaction.guild.id)
+        if channel:
+            season = await cached_active_season(channel)
+            if season:
                 if await Player.all().filter(name=player).exists():
                     player_object = await Player.all().filter(name=player, channel=channel).first()
                     if (
-                        await Points.all()
-                        .filter(player=player_object, season=season, channel=channel)
-                        .exists()
-                    ):
-                        points_obj = (
-                            await Points.all()
-                            .filter(player=player_object, season=season, channel=channel)
-                            .first()
+                        await remove_points(
+                            player_object.id, season.id, channel.id, points, floor=None
                         )
-                        points_obj.points -= points
-                        await points_obj.save()
+                        is not None
+                    ):
                         await interaction.response.send_message(
                             f"Removed {points} points from {player}.", ephemeral=True
                         )
@@ -226,14 +212,15 @@ class ModCommandsCog(commands.Cog):
         """
         /start-season <season_name>
         """
-        if await Channel.get_or_none(discord_server_id=interaction.guild.id):
-            channel = await Channel.get(discord_server_id=interaction.guild.id)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
+        channel = await cached_channel_by_discord_id(interaction.guild.id)
+        if channel:
+            if await cached_active_season(channel):
                 await interaction.response.send_message(
                     f"There is already an active season.", ephemeral=True
                 )
             else:
                 await Season.create(name=season_name, channel=channel)
+                invalidate_active_season(channel)
                 await interaction.response.send_message(
                     f"Started season {season_name}.", ephemeral=True
                 )
@@ -251,20 +238,19 @@ class ModCommandsCog(commands.Cog):
         """
         /end-season
         """
-        if await Channel.get_or_none(discord_server_id=interaction.guild.id):
-            channel = await Channel.get(discord_server_id=interaction.guild.id)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                if await Session.active_session.all().filter(channel=channel).exists():
+        channel = await cached_channel_by_discord_id(interaction.guild.id)
+        if channel:
+            active_season = await cached_active_season(channel)
+            if active_season:
+                if await session_state.active(Session, channel):
                     await interaction.response.send_message(
                         f"There is an active session. Please end the session first.", ephemeral=True
                     )
                 else:
-                    active_season = (
-                        await Season.active_seasons.all().filter(channel=channel).first()
-                    )
                     await Season.active_seasons.all().filter(channel=channel).update(
                         end_date=timezone.now()
                     )
+                    invalidate_active_season(channel)
                     await interaction.response.send_message(
                         f"Ended season {active_season.name}.", ephemeral=True
                     )
@@ -286,18 +272,17 @@ class ModCommandsCog(commands.Cog):
         """
         /start-session
         """
-        if await Channel.get_or_none(discord_server_id=interaction.guild.id):
-            channel = await Channel.get(discord_server_id=interaction.guild.id)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                if await Session.active_session.all().filter(channel=channel).exists():
+        channel = await cached_channel_by_discord_id(interaction.guild.id)
+        if channel:
+            if await cached_active_season(channel):
+                if await session_state.active(Session, channel):
                     await interaction.response.send_message(
                         f"There is already an active session.", ephemeral=True
                     )
                 else:
-                    active_season = (
-                        await Season.active_seasons.all().filter(channel=channel).first()
-                    )
-                    await Session.create(season=active_season, channel=channel)
+                    active_season = await cached_active_season(channel)
+                    session = await Session.create(season=active_season, channel=channel)
+                    session_state.started(session)
                     await interaction.response.send_message(
                         f"Started a new session of the Battle of Midgard.", ephemeral=True
                     )
@@ -319,13 +304,14 @@ class ModCommandsCog(commands.Cog):
         """
         /end-session
         """
-        if await Channel.get_or_none(discord_server_id=interaction.guild.id):
-            channel = await Channel.get(discord_server_id=interaction.guild.id)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                if await Session.active_session.all().filter(channel=channel).exists():
+        channel = await cached_channel_by_discord_id(interaction.guild.id)
+        if channel:
+            if await cached_active_season(channel):
+                if await session_state.active(Session, channel):
                     await Session.active_session.all().filter(channel=channel).update(
                         end_time=timezone.now()
                     )
+                    session_state.ended(Session, channel)
                     await interaction.response.send_message(
                         f"Ended the current session of the Battle of Midgard.", ephemeral=True
                     )
@@ -349,8 +335,8 @@ class ModCommandsCog(commands.Cog):
         """
         /add-player <player_name> <clan>
         """
-        if await Channel.get_or_none(discord_server_id=interaction.guild.id):
-            channel = await Channel.get(discord_server_id=interaction.guild.id)
+        channel = await cached_channel_by_discord_id(interaction.guild.id)
+        if channel:
             if await Player.all().filter(name=player_name, channel=channel).exists():
                 await interaction.response.send_message(
                     f"Player {player_name} already exists.", ephemeral=True
@@ -368,6 +354,7 @@ class ModCommandsCog(commands.Cog):
                 ]
                 new_clan = random.choice(clans_to_choose_from)
                 await Player.create(name=player_name.lower(), clan_id=new_clan, channel=channel)
+                player_cache.invalidate(channel, player_name)
                 logging.info(f"Created player {player_name.lower()}.")
                 await interaction.response.send_message(
                     f"Player {player_name} added to the Battle of Midgard.", ephemeral=True
@@ -389,17 +376,14 @@ class ModCommandsCog(commands.Cog):
 
         If player has no lifetime points then add 1000 points for the current season.
         """
-        if await Channel.get_or_none(discord_server_id=interaction.guild.id):
-            channel = await Channel.get(discord_server_id=interaction.guild.id)
-            if await Season.active_seasons.all().filter(channel=channel).exists():
-                season = await Season.active_seasons.all().filter(channel=channel).first()
+        channel = await cached_channel_by_discord_id(interaction.guild.id)
+        if channel:
+            season = await cached_active_season(channel)
+            if season:
                 players = await Player.all().filter(channel=channel)
                 for player in players:
                     if not await Points.all().filter(player=player, channel=channel).exists():
-                        clan = await player.clan.get()
-                        await Points.create(
-                            player=player, season=season, channel=channel, clan=clan, points=1000
-                        )
+                        await award_points(player.id, season.id, channel.id, player.clan_id, 1000)
                         logging.info(f"Added 1000 points to {player.name}.")
                     else:
                         if (
@@ -413,8 +397,9 @@ class ModCommandsCog(commands.Cog):
                                 .first()
                             )
                             if points.points == 0:
-                                points.points = 1000
-                                await points.save()
+                                await award_points(
+                                    player.id, season.id, channel.id, points.clan_id, 1000
+                                )
                                 logging.info(f"Added 1000 points to {player.name}.")
                 await interaction.response.send_message(
                     f"Fixed missing sub points.", ephemeral=True
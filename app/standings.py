@@ -0,0 +1,96 @@
+"""
+Clan standings, read from the ClanStanding totals the points ledger keeps up to date and
+shared by the Twitch and Discord standings commands. reconcile_standings() recomputes the
+totals from Points, for the periodic check and the rebuild command.
+"""
+
+from typing import List, Optional, TypedDict, Union
+
+from tortoise.functions import Sum
+from tortoise.transactions import in_transaction
+
+from app.cache import cached_clans
+from app.models import Channel, ClanStanding, Points, Season
+
+# Creates the rows reconcile_standings() locks, so an award that would create one waits for
+# the reconcile to commit instead of being overwritten by it.
+_SEED_SQL = """
+    INSERT INTO "clanstanding" ("season_id", "channel_id", "clan_id", "points")
+    SELECT DISTINCT "season_id", "channel_id", "clan_id", 0 FROM "points" {filter}
+    ON CONFLICT ("season_id", "channel_id", "clan_id") DO NOTHING
+"""
+
+
+class Standings(TypedDict):
+    name: str
+    points: int
+    tag: str
+
+
+def _id(instance: Union[Channel, Season, int]) -> int:
+    return instance if isinstance(instance, int) else instance.id
+
+
+async def clan_standings(
+    channel: Union[Channel, int], season: Union[Season, int, None] = None
+) -> List[Standings]:
+    """
+    Returns every clan of a channel with its points for `season`, or across all seasons when
+    no season is given, highest first. Clans without points are included with 0.
+    """
+    channel_id = _id(channel)
+    standings = ClanStanding.filter(channel_id=channel_id)
+    if season is not None:
+        standings = standings.filter(season_id=_id(season))
+    totals = dict(
+        await standings.annotate(total=Sum("points"))
+        .group_by("clan_id")
+        .values_list("clan_id", "total")
+    )
+
+    result: List[Standings] = [
+        {"name": clan.name, "tag": clan.tag, "points": totals.get(clan.id) or 0}
+        for clan in await cached_clans(channel_id)
+    ]
+    return sorted(result, key=lambda k: k["points"], reverse=True)
+
+
+async def reconcile_standings(season: Union[Season, int, None] = None) -> int:
+    """
+    Recomputes the ClanStanding totals of `season`, or of every season, from Points and
+    returns how many of them were wrong.
+    """
+    season_id: Optional[int] = None if season is None else _id(season)
+    async with in_transaction() as connection:
+        if season_id is None:
+            await connection.execute_query(_SEED_SQL.format(filter="WHERE TRUE"))
+        else:
+            await connection.execute_query(
+                _SEED_SQL.format(filter='WHERE "season_id" = $1'), [season_id]
+            )
+
+        standings = ClanStanding.all()
+        points = Points.all()
+        if season_id is not None:
+            standings = standings.filter(season_id=season_id)
+            points = points.filter(season_id=season_id)
+        # Awards committed before the lock are in the sums below, later ones wait for it and
+        # add to the corrected totals.
+        rows = await standings.select_for_update().using_db(connection)
+        sums = (
+            await points.annotate(total=Sum("points"))
+            .group_by("season_id", "channel_id", "clan_id")
+            .using_db(connection)
+            .values_list("season_id", "channel_id", "clan_id", "total")
+        )
+        totals = {tuple(key): total for *key, total in sums}
+
+        stale = []
+        for row in rows:
+            total = totals.get((row.season_id, row.channel_id, row.clan_id)) or 0
+            if row.points != total:
+                row.points = total
+                stale.append(row)
+        if stale:
+            await ClanStanding.bulk_update(stale, fields=["points"], using_db=connection)
+    return len(stale)
@@ -35,6 +35,9 @@ from twitchio.ext import commands, eventsub
 from twitchio.models import PartialUser
 
 from app import settings
+from app.cache import cached_active_season, cached_channel, player_cache, session_state
+from app.leaderboard import leaderboard_index
+from app.ledger import award_points, start_points_buffer, stop_points_buffer
 from app.models import (
     Channel,
     Clan,
@@ -42,8 +45,6 @@ from app.models import (
     FollowerGiveaway,
     GiftedSubsLeaderboard,
     Player,
-    Points,
-    Season,
     Session,
     Subscriptions,
 )
@@ -133,17 +134,33 @@ class TwitchBot(commands.Bot):
 
         await Tortoise.generate_schemas(safe=True)
 
+        points_buffer_options = self.conf_options["APP"].get("POINTS_BUFFER", {})
+        if points_buffer_options.get("ENABLED"):
+            await start_points_buffer(
+                flush_interval=points_buffer_options.get("FLUSH_INTERVAL_MS", 500) / 1000,
+                max_pending=points_buffer_options.get("MAX_PENDING", 500),
+                journal_path=points_buffer_options.get("JOURNAL"),
+                journal_delay=points_buffer_options.get("JOURNAL_SYNC_MS", 2) / 1000,
+            )
+
+        for channel in await Channel.all():
+            season = await cached_active_season(channel)
+            if season:
+                await leaderboard_index.warm(channel.id, season.id)
+
     async def routines_init(self) -> None:
         self.check_follower_giveaways.start()
+        self.check_clan_standings.start()
 
         channels = await Channel.all()
         for channel in channels:
-            if await Session.active_session.filter(channel=channel).exists():
+            if await session_state.active(Session, channel):
                 twitch_logger.info(f"Starting the sentry session routine.")
                 self.start_sentry_session.start()
                 # Exit the loop after the first channel with an active session is found as we only need to start the routine once.
 
     async def stop(self) -> None:
+        await stop_points_buffer()
         await self.session.close()
         await Tortoise.close_connections()
 
@@ -195,43 +212,24 @@ class TwitchBot(commands.Bot):
             else:
                 return
         else:
-            if await Channel.get_or_none(name=message.channel.name):
-                channel = await Channel.get(name=message.channel.name)
+            channel = await cached_channel(message.channel.name)
+            if channel:
                 if "msg-id" in message.tags:
                     if message.tags["msg-id"] == "highlighted-message":
                         twitch_logger.info("Received a highlighted message event.")
                         await self.discord_bot.log_message("Received a highlighted message event.")
-                        if await Player.get_or_none(
-                            name=message.author.name.lower(), channel=channel
-                        ):
-                            player = await Player.get(
-                                name=message.author.name.lower(), channel=channel
-                            )
-                            if await Season.active_seasons.all().filter(channel=channel).exists():
-                                season = await Season.active_seasons.filter(channel=channel).first()
-                                if player.is_enabled() and player.clan:
-                                    clan = await player.clan.get()
-                                    if await Points.get_or_none(
-                                        player=player, season=season, channel=channel
-                                    ):
-                                        points = await Points.get(
-                                            player=player, season=season, channel=channel
-                                        )
-                                        points.points += self.conf_options["APP"][
-                                            "HIGHLIGHTED_MESSAGE_POINTS"
-                                        ]
-                                        await points.save()
-                                    else:
-                                        assert player.clan is not None
-                                        await Points.create(
-                                            player_id=player.id,
-                                            season_id=season.id,
-                                            points=self.conf_options["APP"][
-                                                "HIGHLIGHTED_MESSAGE_POINTS"
-                                            ],
-                                            clan_id=clan.id,
-                                            chanel=channel,
-                                        )
+                        player = await player_cache.get(channel, message.author.name)
+                        if player:
+                            season = await cached_active_season(channel)
+                            if season:
+                                if player.is_enabled() and player.clan_id:
+                                    await award_points(
+                                        player.id,
+                                        season.id,
+                                        channel.id,
+                                        player.clan_id,
+                                        self.conf_options["APP"]["HIGHLIGHTED_MESSAGE_POINTS"],
+                                    )
                                 else:
                                     pass
                             else:
@@ -352,9 +350,9 @@ if __name__ == "__main__":
         subscription_tier: int = payload.data.tier
 
         twitch_logger.info("Received a new subscription event.")
-        if await Channel.get_or_none(name=payload.data.broadcaster.name.lower()):
+        channel = await cached_channel(payload.data.broadcaster.name.lower())
+        if channel:
             twitch_logger.info(f"Channel {payload.data.broadcaster.name} exists.")
-            channel = await Channel.get(name=payload.data.broadcaster.name.lower())
             match subscription_tier:
                 case 1000:
                     points_to_add = conf_options["APP"]["POINTS"]["TIER_1"]
@@ -378,23 +376,11 @@ if __name__ == "__main__":
                         currently_subscribed=True,
                         channel=channel,
                     )
-                if await Season.active_seasons.all().filter(channel=channel).exists():
-                    season = await Season.active_seasons.filter(channel=channel).first()
+                season = await cached_active_season(channel)
+                if season:
                     if player.is_enabled() and player.clan:
                         clan = await player.clan.get()
-                        if await Points.get_or_none(player=player, season=season, channel=channel):
-                            points = await Points.get(player=player, season=season, channel=channel)
-                            points.points += points_to_add
-                            await points.save()
-                        else:
-                            assert player.clan is not None
-                            await Points.create(
-                                player_id=player.id,
-                                season_id=season.id,
-                                points=points_to_add,
-                                clan_id=clan.id,
-                                channel=channel,
-                            )
+                        await award_points(player.id, season.id, channel.id, clan.id, points_to_add)
 
                         discord_server = discord_bot.get_guild(
                             conf_options["APP"]["DISCORD_SERVER_ID"]
@@ -431,6 +417,7 @@ if __name__ == "__main__":
                 await Player.create(
                     name=subscribed_user.name.lower(), clan_id=new_clan, channel=channel
                 )
+                player_cache.invalidate(channel, subscribed_user.name)
                 twitch_logger.info(f"Created player {subscribed_user.name.lower()}.")
                 player = await Player.get(name=subscribed_user.name.lower(), channel=channel)
                 if await Subscriptions.get_or_none(player=player, channel=channel):
@@ -445,23 +432,11 @@ if __name__ == "__main__":
                         currently_subscribed=True,
                         channel=channel,
                     )
-                if await Season.active_seasons.all().filter(channel=channel).exists():
-                    season = await Season.active_seasons.filter(channel=channel).first()
+                season = await cached_active_season(channel)
+                if season:
                     if player.is_enabled() and player.clan:
                         clan = await player.clan.get()
-                        if await Points.get_or_none(player=player, season=season, channel=channel):
-                            points = await Points.get(player=player, season=season, channel=channel)
-                            points.points += points_to_add
-                            await points.save()
-                        else:
-                            assert player.clan is not None
-                            await Points.create(
-                                player_id=player.id,
-                                season_id=season.id,
-                                points=points_to_add,
-                                clan_id=clan.id,
-                                channel=channel,
-                            )
+                        await award_points(player.id, season.id, channel.id, clan.id, points_to_add)
 
                         discord_server = discord_bot.get_guild(
                             conf_options["APP"]["DISCORD_SERVER_ID"]
@@ -504,9 +479,9 @@ if __name__ == "__main__":
 
         twitch_logger.info("Received a new subscription gift event.")
 
-        if await Channel.get_or_none(name=payload.data.broadcaster.name.lower()):
+        channel = await cached_channel(payload.data.broadcaster.name.lower())
+        if channel:
             twitch_logger.info(f"Channel {payload.data.broadcaster.name} exists.")
-            channel = await Channel.get(name=payload.data.broadcaster.name.lower())
             match subscription_tier:
                 case 1000:
                     points_to_add = (
@@ -530,23 +505,12 @@ if __name__ == "__main__":
             if await Player.get_or_none(name=gift_giver.name.lower(), channel=channel):
                 twitch_logger.info(f"Player gifter {gift_giver.name.lower()} exists.")
                 player = await Player.get(name=gift_giver.name.lower(), channel=channel)
-                if await Season.active_seasons.all().filter(channel=channel).exists():
-                    season = await Season.active_seasons.filter(channel=channel).first()
+                season = await cached_active_season(channel)
+                if season:
                     if player.is_enabled() and player.clan:
-                        clan = await player.clan.get()
-                        if await Points.get_or_none(player=player, season=season, channel=channel):
-                            points = await Points.get(player=player, season=season, channel=channel)
-                            points.points += points_to_add
-                            await points.save()
-                        else:
-                            assert player.clan is not None
-                            await Points.create(
-                                player_id=player.id,
-                                season_id=season.id,
-                                points=points_to_add,
-                                clan_id=clan.id,
-                                channel=channel,
-                            )
+                        await award_points(
+                            player.id, season.id, channel.id, player.clan_id, points_to_add
+                        )
 
                         if await GiftedSubsLeaderboard.get_or_none(channel=channel, player=player):
                             gifted_sub = await GiftedSubsLeaderboard.get(
@@ -588,25 +552,14 @@ if __name__ == "__main__":
                 ]
                 new_clan = random.choice(clans_to_choose_from)
                 await Player.create(name=gift_giver.name.lower(), clan_id=new_clan, channel=channel)
+                player_cache.invalidate(channel, gift_giver.name)
                 twitch_logger.info(f"Created player {gift_giver.name.lower()}.")
                 player = await Player.get(name=gift_giver.name.lower(), channel=channel)
-                if await Season.active_seasons.all().filter(channel=channel).exists():
-                    season = await Season.active_seasons.filter(channel=channel).first()
+                season = await cached_active_season(channel)
+                if season:
                     if player.is_enabled() and player.clan:
                         clan = await player.clan.get()
-                        if await Points.get_or_none(player=player, season=season, channel=channel):
-                            points = await Points.get(player=player, season=season, channel=channel)
-                            points.points += points_to_add
-                            await points.save()
-                        else:
-                            assert player.clan is not None
-                            await Points.create(
-                                player_id=player.id,
-                                season_id=season.id,
-                                points=points_to_add,
-                                clan_id=clan.id,
-                                channel=channel,
-                            )
+                        await award_points(player.id, season.id, channel.id, clan.id, points_to_add)
 
                         if (
                             GiftedSubsLeaderboard.all()
@@ -659,9 +612,9 @@ if __name__ == "__main__":
         subscription_tier: int = payload.data.tier
 
         twitch_logger.info("Received a new subscription event.")
-        if await Channel.get_or_none(name=payload.data.broadcaster.name.lower()):
+        channel = await cached_channel(payload.data.broadcaster.name.lower())
+        if channel:
             twitch_logger.info(f"Channel {payload.data.broadcaster.name} exists.")
-            channel = await Channel.get(name=payload.data.broadcaster.name.lower())
             match subscription_tier:
                 case 1000:
                     points_to_add = conf_options["APP"]["POINTS"]["TIER_1"]
@@ -687,23 +640,12 @@ if __name__ == "__main__":
                         currently_subscribed=True,
                         channel=channel,
                     )
-                if await Season.active_seasons.all().filter(channel=channel).exists():
-                    season = await Season.active_seasons.filter(channel=channel).first()
+                season = await cached_active_season(channel)
+                if season:
                     if player.is_enabled() and player.clan:
-                        clan = await player.clan.get()
-                        if await Points.get_or_none(player=player, season=season, channel=channel):
-                            points = await Points.get(player=player, season=season, channel=channel)
-                            points.points += points_to_add
-                            await points.save()
-                        else:
-                            assert player.clan is not None
-                            await Points.create(
-                                player_id=player.id,
-                                season_id=season.id,
-                                points=points_to_add,
-                                clan_id=clan.id,
-                                channel=channel,
-                            )
+                        await award_points(
+                            player.id, season.id, channel.id, player.clan_id, points_to_add
+                        )
 
                         discord_server = discord_bot.get_guild(
                             conf_options["APP"]["DISCORD_SERVER_ID"]
@@ -736,6 +678,7 @@ if __name__ == "__main__":
                 await Player.create(
                     name=subscribed_user.name.lower(), clan_id=new_clan, channel=channel
                 )
+                player_cache.invalidate(channel, subscribed_user.name)
                 twitch_logger.info(f"Created player {subscribed_user.name.lower()}.")
                 player = await Player.get(name=subscribed_user.name.lower(), channel=channel)
                 if await Subscriptions.get_or_none(player=player, channel=channel):
@@ -750,23 +693,12 @@ if __name__ == "__main__":
                         currently_subscribed=True,
                         channel=channel,
                     )
-                if await Season.active_seasons.all().filter(channel=channel).exists():
-                    season = await Season.active_seasons.filter(channel=channel).first()
+                season = await cached_active_season(channel)
+                if season:
                     if player.is_enabled() and player.clan:
-                        clan = await player.clan.get()
-                        if await Points.get_or_none(player=player, season=season, channel=channel):
-                            points = await Points.get(player=player, season=season, channel=channel)
-                            points.points += points_to_add
-                            await points.save()
-                        else:
-                            assert player.clan is not None
-                            await Points.create(
-                                player_id=player.id,
-                                season_id=season.id,
-                                points=points_to_add,
-                                clan_id=clan.id,
-                                channel=channel,
-                            )
+                        await award_points(
+                            player.id, season.id, channel.id, player.clan_id, points_to_add
+                        )
 
                         discord_server = discord_bot.get_guild(
                             conf_options["APP"]["DISCORD_SERVER_ID"]
@@ -805,33 +737,24 @@ if __name__ == "__main__":
         twitch_logger.info(f"User input: {user_input}")
 
         twitch_logger.info("Received a new channel points redemption event.")
-        if await Channel.get_or_none(name=payload.data.broadcaster.name.lower()):
+        channel = await cached_channel(payload.data.broadcaster.name.lower())
+        if channel:
             twitch_logger.info(f"Channel {payload.data.broadcaster.name} exists.")
-            channel = await Channel.get(name=payload.data.broadcaster.name.lower())
             if await Player.get_or_none(name=user.name.lower(), channel=channel):
                 twitch_logger.info(f"Player {user.name.lower()} exists.")
                 player = await Player.get(name=user.name.lower(), channel=channel)
-                if await Season.active_seasons.all().filter(channel=channel).exists():
-                    season = await Season.active_seasons.filter(channel=channel).first()
+                season = await cached_active_season(channel)
+                if season:
                     if player.is_enabled() and player.clan:
-                        clan = await player.clan.get()
-                        if await Points.get_or_none(player=player, season=season, channel=channel):
-                            points = await Points.get(player=player, season=season, channel=channel)
-                            points.points += reward.cost / 2
-
-                            twitch_logger.info(f"Reward cost: {reward.cost}")
-                            twitch_logger.info(f"Points to add: {reward.cost / 2}")
-
-                            await points.save()
-                        else:
-                            assert player.clan is not None
-                            await Points.create(
-                                player_id=player.id,
-                                season_id=season.id,
-                                points=reward.cost,
-                                clan_id=clan.id,
-                                channel=channel,
-                            )
+                        twitch_logger.info(f"Reward cost: {reward.cost}")
+                        await award_points(
+                            player.id,
+                            season.id,
+                            channel.id,
+                            player.clan_id,
+                            reward.cost // 2,
+                            initial_points=reward.cost,
+                        )
 
                         discord_server = discord_bot.get_guild(
                             conf_options["APP"]["DISCORD_SERVER_ID"]
@@ -875,9 +798,9 @@ if __name__ == "__main__":
         twitch_logger.info("Received a new follow event.")
 
         ## Launch a giveaway for the new follower, the end time should be 30 seconds from now.
-        if await Channel.get_or_none(name=payload.data.broadcaster.name.lower()):
+        channel = await cached_channel(payload.data.broadcaster.name.lower())
+        if channel:
             twitch_logger.info(f"Channel {payload.data.broadcaster.name} exists.")
-            channel = await Channel.get(name=payload.data.broadcaster.name.lower())
             # We need to check if a giveaway exists for the new follower (they may have unfollowed and refollowed), so we need to delete the old giveaway and create a new one.
             if await FollowerGiveaway.get_or_none(channel=channel, follower=player.name.lower()):
                 await FollowerGiveaway.get(channel=channel, follower=player.name.lower()).delete()
@@ -1104,7 +1027,7 @@ if __name__ == "__main__":
                     sub.type == "channel.follow" and sub.status == "enabled"
                     for sub in subscriptions
                 ):
-                    channel = await Channel.get(name=subscription.channel_name)
+                    channel = await cached_channel(subscription.channel_name)
                     await EventSubscriptions.filter(event_type="channel.follow").delete()
                     await subscribe_channel_follows_v2(
                         channel_name=subscription.channel_name,
@@ -1,19 +1,29 @@
+import argparse
 import asyncio
-from tortoise import Tortoise
-from dotenv import load_dotenv
-import os
+import json
 import logging
+import os
+import time
+import uuid
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from dotenv import load_dotenv
+from tortoise import Tortoise
+from tortoise.models import Model
+from tortoise.transactions import in_transaction
 
 from app import settings
-from app.clients.vanderheim import VanderheimAPIClient
-
+from app.clients.vanderheim import BatchWriter, VanderheimAPIClient
 from app.models import (
-    Clan,
     Checkin,
+    Clan,
     ClanSpoilsClaim,
     ClanSpoilsSession,
-    RaidCheckin,
-    RaidSession,
     FollowerGiveaway,
     FollowerGiveawayEntry,
     FollowerGiveawayPrize,
@@ -21,321 +31,761 @@ from app.models import (
     Player,
     PlayerWatchTime,
     Points,
+    RaidCheckin,
+    RaidSession,
     Season,
     SentryCheckin,
     SentrySession,
     Session,
     SpoilsClaim,
-    Subscriptions,
     SpoilsSession,
+    Subscriptions,
 )
 
 logging.basicConfig(level=logging.INFO)
 
 logger = logging.getLogger(__name__)
 
+
 def load_config():
     load_dotenv(".env/.prod")
 
-async def migrate_clans():
-    # Setups the Tortoise ORM with the database connection
-    await Tortoise.init(
-        config = settings.TORTOISE
-    )
 
-    # Generate the schema
-    await Tortoise.generate_schemas()
+class MissingParentError(Exception):
+    """
+    Raised when a row references a row that has not been migrated (yet).
+    """
 
-    # Create a new Vanderheim API client
-    vanderheim_client = VanderheimAPIClient(
-        base_url=os.getenv("VANDERHEIM_API_BASE_URL"),
-        api_token=os.getenv("VANDERHEIM_API_KEY")
-    )
 
-    follower_giveaway_prizes = await FollowerGiveawayPrize.all()
+def isoformat(value: Any) -> Optional[str]:
+    return value.isoformat() if value is not None else None
 
-    for prize in follower_giveaway_prizes:
-        vanderheim_prize = await vanderheim_client.follower_giveaway_prizes.create_follower_giveaway_prize({
-            "message": prize.message,
-            "vp_reward": prize.vp_reward,
-        })
 
-        prize.new_guid_id = vanderheim_prize["id"]
-        await prize.save()
+class IdMaps:
+    """
+    Maps of local id to new_guid_id for the migrated tables.
 
-        logger.info(f"Created prize: {vanderheim_prize}")
+    Each map is loaded with a single query the first time a step needs it, so payloads can be
+    built in memory instead of awaiting every foreign key of every row.
+    """
 
-    seasons = await Season.all()
+    def __init__(self):
+        self._maps: Dict[Type[Model], Dict[int, str]] = {}
+        self._loaded: Set[Type[Model]] = set()
 
-    for season in seasons:
-        vanderheim_season = await vanderheim_client.seasons.create_season({
-            "start_date": season.start_date.isoformat(),
-            "name": season.name,
-        })
+    async def load(self, model: Type[Model]) -> None:
+        if model in self._loaded:
+            return
+        rows = await model.filter(new_guid_id__isnull=False).values_list("id", "new_guid_id")
+        ids = self._maps.setdefault(model, {})
+        for id, guid in rows:
+            ids.setdefault(id, str(guid))
+        self._loaded.add(model)
 
-        season.new_guid_id = vanderheim_season["id"]
-        await season.save()
+    def record(self, model: Type[Model], id: int, guid: Any) -> None:
+        # Kept in memory as well, dry runs never write the new IDs to the database.
+        self._maps.setdefault(model, {})[id] = str(guid)
 
-        logger.info(f"Created season: {vanderheim_season}")
+    def guid(self, model: Type[Model], id: Optional[int], nullable: bool = False) -> Optional[str]:
+        """
+        Returns the Vanderheim ID of a related row as sent to the API.
+        """
+        if id is None and nullable:
+            return None
+        guid = self._maps.get(model, {}).get(id)
+        if guid is None:
+            raise MissingParentError(f"{model.__name__} {id} has not been migrated")
+        return guid
 
-    clans = await Clan.all()
 
-    for clan in clans:
-        vanderheim_clan = await vanderheim_client.clans.create_clan({
-            "name": clan.name,
-            "tag": clan.tag,
-            "twitch_emoji_name": clan.twitch_emoji_name,
-        })
+@dataclass
+class TableStep:
+    """
+    Migrates one table: every row without a new_guid_id is created through `endpoint.create`
+    with the payload built by `payload`, after the steps in `depends_on` have finished.
+    """
 
-        clan.new_guid_id = vanderheim_clan["id"]
-        await clan.save()
+    name: str
+    model: Type[Model]
+    endpoint: str
+    create: str
+    payload: Callable[[Any, IdMaps], Dict[str, Any]]
+    depends_on: Tuple[str, ...] = ()
 
-        logger.info(f"Created clan: {vanderheim_clan}")
 
-    sessions = await Session.all()
+def prize_payload(prize: FollowerGiveawayPrize, ids: IdMaps) -> Dict[str, Any]:
+    return {"message": prize.message, "vp_reward": prize.vp_reward}
 
-    for session in sessions:
-        vanderheim_session = await vanderheim_client.sessions.create_session(
-            data = {
-                "season": str((await session.season).new_guid_id),
-                "start_time": session.start_time.isoformat(),
-                "end_time": session.end_time.isoformat(),
-            }
-        )
 
-        session.new_guid_id = vanderheim_session["id"]
-        await session.save()
+def season_payload(season: Season, ids: IdMaps) -> Dict[str, Any]:
+    return {"start_date": isoformat(season.start_date), "name": season.name}
 
-        logger.info(f"Created session: {vanderheim_session}")
-    
-    raid_sessions = await RaidSession.all()
 
-    for raid_session in raid_sessions:
-        vanderheim_raid_session = await vanderheim_client.raid_sessions.create_raid_session(
-            data = {
-                "season": str((await raid_session.season).new_guid_id),
-                "start_time": raid_session.start_time.isoformat(),
-                "end_time": raid_session.end_time.isoformat(),
-            }
-        )
+def clan_payload(clan: Clan, ids: IdMaps) -> Dict[str, Any]:
+    return {"name": clan.name, "tag": clan.tag, "twitch_emoji_name": clan.twitch_emoji_name}
 
-        raid_session.new_guid_id = vanderheim_raid_session["id"]
-        await raid_session.save()
-    
-        logger.info(f"Created raid session: {vanderheim_raid_session}")
-    
-    sentry_sessions = await SentrySession.all()
-
-    for sentry_session in sentry_sessions:
-        vanderheim_sentry_session = await vanderheim_client.sentry_sessions.create_sentry_session(
-            data = {
-                "season": str((await sentry_session.season).new_guid_id),
-                "session": str((await sentry_session.session).new_guid_id),
-                "start_time": sentry_session.start_time.isoformat(),
-                "end_time": sentry_session.end_time.isoformat(),
-            }
-        )
 
-        sentry_session.new_guid_id = vanderheim_sentry_session["id"]
-        await sentry_session.save()
-    
-        logger.info(f"Created sentry session: {vanderheim_sentry_session}")
-    
-    spoils_sessions = await SpoilsSession.all()
-
-    for spoils_session in spoils_sessions:
-        vanderheim_spoils_session = await vanderheim_client.spoils_sessions.create_spoils_session(
-            data = {
-                "season": str((await spoils_session.season).new_guid_id),
-                "start_time": spoils_session.start_time.isoformat(),
-                "end_time": spoils_session.end_time.isoformat(),
-                "points_reward": spoils_session.points_reward,
-            }
+def session_payload(session: Any, ids: IdMaps) -> Dict[str, Any]:
+    return {
+        "season": ids.guid(Season, session.season_id),
+        "start_time": isoformat(session.start_time),
+        "end_time": isoformat(session.end_time),
+    }
+
+
+def sentry_session_payload(sentry_session: SentrySession, ids: IdMaps) -> Dict[str, Any]:
+    return {
+        "season": ids.guid(Season, sentry_session.season_id),
+        "session": ids.guid(Session, sentry_session.session_id),
+        "start_time": isoformat(sentry_session.start_time),
+        "end_time": isoformat(sentry_session.end_time),
+    }
+
+
+def spoils_session_payload(spoils_session: SpoilsSession, ids: IdMaps) -> Dict[str, Any]:
+    return {
+        "season": ids.guid(Season, spoils_session.season_id),
+        "start_time": isoformat(spoils_session.start_time),
+        "end_time": isoformat(spoils_session.end_time),
+        "points_reward": spoils_session.points_reward,
+    }
+
+
+def clan_spoils_session_payload(
+    clan_spoils_session: ClanSpoilsSession, ids: IdMaps
+) -> Dict[str, Any]:
+    return {
+        "season": ids.guid(Season, clan_spoils_session.season_id),
+        "start_time": isoformat(clan_spoils_session.start_time),
+        "end_time": isoformat(clan_spoils_session.end_time),
+        "points_reward": clan_spoils_session.points_reward,
+        "clan": ids.guid(Clan, clan_spoils_session.clan_id),
+    }
+
+
+def player_payload(player: Player, ids: IdMaps) -> Dict[str, Any]:
+    return {
+        "name": player.name,
+        "nickname": player.nickname,
+        "enabled": player.enabled,
+        "clan": ids.guid(Clan, player.clan_id, nullable=True),
+    }
+
+
+def checkin_payload(checkin: Checkin, ids: IdMaps) -> Dict[str, Any]:
+    return {
+        "session": ids.guid(Session, checkin.session_id),
+        "player": ids.guid(Player, checkin.player_id),
+    }
+
+
+def raid_checkin_payload(raid_checkin: RaidCheckin, ids: IdMaps) -> Dict[str, Any]:
+    return {
+        "session": ids.guid(RaidSession, raid_checkin.session_id),
+        "player": ids.guid(Player, raid_checkin.player_id),
+    }
+
+
+def sentry_checkin_payload(sentry_checkin: SentryCheckin, ids: IdMaps) -> Dict[str, Any]:
+    return {
+        "session": ids.guid(SentrySession, sentry_checkin.session_id),
+        "player": ids.guid(Player, sentry_checkin.player_id),
+    }
+
+
+def spoils_claim_payload(spoils_claim: SpoilsClaim, ids: IdMaps) -> Dict[str, Any]:
+    return {
+        "session": ids.guid(SpoilsSession, spoils_claim.spoils_session_id),
+        "player": ids.guid(Player, spoils_claim.player_id),
+    }
+
+
+def clan_spoils_claim_payload(clan_spoils_claim: ClanSpoilsClaim, ids: IdMaps) -> Dict[str, Any]:
+    return {
+        "session": ids.guid(ClanSpoilsSession, clan_spoils_claim.spoils_session_id),
+        "player": ids.guid(Player, clan_spoils_claim.player_id),
+    }
+
+
+def gifted_subscription_payload(gifted_subs: GiftedSubsLeaderboard, ids: IdMaps) -> Dict[str, Any]:
+    return {
+        "player": ids.guid(Player, gifted_subs.player_id),
+        "gifted_subs": gifted_subs.gifted_subs,
+    }
+
+
+def player_watch_time_payload(player_watch_time: PlayerWatchTime, ids: IdMaps) -> Dict[str, Any]:
+    return {
+        "player": ids.guid(Player, player_watch_time.player_id),
+        "watch_time": player_watch_time.watch_time,
+        "season": ids.guid(Season, player_watch_time.season_id),
+    }
+
+
+def points_payload(points: Points, ids: IdMaps) -> Dict[str, Any]:
+    return {
+        "player": ids.guid(Player, points.player_id),
+        "points": points.points,
+        "season": ids.guid(Season, points.season_id),
+        "clan": ids.guid(Clan, points.clan_id),
+    }
+
+
+def subscription_payload(subscription: Subscriptions, ids: IdMaps) -> Dict[str, Any]:
+    return {
+        "player": ids.guid(Player, subscription.player_id),
+        "months_subscribed": subscription.months_subscribed,
+    }
+
+
+def follower_giveaway_payload(follower_giveaway: FollowerGiveaway, ids: IdMaps) -> Dict[str, Any]:
+    return {
+        "start_time": isoformat(follower_giveaway.start_time),
+        "end_time": isoformat(follower_giveaway.end_time),
+        "follower": follower_giveaway.follower,
+        "winner": ids.guid(Player, follower_giveaway.winner_id, nullable=True),
+    }
+
+
+def follower_giveaway_entry_payload(entry: FollowerGiveawayEntry, ids: IdMaps) -> Dict[str, Any]:
+    return {
+        "giveaway": ids.guid(FollowerGiveaway, entry.giveaway_id),
+        "player": ids.guid(Player, entry.player_id),
+    }
+
+
+# In dependency order: a step only starts once the steps it depends on have finished.
+STEPS = [
+    TableStep(
+        "follower_giveaway_prizes",
+        FollowerGiveawayPrize,
+        "follower_giveaway_prizes",
+        "create_follower_giveaway_prize",
+        prize_payload,
+    ),
+    TableStep("seasons", Season, "seasons", "create_season", season_payload),
+    TableStep("clans", Clan, "clans", "create_clan", clan_payload),
+    TableStep("sessions", Session, "sessions", "create_session", session_payload, ("seasons",)),
+    TableStep(
+        "raid_sessions",
+        RaidSession,
+        "raid_sessions",
+        "create_raid_session",
+        session_payload,
+        ("seasons",),
+    ),
+    TableStep(
+        "sentry_sessions",
+        SentrySession,
+        "sentry_sessions",
+        "create_sentry_session",
+        sentry_session_payload,
+        ("seasons", "sessions"),
+    ),
+    TableStep(
+        "spoils_sessions",
+        SpoilsSession,
+        "spoils_sessions",
+        "create_spoils_session",
+        spoils_session_payload,
+        ("seasons",),
+    ),
+    TableStep(
+        "clan_spoils_sessions",
+        ClanSpoilsSession,
+        "clan_spoils_sessions",
+        "create_clan_spoils_session",
+        clan_spoils_session_payload,
+        ("seasons", "clans"),
+    ),
+    TableStep("players", Player, "players", "create_player", player_payload, ("clans",)),
+    TableStep(
+        "checkins",
+        Checkin,
+        "checkins",
+        "create_checkin",
+        checkin_payload,
+        ("sessions", "players"),
+    ),
+    TableStep(
+        "raid_checkins",
+        RaidCheckin,
+        "raid_checkins",
+        "create_raid_checkin",
+        raid_checkin_payload,
+        ("raid_sessions", "players"),
+    ),
+    TableStep(
+        "sentry_checkins",
+        SentryCheckin,
+        "sentry_checkins",
+        "create_sentry_checkin",
+        sentry_checkin_payload,
+        ("sentry_sessions", "players"),
+    ),
+    TableStep(
+        "spoils_claims",
+        SpoilsClaim,
+        "spoils_claims",
+        "create_spoils_claim",
+        spoils_claim_payload,
+        ("spoils_sessions", "players"),
+    ),
+    TableStep(
+        "clan_spoils_claims",
+        ClanSpoilsClaim,
+        "clan_spoils_claims",
+        "create_clan_spoils_claim",
+        clan_spoils_claim_payload,
+        ("clan_spoils_sessions", "players"),
+    ),
+    TableStep(
+        "gifted_subscriptions",
+        GiftedSubsLeaderboard,
+        "gifted_subscriptions",
+        "create_gifted_subscription",
+        gifted_subscription_payload,
+        ("players",),
+    ),
+    TableStep(
+        "player_watch_times",
+        PlayerWatchTime,
+        "player_watch_times",
+        "create_player_watch_time",
+        player_watch_time_payload,
+        ("players", "seasons"),
+    ),
+    TableStep(
+        "points",
+        Points,
+        "points",
+        "create_point",
+        points_payload,
+        ("players", "seasons", "clans"),
+    ),
+    TableStep(
+        "subscriptions",
+        Subscriptions,
+        "subscriptions",
+        "create_subscription",
+        subscription_payload,
+        ("players",),
+    ),
+    TableStep(
+        "follower_giveaways",
+        FollowerGiveaway,
+        "follower_giveaways",
+        "create_follower_giveaway",
+        follower_giveaway_payload,
+        ("players",),
+    ),
+    TableStep(
+        "follower_giveaway_entries",
+        FollowerGiveawayEntry,
+        "follower_giveaway_entries",
+        "create_follower_giveaway_entry",
+        follower_giveaway_entry_payload,
+        ("follower_giveaways", "players"),
+    ),
+]
+
+
+STEP_MODELS = {step.name: step.model for step in STEPS}
+
+
+@dataclass
+class TableProgress:
+    completed: bool = False
+    migrated: int = 0
+    failed: List[int] = field(default_factory=list)
+
+
+class Checkpoint:
+    """
+    Per-table migration progress, persisted as JSON after every chunk so an interrupted run can
+    be restarted. Completed tables are skipped on restart, other tables pick up the rows that
+    still have no new_guid_id.
+    """
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.tables: Dict[str, TableProgress] = {}
+        if path and os.path.exists(path):
+            with open(path) as f:
+                for name, progress in json.load(f)["tables"].items():
+                    self.tables[name] = TableProgress(**progress)
+
+    def table(self, name: str) -> TableProgress:
+        return self.tables.setdefault(name, TableProgress())
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        data = {
+            "updated_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "tables": {name: progress.__dict__ for name, progress in self.tables.items()},
+        }
+        # Write to a temporary file first so a crash never leaves a truncated checkpoint.
+        with open(f"{self.path}.tmp", "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(f"{self.path}.tmp", self.path)
+
+
+# The table the current task is migrating, used to attribute requests and queries to it.
+current_table: ContextVar[Optional[str]] = ContextVar("current_table", default=None)
+
+
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(q * (len(ordered) - 1)))]
+
+
+@dataclass
+class TableStats:
+    rows: int = 0
+    failed: int = 0
+    queries: int = 0
+    latencies: List[float] = field(default_factory=list)
+    started: float = 0.0
+    finished: float = 0.0
+
+    @property
+    def seconds(self) -> float:
+        return max(self.finished - self.started, 0.0)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+class MigrationStats(logging.Handler):
+    """
+    Collects the throughput report of a migration run: rows per table, request latency (through
+    an aiohttp TraceConfig) and database queries (by counting the statements tortoise.db_client
+    logs).
+    """
+
+    def __init__(self):
+        super().__init__(level=logging.DEBUG)
+        self.tables: Dict[str, TableStats] = {}
+        self.queries = 0
+        self.started = time.perf_counter()
+        self.finished = self.started
+
+    def table(self, name: str) -> TableStats:
+        return self.tables.setdefault(name, TableStats())
+
+    def install(self) -> None:
+        db_logger = logging.getLogger("tortoise.db_client")
+        db_logger.setLevel(logging.DEBUG)
+        # Only count the queries, do not print them.
+        db_logger.propagate = False
+        db_logger.addHandler(self)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Statements are logged as ("%s: %s", query, values) and scripts as the bare SQL, the
+        # connection and pool messages have a format of their own with arguments.
+        if record.msg != "%s: %s" and record.args:
+            return
+        self.queries += 1
+        name = current_table.get()
+        if name:
+            self.table(name).queries += 1
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        async def on_request_start(session: Any, context: Any, params: Any) -> None:
+            context.started = time.perf_counter()
+
+        async def on_request_end(session: Any, context: Any, params: Any) -> None:
+            name = current_table.get()
+            if name:
+                self.table(name).latencies.append(time.perf_counter() - context.started)
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_end.append(on_request_end)
+        return trace_config
+
+    def report(self) -> str:
+        lines = [
+            f"{'table':<26}{'rows':>8}{'failed':>8}{'rows/s':>9}{'p50 ms':>9}{'p95 ms':>9}"
+            f"{'queries':>9}{'seconds':>9}"
+        ]
+        for name, table in self.tables.items():
+            lines.append(
+                f"{name:<26}{table.rows:>8}{table.failed:>8}{table.rows_per_second:>9.1f}"
+                f"{percentile(table.latencies, 0.5) * 1000:>9.1f}"
+                f"{percentile(table.latencies, 0.95) * 1000:>9.1f}"
+                f"{table.queries:>9}{table.seconds:>9.2f}"
+            )
+        lines.append(
+            f"{self.queries} database queries, {self.finished - self.started:.2f}s wall time"
+        )
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "wall_seconds": self.finished - self.started,
+            "queries": self.queries,
+            "tables": {
+                name: {
+                    "rows": table.rows,
+                    "failed": table.failed,
+                    "rows_per_second": table.rows_per_second,
+                    "p50_ms": percentile(table.latencies, 0.5) * 1000,
+                    "p95_ms": percentile(table.latencies, 0.95) * 1000,
+                    "queries": table.queries,
+                    "seconds": table.seconds,
+                }
+                for name, table in self.tables.items()
+            },
+        }
+
+
+async def start_stand_in_api(latency: float = 0.0) -> TestServer:
+    """
+    Starts an in-process stand-in for the Vanderheim API that accepts every create request
+    and answers with the payload and a fresh ID after `latency` seconds.
+    """
+
+    async def create(request: web.Request) -> web.Response:
+        data = await request.json()
+        if latency:
+            await asyncio.sleep(latency)
+        return web.json_response({**data, "id": str(uuid.uuid4())}, status=201)
+
+    app = web.Application()
+    app.router.add_post("/vanderheim-api/{path:.*}", create)
+    server = TestServer(app)
+    await server.start_server(access_log=None)
+    return server
+
+
+class MigrationEngine:
+    """
+    Pushes the local tables to the Vanderheim API.
+
+    Independent tables are migrated side by side, with at most `concurrency` create requests in
+    flight across all of them. Rows are read in chunks of `chunk_size` ordered by id and sent
+    through a BatchWriter in batches of `batch_size`; once a chunk has been created remotely
+    its new IDs are written back in one transaction and the checkpoint is saved. A crash can therefore leave at most one chunk per table created
+    remotely but not recorded locally.
+
+    In a dry run the write-backs are rolled back, so the database is left untouched while its
+    cost is still measured.
+    """
+
+    def __init__(
+        self,
+        client: VanderheimAPIClient,
+        steps: List[TableStep],
+        checkpoint: Checkpoint,
+        concurrency: int = 16,
+        chunk_size: int = 500,
+        write_batch_size: int = 500,
+        stats: Optional[MigrationStats] = None,
+        dry_run: bool = False,
+        batch_size: int = 100,
+    ):
+        self.client = client
+        self.steps = steps
+        self.checkpoint = checkpoint
+        self.chunk_size = chunk_size
+        self.write_batch_size = write_batch_size
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.ids = IdMaps()
+        self.stats = stats or MigrationStats()
+        self.dry_run = dry_run
+
+    async def run(self) -> bool:
+        """
+        Runs every step and returns whether all tables were migrated without failures.
+        Dependencies that are not part of this run are assumed to be migrated already.
+        """
+        tasks: Dict[str, asyncio.Future] = {}
+        for step in self.steps:
+            dependencies = [tasks[name] for name in step.depends_on if name in tasks]
+            tasks[step.name] = asyncio.ensure_future(self.run_step(step, dependencies))
+        succeeded = all(await asyncio.gather(*tasks.values()))
+        self.stats.finished = time.perf_counter()
+        return succeeded
+
+    async def run_step(self, step: TableStep, dependencies: List[asyncio.Future]) -> bool:
+        await asyncio.gather(*dependencies)
+        progress = self.checkpoint.table(step.name)
+        if progress.completed:
+            logger.info(f"Skipping {step.name}, already migrated ({progress.migrated} rows)")
+            return True
+
+        current_table.set(step.name)
+        table_stats = self.stats.table(step.name)
+        table_stats.started = time.perf_counter()
+
+        for name in step.depends_on:
+            await self.ids.load(STEP_MODELS[name])
+
+        endpoint_create = getattr(getattr(self.client, step.endpoint), step.create)
+
+        async def create(payload: Dict[str, Any]) -> Any:
+            # Shared by every table, so the limit holds across the steps running side by side.
+            async with self.semaphore:
+                return await endpoint_create(payload)
+
+        # A whole chunk is submitted at once, so there is nothing to wait for before flushing.
+        writer = self.client.batch_writer(
+            create, self.batch_size, flush_interval=0, concurrency=self.concurrency
         )
+        progress.failed = []
+        last_id = 0
+        while True:
+            rows = (
+                await step.model.filter(new_guid_id__isnull=True, id__gt=last_id)
+                .order_by("id")
+                .limit(self.chunk_size)
+            )
+            if not rows:
+                break
+            last_id = rows[-1].id
+            guids = await asyncio.gather(*(self.migrate_row(step, writer, row) for row in rows))
+            migrated = []
+            for row, guid in zip(rows, guids):
+                if guid is None:
+                    progress.failed.append(row.id)
+                    continue
+                row.new_guid_id = guid
+                migrated.append(row)
+                self.ids.record(step.model, row.id, guid)
+            await self.write_back(step, migrated)
+            progress.migrated += len(migrated)
+            table_stats.rows += len(migrated)
+            table_stats.failed += len(rows) - len(migrated)
+            self.checkpoint.save()
+            logger.info(f"{step.name}: {progress.migrated} migrated, {len(progress.failed)} failed")
+
+        table_stats.finished = time.perf_counter()
+        progress.completed = not progress.failed
+        self.checkpoint.save()
+        return progress.completed
+
+    async def migrate_row(self, step: TableStep, writer: BatchWriter, row: Model) -> Optional[str]:
+        """
+        Creates the row through the API and returns its new ID, or None if that failed.
+        """
+        try:
+            record = await writer.submit(step.payload(row, self.ids))
+        except Exception as e:
+            logger.error(f"Failed to migrate {step.name} row {row.id}: {e}")
+            return None
+        return record["id"]
+
+    async def write_back(self, step: TableStep, rows: List[Model]) -> None:
+        """
+        Stores the new IDs of a chunk in a single transaction, one UPDATE per batch of rows
+        instead of one per row.
+        """
+        if not rows:
+            return
+        async with in_transaction() as connection:
+            await step.model.bulk_update(
+                rows, fields=["new_guid_id"], batch_size=self.write_batch_size, using_db=connection
+            )
+            if self.dry_run:
+                await connection.rollback()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Migrate the bot database to the Vanderheim API.")
+    parser.add_argument("--concurrency", type=int, default=16, help="Create requests in flight.")
+    parser.add_argument("--chunk-size", type=int, default=500, help="Rows read per query.")
+    parser.add_argument("--batch-size", type=int, default=100, help="Creates sent per batch.")
+    parser.add_argument(
+        "--write-batch-size", type=int, default=500, help="Rows per new_guid_id UPDATE."
+    )
+    parser.add_argument(
+        "--checkpoint",
+        default="migration_checkpoint.json",
+        help="Progress file used to resume an interrupted migration.",
+    )
+    parser.add_argument(
+        "--restart", action="store_true", help="Ignore the checkpoint and revisit every table."
+    )
+    parser.add_argument(
+        "--tables", nargs="+", help="Only migrate these tables (their dependencies must be done)."
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Benchmark against an in-process stand-in API without changing the database.",
+    )
+    parser.add_argument(
+        "--stand-in-latency",
+        type=float,
+        default=0.0,
+        help="Seconds the stand-in API waits before answering (dry run only).",
+    )
+    parser.add_argument("--report", help="Also write the throughput report to this JSON file.")
+    return parser.parse_args()
+
+
+async def migrate(args: argparse.Namespace) -> bool:
+    # Setups the Tortoise ORM with the database connection
+    await Tortoise.init(config=settings.TORTOISE)
 
-        spoils_session.new_guid_id = vanderheim_spoils_session["id"]
-        await spoils_session.save()
-    
-        logger.info(f"Created spoils session: {vanderheim_spoils_session}")
-    
-    clan_spoils_sessions = await ClanSpoilsSession.all()
-
-    for clan_spoils_session in clan_spoils_sessions:
-        vanderheim_clan_spoils_session = await vanderheim_client.clan_spoils_sessions.create_clan_spoils_session(
-            data = {
-                "season": str((await clan_spoils_session.season).new_guid_id),
-                "start_time": clan_spoils_session.start_time.isoformat(),
-                "end_time": clan_spoils_session.end_time.isoformat(),
-                "points_reward": clan_spoils_session.points_reward,
-                "clan": str((await clan_spoils_session.clan).new_guid_id),
-            }
+    # Generate the schema
+    await Tortoise.generate_schemas()
+
+    stand_in_api = None
+    if args.dry_run:
+        # Dry runs neither read nor write the checkpoint.
+        checkpoint = Checkpoint(None)
+        stand_in_api = await start_stand_in_api(args.stand_in_latency)
+        base_url = str(stand_in_api.make_url("")).rstrip("/")
+        api_token = "dry-run"
+    else:
+        if args.restart and os.path.exists(args.checkpoint):
+            os.remove(args.checkpoint)
+        checkpoint = Checkpoint(args.checkpoint)
+        base_url = os.getenv("VANDERHEIM_API_BASE_URL")
+        api_token = os.getenv("VANDERHEIM_API_KEY")
+
+    steps = STEPS
+    if args.tables:
+        steps = [step for step in STEPS if step.name in args.tables]
+
+    stats = MigrationStats()
+    stats.install()
+    async with VanderheimAPIClient(
+        base_url=base_url, api_token=api_token, trace_configs=[stats.trace_config()]
+    ) as vanderheim_client:
+        engine = MigrationEngine(
+            vanderheim_client,
+            steps,
+            checkpoint,
+            args.concurrency,
+            args.chunk_size,
+            args.write_batch_size,
+            stats,
+            args.dry_run,
+            args.batch_size,
         )
+        succeeded = await engine.run()
+
+    logger.info(f"Migration report{' (dry run)' if args.dry_run else ''}:\n{stats.report()}")
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(stats.to_dict(), f, indent=2)
+
+    if stand_in_api is not None:
+        await stand_in_api.close()
+    await Tortoise.close_connections()
+    return succeeded
 
-        clan_spoils_session.new_guid_id = vanderheim_clan_spoils_session["id"]
-        await clan_spoils_session.save()
-    
-        logger.info(f"Created clan spoils session: {vanderheim_clan_spoils_session}")
-        
-    players = await Player.all()
-
-    for player in players:
-        vanderheim_player = await vanderheim_client.players.create_player({
-            "name": player.name,
-            "nickname": player.nickname,
-            "enabled": player.enabled,
-            "clan": str((await player.clan).new_guid_id),
-        })
-
-        player.new_guid_id = vanderheim_player["id"]
-        await player.save()
-    
-        logger.info(f"Created player: {vanderheim_player}")
-    
-    checkins = await Checkin.all()
-    
-    for checkin in checkins:
-        vanderheim_checkin = await vanderheim_client.checkins.create_checkin({
-            "session": str((await checkin.session).new_guid_id),
-            "player": str((await checkin.player).new_guid_id),
-        })
-
-        checkin.new_guid_id = vanderheim_checkin["id"]
-        await checkin.save()
-    
-        logger.info(f"Created checkin: {vanderheim_checkin}")
-    
-    raid_checkins = await RaidCheckin.all()
-
-    for raid_checkin in raid_checkins:
-        vanderheim_raid_checkin = await vanderheim_client.raid_checkins.create_raid_checkin({
-            "session": str((await raid_checkin.session).new_guid_id),
-            "player": str((await raid_checkin.player).new_guid_id),
-        })
-
-        raid_checkin.new_guid_id = vanderheim_raid_checkin["id"]
-        await raid_checkin.save()
-    
-        logger.info(f"Created raid checkin: {vanderheim_raid_checkin}")
-    
-    sentry_checkins = await SentryCheckin.all()
-
-    for sentry_checkin in sentry_checkins:
-        vanderheim_sentry_checkin = await vanderheim_client.sentry_checkins.create_sentry_checkin({
-            "session": str((await sentry_checkin.session).new_guid_id),
-            "player": str((await sentry_checkin.player).new_guid_id),
-        })
-
-        sentry_checkin.new_guid_id = vanderheim_sentry_checkin["id"]
-        await sentry_checkin.save()
-    
-        logger.info(f"Created sentry checkin: {vanderheim_sentry_checkin}")
-    
-    spoils_claims = await SpoilsClaim.all()
-
-    for spoils_claim in spoils_claims:
-        vanderheim_spoils_claim = await vanderheim_client.spoils_claims.create_spoils_claim({
-            "session": str((await spoils_claim.spoils_session).new_guid_id),
-            "player": str((await spoils_claim.player).new_guid_id),
-        })
-
-        spoils_claim.new_guid_id = vanderheim_spoils_claim["id"]
-        await spoils_claim.save()
-    
-        logger.info(f"Created spoils claim: {vanderheim_spoils_claim}")
-    
-    clan_spoils_claims = await ClanSpoilsClaim.all()
-
-    for clan_spoils_claim in clan_spoils_claims:
-        vanderheim_clan_spoils_claim = await vanderheim_client.clan_spoils_claims.create_clan_spoils_claim({
-            "session": str((await clan_spoils_claim.spoils_session).new_guid_id),
-            "player": str((await clan_spoils_claim.player).new_guid_id),
-        })
-
-        clan_spoils_claim.new_guid_id = vanderheim_clan_spoils_claim["id"]
-        await clan_spoils_claim.save()
-    
-        logger.info(f"Created clan spoils claim: {vanderheim_clan_spoils_claim}")
-    
-    gifted_subs_leaderboards = await GiftedSubsLeaderboard.all()
-
-    for gifted_subs_leaderboard in gifted_subs_leaderboards:
-        vanderheim_gifted_subs_leaderboard = await vanderheim_client.gifted_subscriptions.create_gifted_subscription({
-            "player": str((await gifted_subs_leaderboard.player).new_guid_id),
-            "gifted_subs": gifted_subs_leaderboard.gifted_subs
-        })
-
-        gifted_subs_leaderboard.new_guid_id = vanderheim_gifted_subs_leaderboard["id"]
-        await gifted_subs_leaderboard.save()
-    
-        logger.info(f"Created gifted subs leaderboard: {vanderheim_gifted_subs_leaderboard}")
-    
-    player_watch_times = await PlayerWatchTime.all()
-
-    for player_watch_time in player_watch_times:
-        vanderheim_player_watch_time = await vanderheim_client.player_watch_times.create_player_watch_time({
-            "player": str((await player_watch_time.player).new_guid_id),
-            "watch_time": player_watch_time.watch_time,
-            "season": str((await player_watch_time.season).new_guid_id),
-        })
-
-        player_watch_time.new_guid_id = vanderheim_player_watch_time["id"]
-        await player_watch_time.save()
-    
-        logger.info(f"Created player watch time: {vanderheim_player_watch_time}")
-    
-    points = await Points.all()
-
-    for point in points:
-        vanderheim_point = await vanderheim_client.points.create_point({
-            "player": str((await point.player).new_guid_id),
-            "points": point.points,
-            "season": str((await point.season).new_guid_id),
-            "clan": str((await point.clan).new_guid_id),
-        })
-
-        point.new_guid_id = vanderheim_point["id"]
-        await point.save()
-    
-        logger.info(f"Created point: {vanderheim_point}")
-    
-    subscriptions = await Subscriptions.all()
-
-    for subscription in subscriptions:
-        vanderheim_subscription = await vanderheim_client.subscriptions.create_subscription({
-            "player": str((await subscription.player).new_guid_id),
-            "months_subscribed": subscription.months_subscribed,
-        })
-
-        subscription.new_guid_id = vanderheim_subscription["id"]
-        await subscription.save()
-    
-        logger.info(f"Created subscription: {vanderheim_subscription}")
-    
-    follower_giveaways = await FollowerGiveaway.all()
-
-    for follower_giveaway in follower_giveaways:
-        vanderheim_follower_giveaway = await vanderheim_client.follower_giveaways.create_follower_giveaway({
-            "start_time": follower_giveaway.start_time.isoformat(),
-            "end_time": follower_giveaway.end_time.isoformat(),
-            "follower": follower_giveaway.follower,
-            "winner": str((await follower_giveaway.winner).new_guid_id),
-        })
-
-        follower_giveaway.new_guid_id = vanderheim_follower_giveaway["id"]
-        await follower_giveaway.save()
-    
-        logger.info(f"Created follower giveaway: {vanderheim_follower_giveaway}")
-    
-    follower_giveaway_entries = await FollowerGiveawayEntry.all()
-
-    for follower_giveaway_entry in follower_giveaway_entries:
-        vanderheim_follower_giveaway_entry = await vanderheim_client.follower_giveaway_entries.create_follower_giveaway_entry({
-            "giveaway": str((await follower_giveaway_entry.giveaway).new_guid_id),
-            "player": str((await follower_giveaway_entry.player).new_guid_id),
-        })
-
-        follower_giveaway_entry.new_guid_id = vanderheim_follower_giveaway_entry["id"]
 
 if __name__ == "__main__":
     load_config()
-    asyncio.run(migrate_clans())
\ No newline at end of file
+    if not asyncio.run(migrate(parse_args())):
+        raise SystemExit("Some rows failed to migrate, see the log and re-run to retry them.")
@@ -0,0 +1,24 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        UPDATE "points" SET "points" = "duplicates"."total"
+        FROM (
+            SELECT MIN("id") AS "id", SUM("points") AS "total"
+            FROM "points"
+            GROUP BY "player_id", "season_id", "channel_id"
+            HAVING COUNT(*) > 1
+        ) AS "duplicates"
+        WHERE "points"."id" = "duplicates"."id";
+        DELETE FROM "points" USING "points" AS "kept"
+        WHERE "points"."player_id" = "kept"."player_id"
+            AND "points"."season_id" = "kept"."season_id"
+            AND "points"."channel_id" = "kept"."channel_id"
+            AND "points"."id" > "kept"."id";
+        CREATE UNIQUE INDEX "uid_points_player__dd23c3" ON "points" ("player_id", "season_id", "channel_id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX "uid_points_player__dd23c3";"""
@@ -0,0 +1,26 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "clanstanding" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "points" INT NOT NULL  DEFAULT 0,
+    "new_guid_id" UUID,
+    "channel_id" INT NOT NULL REFERENCES "channel" ("id") ON DELETE CASCADE,
+    "clan_id" INT NOT NULL REFERENCES "clan" ("id") ON DELETE CASCADE,
+    "season_id" INT NOT NULL REFERENCES "season" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_clanstandin_season__d7a796" UNIQUE ("season_id", "channel_id", "clan_id")
+);
+        INSERT INTO "clanstanding" ("season_id", "channel_id", "clan_id", "points")
+        SELECT "season_id", "channel_id", "clan_id", SUM("points") FROM "points"
+        GROUP BY "season_id", "channel_id", "clan_id";
+        CREATE INDEX "idx_points_channel_cbe831" ON "points" ("channel_id", "season_id", "points");
+        CREATE INDEX "idx_points_channel_fddd98" ON "points" ("channel_id", "season_id", "clan_id", "points");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX "idx_points_channel_fddd98";
+        DROP INDEX "idx_points_channel_cbe831";
+        DROP TABLE IF EXISTS "clanstanding";"""
@@ -0,0 +1,56 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "playerlifetimestats" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "points" INT NOT NULL  DEFAULT 0,
+    "checkins" INT NOT NULL  DEFAULT 0,
+    "raid_checkins" INT NOT NULL  DEFAULT 0,
+    "sentry_checkins" INT NOT NULL  DEFAULT 0,
+    "claims" INT NOT NULL  DEFAULT 0,
+    "new_guid_id" UUID,
+    "channel_id" INT NOT NULL REFERENCES "channel" ("id") ON DELETE CASCADE,
+    "player_id" INT NOT NULL REFERENCES "player" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_playerlifet_player__b1e99b" UNIQUE ("player_id", "channel_id")
+);
+        CREATE INDEX "idx_playerlifet_channel_a8eae5" ON "playerlifetimestats" ("channel_id", "points");
+        CREATE INDEX "idx_playerlifet_channel_fbd0e8" ON "playerlifetimestats" ("channel_id", "checkins");
+        CREATE INDEX "idx_playerlifet_channel_7f439a" ON "playerlifetimestats" ("channel_id", "raid_checkins");
+        INSERT INTO "playerlifetimestats" (
+            "player_id", "channel_id", "points", "checkins", "raid_checkins", "sentry_checkins",
+            "claims"
+        )
+        SELECT
+            "player"."id",
+            "player"."channel_id",
+            COALESCE((
+                SELECT SUM("points") FROM "points"
+                WHERE "player_id" = "player"."id" AND "channel_id" = "player"."channel_id"
+            ), 0),
+            (
+                SELECT COUNT(*) FROM "checkin"
+                WHERE "player_id" = "player"."id" AND "channel_id" = "player"."channel_id"
+            ),
+            (
+                SELECT COUNT(*) FROM "raidcheckin"
+                WHERE "player_id" = "player"."id" AND "channel_id" = "player"."channel_id"
+            ),
+            (
+                SELECT COUNT(*) FROM "sentrycheckin"
+                WHERE "player_id" = "player"."id" AND "channel_id" = "player"."channel_id"
+            ),
+            (
+                SELECT COUNT(*) FROM "spoilsclaim"
+                WHERE "player_id" = "player"."id" AND "channel_id" = "player"."channel_id"
+            ) + (
+                SELECT COUNT(*) FROM "clanspoilsclaim"
+                WHERE "player_id" = "player"."id" AND "channel_id" = "player"."channel_id"
+            )
+        FROM "player";"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "playerlifetimestats";"""